@@ -11,6 +11,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
+from truthcore import jsonio
+
 if TYPE_CHECKING:
     from pathlib import Path
 
@@ -34,6 +36,9 @@ class DeterministicAnomalyScorer:
     produce same outputs. No random sampling or probabilistic methods.
     """
 
+    # Top-level report keys the scorer reads; None means the whole report
+    HISTORY_FIELDS: tuple[str, ...] | None = None
+
     def __init__(self, history: list[dict[str, Any]]) -> None:
         """Initialize with historical data.
 
@@ -212,6 +217,8 @@ class DeterministicAnomalyScorer:
 class ReadinessAnomalyScorer(DeterministicAnomalyScorer):
     """Anomaly scorer for readiness data."""
 
+    HISTORY_FIELDS = ("passed", "summary")
+
     def score(self) -> dict[str, Any]:
         """Generate comprehensive anomaly scorecard."""
         scores = {
@@ -249,6 +256,8 @@ class ReadinessAnomalyScorer(DeterministicAnomalyScorer):
 class ReconciliationAnomalyScorer(DeterministicAnomalyScorer):
     """Anomaly scorer for reconciliation data."""
 
+    HISTORY_FIELDS = ("passed", "summary")
+
     def score(self) -> dict[str, Any]:
         """Generate reconciliation anomaly scorecard."""
         scores = {
@@ -270,6 +279,8 @@ class ReconciliationAnomalyScorer(DeterministicAnomalyScorer):
 class AgentBehaviorScorer(DeterministicAnomalyScorer):
     """Scorer for agent behavior trust analysis."""
 
+    HISTORY_FIELDS = ("passed", "metrics")
+
     def score(self) -> dict[str, Any]:
         """Generate agent trust scorecard."""
         scores = {
@@ -297,6 +308,8 @@ class AgentBehaviorScorer(DeterministicAnomalyScorer):
 class KnowledgeHealthScorer(DeterministicAnomalyScorer):
     """Scorer for knowledge base health."""
 
+    HISTORY_FIELDS = ("passed", "stats")
+
     def score(self) -> dict[str, Any]:
         """Generate knowledge health scorecard."""
         scores = {
@@ -331,8 +344,7 @@ class ScorecardWriter:
 
         # JSON
         json_path = self.output_dir / f"{prefix}_scorecard.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(scorecard, f, indent=2, sort_keys=True)
+        jsonio.dump_file(json_path, scorecard, sort_keys=True)
 
         # Markdown
         md_path = self.output_dir / f"{prefix}_scorecard.md"
@@ -3,13 +3,73 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from truthcore.manifest import hash_dict
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+# ioctl request number for FICLONE (Linux reflink on btrfs/XFS and friends)
+_FICLONE = 0x40049409
+
+
+def _try_reflink(src: str, dst: str) -> bool:
+    """Clone src into a new dst sharing extents copy-on-write, if supported."""
+    try:
+        with open(src, "rb") as fsrc, open(dst, "xb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except OSError:
+        try:
+            os.unlink(dst)
+        except FileNotFoundError:
+            pass
+        return False
+    return True
+
+
+def clone_tree(src: Path, dst: Path) -> None:
+    """Materialize a cached output directory at dst.
+
+    Each file is reflinked (copy-on-write clone) where the filesystem
+    supports it and copied with shutil.copyfile (in-kernel on Linux)
+    otherwise. Hard links are deliberately not used: later runs write into
+    the output directory in place, which would silently modify the cache
+    entry through a shared inode.
+
+    Args:
+        src: Cached directory to restore from
+        dst: Destination directory (created if missing)
+    """
+    use_reflink = fcntl is not None and sys.platform.startswith("linux")
+    stack = [(os.fspath(src), os.fspath(dst))]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        os.makedirs(dst_dir, exist_ok=True)
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    stack.append((entry.path, target))
+                    continue
+                if use_reflink:
+                    try:
+                        os.unlink(target)
+                    except FileNotFoundError:
+                        pass
+                    if _try_reflink(entry.path, target):
+                        continue
+                    # Unsupported here; it will fail for the rest of the tree too
+                    use_reflink = False
+                shutil.copyfile(entry.path, target)
+
 
 @dataclass
 class CacheEntry:
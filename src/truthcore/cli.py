@@ -2,40 +2,39 @@
 
 from __future__ import annotations
 
-import json
+import functools
+import heapq
+import io
+import os
+import shutil
 import sys
+import threading
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, TypeVar, cast
 
 import click
 
-from truthcore import __version__
-from truthcore.anomaly_scoring import (
-    AgentBehaviorScorer,
-    KnowledgeHealthScorer,
-    ReadinessAnomalyScorer,
-    ReconciliationAnomalyScorer,
-    ScorecardWriter,
-)
-from truthcore.cache import ContentAddressedCache
-from truthcore.impact import ChangeImpactEngine
-from truthcore.invariant_dsl import InvariantExplainer
+from truthcore import __version__, jsonio
+from truthcore.cache import ContentAddressedCache, clone_tree
 from truthcore.manifest import RunManifest, normalize_timestamp
-from truthcore.parquet_store import HistoryCompactor, ParquetStore
-from truthcore.replay import (
-    BundleExporter,
-    ReplayBundle,
-    ReplayEngine,
-    ReplayReporter,
-    SimulationChanges,
-    SimulationEngine,
-    SimulationReporter,
-)
-from truthcore.truth_graph import TruthGraph, TruthGraphBuilder
-from truthcore.ui_geometry import UIGeometryParser, UIReachabilityChecker
 from truthcore.verdict.cli import generate_verdict_for_judge, register_verdict_commands
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from truthcore.truth_graph import Node
+
+F = TypeVar("F", bound="Callable[..., Any]")
+
+# Shared parameter types, built once at import and reused by every command
+EXISTING_PATH = click.Path(exists=True, path_type=Path)
+ANY_PATH = click.Path(path_type=Path)
+MODE_CHOICE = click.Choice(["pr", "main", "release"])
+INTEL_MODE_CHOICE = click.Choice(['readiness', 'recon', 'agent', 'knowledge'])
+
 
 def register_spine_commands(cli: click.Group) -> None:
     """Register spine CLI commands."""
@@ -61,35 +60,181 @@ def handle_error(error: Exception, debug: bool) -> None:
     sys.exit(1)
 
 
+def _progress(ctx: click.Context, *lines: str) -> None:
+    """Print progress lines with a single write, unless --quiet was given."""
+    if not ctx.obj.get('quiet'):
+        click.echo("\n".join(lines))
+
+
+def common_io(*, inputs_required: bool = True, config: bool = True) -> Callable[[F], F]:
+    """Attach the shared --inputs/--out/--config options to a command.
+
+    Args:
+        inputs_required: Whether --inputs must be provided
+        config: Whether to add the --config option
+    """
+    def decorator(f: F) -> F:
+        if config:
+            f = click.option('--config', '-c', type=EXISTING_PATH)(f)
+        f = click.option('--out', '-o', required=True, type=ANY_PATH)(f)
+        f = click.option('--inputs', '-i', required=inputs_required, type=EXISTING_PATH, help='Input path')(f)
+        return f
+
+    return decorator
+
+
+def _iter_json_files(root: str) -> Iterator[tuple[str, os.stat_result]]:
+    """Yield (path, stat) for every *.json file under root.
+
+    Walks with os.scandir so each file's stat comes from the directory
+    entry rather than a separate Path.stat() call. Symlinked directories
+    are not followed, matching Path.rglob.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".json"):
+                        try:
+                            yield entry.path, entry.stat()
+                        except OSError:
+                            continue
+        except OSError:
+            continue
+
+
+def _recent_json_files(root: str, limit: int) -> list[str]:
+    """Return up to limit non-empty *.json files under root, newest first.
+
+    Keeps a bounded min-heap on modification time, so memory stays O(limit)
+    however large the history directory is.
+    """
+    heap: list[tuple[int, str]] = []
+    for path, st in _iter_json_files(root):
+        # Empty files can never parse, so they are not worth a slot
+        if st.st_size == 0:
+            continue
+        item = (st.st_mtime_ns, path)
+        if len(heap) < limit:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+    return [path for _, path in sorted(heap, reverse=True)]
+
+
+# Number of history files intel scores, and its default thread count
+_HISTORY_LIMIT = 50
+_MAX_HISTORY_JOBS = 16
+
+
+def _load_history_file(path: str, fields: tuple[str, ...] | None = None) -> Any | None:
+    """Parse one history file, returning None if it cannot be read.
+
+    When fields is given only those top-level keys are kept, and large
+    files are streamed so the rest of the report is never materialized.
+    """
+    try:
+        if fields is None:
+            return jsonio.load_file(path)
+        return jsonio.load_fields(path, fields)
+    except (OSError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def _load_plan(path: str, mtime_ns: int, size: int) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Return the included (engine_ids, rule_ids) from a run plan file.
+
+    mtime_ns and size are part of the cache key only, so an edited plan is
+    parsed again while repeated runs against the same file reuse the result.
+    """
+    plan_data = jsonio.load_file(path)
+    engines = tuple(e["engine_id"] for e in plan_data.get("engines", []) if e.get("include"))
+    invariants = tuple(i["rule_id"] for i in plan_data.get("invariants", []) if i.get("include"))
+    return engines, invariants
+
+
 # Cache context for CLI
 cache_context = {}
+_cache_lock = threading.Lock()
 
+# Commands that consult the group-level --cache-dir
+_CACHE_COMMANDS = frozenset({"judge"})
 
-def get_cache(cache_dir: Path | None, readonly: bool = False) -> ContentAddressedCache | None:
-    """Get or create cache instance."""
+
+def get_cache(
+    cache_dir: Path | None, readonly: bool = False, create: bool = True
+) -> ContentAddressedCache | None:
+    """Get or create cache instance.
+
+    Args:
+        cache_dir: Cache directory, or None when caching is disabled
+        readonly: Whether the caller will only read from the cache
+        create: Whether to create the directory if it does not exist yet
+
+    Returns:
+        The cache, or None if caching is disabled or there is no existing
+        cache directory to read (read-only use, or create=False). In that
+        case nothing is created on disk.
+    """
     if cache_dir is None:
         return None
 
-    cache_key = (str(cache_dir), readonly)
-    if cache_key not in cache_context:
-        cache_context[cache_key] = ContentAddressedCache(cache_dir)
+    # Interned so repeat lookups for the same directory share one key string
+    cache_key = (sys.intern(os.fspath(cache_dir)), readonly)
+    with _cache_lock:
+        if cache_key not in cache_context:
+            if (readonly or not create) and not cache_dir.is_dir():
+                return None
+            cache_context[cache_key] = ContentAddressedCache(cache_dir)
 
-    return cache_context[cache_key]
+        return cache_context[cache_key]
+
+
+def _prewarm_cache(cache_dir: Path, readonly: bool) -> None:
+    """Load an existing cache index ahead of first use.
+
+    Never creates the directory: the group callback also runs for
+    `judge --help` and for invocations that then fail option validation.
+    Failures are ignored here; the command's own get_cache() call retries
+    and reports them.
+    """
+    try:
+        get_cache(cache_dir, readonly, create=False)
+    except (OSError, ValueError):
+        pass
 
 
 @click.group()
 @click.version_option(version=__version__, prog_name="truthctl")
-@click.option('--cache-dir', type=click.Path(path_type=Path), help='Cache directory (default: .truthcache)')
+@click.option('--cache-dir', type=ANY_PATH, help='Cache directory (default: .truthcache)')
 @click.option('--no-cache', is_flag=True, help='Disable cache')
 @click.option('--cache-readonly', is_flag=True, help='Use cache but do not write new entries')
 @click.option('--debug', is_flag=True, help='Enable debug mode (show full tracebacks)')
+@click.option('--quiet', '-q', is_flag=True, help='Suppress progress messages (errors are still reported)')
 @click.pass_context
-def cli(ctx: click.Context, cache_dir: Path | None, no_cache: bool, cache_readonly: bool, debug: bool):
+def cli(
+    ctx: click.Context, cache_dir: Path | None, no_cache: bool, cache_readonly: bool, debug: bool, quiet: bool
+):
     """Truth Core CLI - Deterministic evidence-based verification."""
     ctx.ensure_object(dict)
     ctx.obj['cache_dir'] = None if no_cache else cache_dir
     ctx.obj['cache_readonly'] = cache_readonly
     ctx.obj['debug'] = debug
+    ctx.obj['quiet'] = quiet
+
+    # Load the cache index in the background so it overlaps with the
+    # command's own setup work (impact analysis, input hashing).
+    if ctx.obj['cache_dir'] is not None and ctx.invoked_subcommand in _CACHE_COMMANDS:
+        threading.Thread(
+            target=_prewarm_cache,
+            args=(ctx.obj['cache_dir'], cache_readonly),
+            name="truthcore-cache-prewarm",
+            daemon=True,
+        ).start()
 
 
 # Register verdict commands
@@ -100,19 +245,17 @@ register_spine_commands(cli)
 
 
 @cli.command()
-@click.option('--inputs', '-i', type=click.Path(exists=True, path_type=Path), help='Input directory')
+@common_io(inputs_required=False)
 @click.option('--profile', '-p', default='base')
-@click.option('--out', '-o', required=True, type=click.Path(path_type=Path))
-@click.option('--config', '-c', type=click.Path(exists=True, path_type=Path))
 @click.option('--strict/--no-strict', default=None)
 @click.option('--parallel/--sequential', default=True, help='Run engines in parallel')
-@click.option('--diff', '-d', type=click.Path(exists=True, path_type=Path), help='Git diff file for impact analysis')
+@click.option('--diff', '-d', type=EXISTING_PATH, help='Git diff file for impact analysis')
 @click.option(
     '--changed-files',
-    type=click.Path(exists=True, path_type=Path),
+    type=EXISTING_PATH,
     help='Changed files list (newline or JSON)',
 )
-@click.option('--plan-out', type=click.Path(path_type=Path), help='Output path for run_plan.json')
+@click.option('--plan-out', type=ANY_PATH, help='Output path for run_plan.json')
 @click.option('--policy-pack', type=str, help='Policy pack to run (built-in name or path)')
 @click.option('--sign/--no-sign', default=False, help='Sign the evidence bundle (requires signing keys)')
 @click.option('--manifest/--no-manifest', default=True, help='Generate evidence manifest')
@@ -148,25 +291,26 @@ def judge(
     debug = ctx.obj.get('debug', False)
 
     try:
-        # Setup cache
-        cache = get_cache(ctx.obj.get('cache_dir'), ctx.obj.get('cache_readonly', False))
-
         run_plan_path = plan_out
+        engines_to_run = None
+        invariants_to_run = None
 
         # If diff or changed-files provided, run impact analysis
         if diff or changed_files:
-            click.echo("Running change impact analysis...")
+            _progress(ctx, "Running change impact analysis...")
+            report: list[str] = []
+            from truthcore.impact import ChangeImpactEngine
             engine = ChangeImpactEngine()
 
             diff_text = None
             if diff:
                 diff_text = engine.load_diff_from_file(diff)
-                click.echo(f"  Loaded diff from: {diff}")
+                report.append(f"  Loaded diff from: {diff}")
 
             changed_files_list = None
             if changed_files:
                 changed_files_list = engine.load_changed_files_from_file(changed_files)
-                click.echo(f"  Loaded {len(changed_files_list)} changed files from: {changed_files}")
+                report.append(f"  Loaded {len(changed_files_list)} changed files from: {changed_files}")
 
             # Generate run plan
             plan = engine.analyze(
@@ -180,17 +324,18 @@ def judge(
             if not run_plan_path:
                 run_plan_path = out / "run_plan.json"
             plan.write(run_plan_path)
-            click.echo(f"  Run plan written to: {run_plan_path}")
 
             # Show summary
-            selected_engines = [e.engine_id for e in plan.engines if e.include]
-            selected_invariants = [i.rule_id for i in plan.invariants if i.include]
-            click.echo(f"  Selected engines: {', '.join(selected_engines) or 'none'}")
-            click.echo(f"  Selected invariants: {', '.join(selected_invariants) or 'none'}")
+            selected_engines, selected_invariants = plan.selected_ids()
+            report += [
+                f"  Run plan written to: {run_plan_path}",
+                f"  Selected engines: {', '.join(selected_engines) or 'none'}",
+                f"  Selected invariants: {', '.join(selected_invariants) or 'none'}",
+            ]
 
             # Check if any engines selected
             if not selected_engines:
-                click.echo("No engines selected for execution based on changes.")
+                report.append("No engines selected for execution based on changes.")
                 # Write minimal manifest
                 manifest_obj = RunManifest.create(
                     command="judge",
@@ -201,18 +346,22 @@ def judge(
                 manifest_obj.duration_ms = int((time.time() - start_time) * 1000)
                 manifest_obj.metadata["run_plan"] = str(run_plan_path)
                 manifest_obj.write(out)
-                click.echo(f"Results written to {out}")
+                report.append(f"Results written to {out}")
+                _progress(ctx, *report)
                 return
 
-        # Load run plan if provided
-        engines_to_run = None
-        invariants_to_run = None
-        if run_plan_path and run_plan_path.exists():
-            with open(run_plan_path, encoding="utf-8") as f:
-                plan_data = json.load(f)
-            engines_to_run = [e["engine_id"] for e in plan_data.get("engines", []) if e.get("include")]
-            invariants_to_run = [i["rule_id"] for i in plan_data.get("invariants", []) if i.get("include")]
-            click.echo(f"Executing based on run plan: {run_plan_path}")
+            # Reuse the in-memory plan rather than re-reading what was just written
+            engines_to_run = selected_engines
+            invariants_to_run = selected_invariants
+            report.append(f"Executing based on run plan: {run_plan_path}")
+            _progress(ctx, *report)
+        elif run_plan_path and run_plan_path.exists():
+            # Load a previously generated run plan (parsed once per file version)
+            st = run_plan_path.stat()
+            engines, invariants = _load_plan(str(run_plan_path), st.st_mtime_ns, st.st_size)
+            engines_to_run = list(engines)
+            invariants_to_run = list(invariants)
+            _progress(ctx, f"Executing based on run plan: {run_plan_path}")
 
         # Create manifest
         run_manifest = RunManifest.create(
@@ -228,19 +377,21 @@ def judge(
             profile=profile,
         )
 
-        # Check cache
-        cache_key = run_manifest.compute_cache_key()
-        cache_path = cache.get(cache_key) if cache else None
+        # Setup cache; fetched here, after input hashing, so a background
+        # prewarm started by the group callback has had time to finish
+        cache = get_cache(ctx.obj.get('cache_dir'), ctx.obj.get('cache_readonly', False))
+
+        # Check cache (the key is only needed when a cache is configured)
+        cache_key = run_manifest.compute_cache_key() if cache else None
+        cache_path = cache.get(cache_key) if cache and cache_key else None
 
         if cache_path:
-            click.echo("Cache hit: reusing previous results")
             run_manifest.cache_hit = True
             run_manifest.cache_key = cache_key
             run_manifest.cache_path = str(cache_path)
 
-            # Copy cached outputs
-            import shutil
-            shutil.copytree(cache_path, out, dirs_exist_ok=True)
+            # Restore cached outputs (reflinked where the filesystem allows)
+            clone_tree(cache_path, out)
 
             # Update manifest with cache info
             run_manifest.duration_ms = int((time.time() - start_time) * 1000)
@@ -248,43 +399,43 @@ def judge(
                 run_manifest.metadata["run_plan"] = str(run_plan_path)
             run_manifest.write(out)
 
-            click.echo(f"Results written to {out} (from cache)")
+            _progress(ctx, "Cache hit: reusing previous results", f"Results written to {out} (from cache)")
             return
 
         # Run the actual check
-        click.echo(f"Running readiness check with profile '{profile}'...")
+        _progress(ctx, f"Running readiness check with profile '{profile}'...")
 
         # TODO: Integrate with actual readiness engine
         # For now, create sample output
         out.mkdir(parents=True, exist_ok=True)
 
+        # Engine outputs, written together once all are computed
+        outputs: dict[str, Any] = {}
+
         # Check for UI geometry facts
         ui_facts = inputs / "ui_facts.json" if inputs else None
         if ui_facts and ui_facts.exists():
-            click.echo("UI geometry facts detected, running reachability checks...")
+            _progress(ctx, "UI geometry facts detected, running reachability checks...")
+            from truthcore.ui_geometry import UIGeometryParser, UIReachabilityChecker
             parser = UIGeometryParser(ui_facts)
             checker = UIReachabilityChecker(parser)
 
-            ui_results = checker.run_all_checks()
+            outputs["ui_geometry.json"] = checker.run_all_checks()
 
-            with open(out / "ui_geometry.json", "w") as f:
-                json.dump(ui_results, f, indent=2)
-
-        # Create readiness output
-        readiness_data = {
-            "version": __version__,
+        # Create readiness output (keys in canonical sorted order)
+        outputs["readiness.json"] = {
+            "findings": [],
+            "passed": True,
             "profile": profile,
             "timestamp": normalize_timestamp(),
-            "passed": True,
-            "findings": [],
+            "version": __version__,
         }
 
-        with open(out / "readiness.json", "w") as f:
-            json.dump(readiness_data, f, indent=2, sort_keys=True)
+        jsonio.dump_files(out, outputs)
 
         # Run policy pack if specified
         if policy_pack:
-            click.echo(f"Running policy pack: {policy_pack}...")
+            _progress(ctx, f"Running policy pack: {policy_pack}...")
             from truthcore.policy.engine import PolicyEngine, PolicyPackLoader
 
             pack = PolicyPackLoader.load_pack(policy_pack)
@@ -300,16 +451,21 @@ def judge(
             evidence_packet.to_json(evidence_json_path)
             evidence_packet.to_markdown_file(evidence_md_path)
 
-            click.echo(f"  Policy findings: {len(policy_result.findings)}")
-            click.echo(f"  Decision: {evidence_packet.decision.upper()}")
+            report = [
+                f"  Policy findings: {len(policy_result.findings)}",
+                f"  Decision: {evidence_packet.decision.upper()}",
+            ]
             if policy_result.has_blocking():
-                click.echo("  ⚠️  Blocking policy violations detected!")
-            click.echo(f"  Evidence packet: {evidence_json_path}")
-            click.echo(f"  Evidence summary: {evidence_md_path}")
+                report.append("  ⚠️  Blocking policy violations detected!")
+            report += [
+                f"  Evidence packet: {evidence_json_path}",
+                f"  Evidence summary: {evidence_md_path}",
+            ]
+            _progress(ctx, *report)
 
         # Generate evidence manifest
         if manifest:
-            click.echo("Generating evidence manifest...")
+            _progress(ctx, "Generating evidence manifest...")
             from truthcore.provenance.manifest import EvidenceManifest
             from truthcore.security import SecurityLimits
 
@@ -320,7 +476,7 @@ def judge(
                 limits=SecurityLimits(),
             )
             evidence_manifest.write_json(out / "evidence.manifest.json")
-            click.echo(f"  Manifest: {out / 'evidence.manifest.json'}")
+            report = [f"  Manifest: {out / 'evidence.manifest.json'}"]
 
             # Sign if requested
             if sign:
@@ -331,7 +487,7 @@ def judge(
                     try:
                         manifest_path = out / "evidence.manifest.json"
                         signer.sign_file(manifest_path, out / "evidence.sig")
-                        click.echo(f"  Signature: {out / 'evidence.sig'}")
+                        report.append(f"  Signature: {out / 'evidence.sig'}")
                     except SigningError as e:
                         click.echo(f"  Warning: Signing failed: {e}", err=True)
                 else:
@@ -340,6 +496,7 @@ def judge(
                         "Set TRUTHCORE_SIGNING_PRIVATE_KEY env var.",
                         err=True,
                     )
+            _progress(ctx, *report)
 
         # Write manifest
         run_manifest.duration_ms = int((time.time() - start_time) * 1000)
@@ -348,29 +505,28 @@ def judge(
         run_manifest.write(out)
 
         # Cache results
-        if cache and not ctx.obj.get('cache_readonly'):
+        if cache and cache_key and not ctx.obj.get('cache_readonly'):
             cache.put(cache_key, out, run_manifest.to_dict())
 
         # Generate verdict
-        click.echo("Generating verdict...")
+        _progress(ctx, "Generating verdict...")
         verdict_path = generate_verdict_for_judge(
             inputs_dir=inputs or Path("."),
             output_dir=out,
             mode="pr",
             profile=profile,
         )
+        report = []
         if verdict_path:
-            click.echo(f"  Verdict: {verdict_path}")
-
-        click.echo(f"Results written to {out}")
+            report.append(f"  Verdict: {verdict_path}")
+        report.append(f"Results written to {out}")
+        _progress(ctx, *report)
     except Exception as e:
         handle_error(e, debug)
 
 
 @cli.command()
-@click.option('--inputs', '-i', required=True, type=click.Path(exists=True, path_type=Path))
-@click.option('--out', '-o', required=True, type=click.Path(path_type=Path))
-@click.option('--config', '-c', type=click.Path(exists=True, path_type=Path))
+@common_io()
 @click.pass_context
 def recon(ctx: click.Context, inputs: Path, out: Path, config: Path | None):
     """Run reconciliation with anomaly detection."""
@@ -382,18 +538,17 @@ def recon(ctx: click.Context, inputs: Path, out: Path, config: Path | None):
 
         # TODO: Run reconciliation engine
         recon_data = {
-            "version": __version__,
-            "timestamp": normalize_timestamp(),
             "summary": {
+                "balance_check": True,
+                "matched_count": 10,
                 "total_left": 10,
                 "total_right": 10,
-                "matched_count": 10,
-                "balance_check": True,
             },
+            "timestamp": normalize_timestamp(),
+            "version": __version__,
         }
 
-        with open(out / "recon_run.json", "w") as f:
-            json.dump(recon_data, f, indent=2, sort_keys=True)
+        jsonio.dump_file(out / "recon_run.json", recon_data)
 
         # Write manifest
         manifest = RunManifest.create(
@@ -404,15 +559,14 @@ def recon(ctx: click.Context, inputs: Path, out: Path, config: Path | None):
         manifest.duration_ms = int((time.time() - start_time) * 1000)
         manifest.write(out)
 
-        click.echo(f"Reconciliation results written to {out}")
+        _progress(ctx, f"Reconciliation results written to {out}")
     except Exception as e:
         handle_error(e, debug)
 
 
 @cli.command()
-@click.option('--inputs', '-i', required=True, type=click.Path(exists=True, path_type=Path))
-@click.option('--fsm', '-f', required=True, type=click.Path(exists=True, path_type=Path))
-@click.option('--out', '-o', required=True, type=click.Path(path_type=Path))
+@common_io(config=False)
+@click.option('--fsm', '-f', required=True, type=EXISTING_PATH)
 @click.pass_context
 def trace(ctx: click.Context, inputs: Path, fsm: Path, out: Path):
     """Run trace analysis with FSM validation."""
@@ -424,17 +578,16 @@ def trace(ctx: click.Context, inputs: Path, fsm: Path, out: Path):
 
         # TODO: Run trace engine
         trace_data = {
-            "version": __version__,
-            "trace_id": "test-123",
-            "valid": True,
             "metrics": {
-                "tool_success_rate": 0.95,
                 "avg_latency_ms": 1500,
+                "tool_success_rate": 0.95,
             },
+            "trace_id": "test-123",
+            "valid": True,
+            "version": __version__,
         }
 
-        with open(out / "trace_report.json", "w") as f:
-            json.dump(trace_data, f, indent=2, sort_keys=True)
+        jsonio.dump_file(out / "trace_report.json", trace_data)
 
         # Write manifest
         manifest = RunManifest.create(
@@ -445,14 +598,13 @@ def trace(ctx: click.Context, inputs: Path, fsm: Path, out: Path):
         manifest.duration_ms = int((time.time() - start_time) * 1000)
         manifest.write(out)
 
-        click.echo(f"Trace analysis written to {out}")
+        _progress(ctx, f"Trace analysis written to {out}")
     except Exception as e:
         handle_error(e, debug)
 
 
 @cli.command()
-@click.option('--inputs', '-i', required=True, type=click.Path(exists=True, path_type=Path))
-@click.option('--out', '-o', required=True, type=click.Path(path_type=Path))
+@common_io(config=False)
 @click.option('--parquet/--no-parquet', default=False, help='Write to Parquet history store')
 @click.pass_context
 def index(ctx: click.Context, inputs: Path, out: Path, parquet: bool):
@@ -465,19 +617,19 @@ def index(ctx: click.Context, inputs: Path, out: Path, parquet: bool):
 
         # TODO: Run knowledge engine
         kb_data = {
-            "version": __version__,
             "index_id": "kb-001",
             "stats": {
-                "total": 42,
                 "stale_count": 3,
+                "total": 42,
             },
+            "version": __version__,
         }
 
-        with open(out / "kb_index.json", "w") as f:
-            json.dump(kb_data, f, indent=2, sort_keys=True)
+        jsonio.dump_file(out / "kb_index.json", kb_data)
 
         # Write to Parquet if requested
         if parquet:
+            from truthcore.parquet_store import ParquetStore
             store = ParquetStore(out / "parquet_history")
             if store.available:
                 store.write_findings([], "kb-001", normalize_timestamp())
@@ -494,19 +646,24 @@ def index(ctx: click.Context, inputs: Path, out: Path, parquet: bool):
         manifest.duration_ms = int((time.time() - start_time) * 1000)
         manifest.write(out)
 
-        click.echo(f"Knowledge index written to {out}")
+        _progress(ctx, f"Knowledge index written to {out}")
     except Exception as e:
         handle_error(e, debug)
 
 
 @cli.command()
-@click.option('--inputs', '-i', required=True, type=click.Path(exists=True, path_type=Path))
-@click.option('--mode', '-m', required=True, type=click.Choice(['readiness', 'recon', 'agent', 'knowledge']))
-@click.option('--out', '-o', required=True, type=click.Path(path_type=Path))
+@common_io(config=False)
+@click.option('--mode', '-m', required=True, type=INTEL_MODE_CHOICE)
 @click.option('--compact', is_flag=True, help='Compact history store')
 @click.option('--retention', type=int, default=90, help='Retention period in days for compaction')
+@click.option(
+    '--jobs', '-j', type=click.IntRange(min=1), default=None,
+    help=f'Worker threads for loading history (default: up to {_MAX_HISTORY_JOBS})',
+)
 @click.pass_context
-def intel(ctx: click.Context, inputs: Path, mode: str, out: Path, compact: bool, retention: int):
+def intel(
+    ctx: click.Context, inputs: Path, mode: str, out: Path, compact: bool, retention: int, jobs: int | None
+):
     """Run intelligence analysis with anomaly scoring."""
     start_time = time.time()
     debug = ctx.obj.get('debug', False)
@@ -514,43 +671,49 @@ def intel(ctx: click.Context, inputs: Path, mode: str, out: Path, compact: bool,
     try:
         out.mkdir(parents=True, exist_ok=True)
 
-        # Load historical data
-        historical_files = list(inputs.rglob("*.json"))
-        history = []
-        for f in historical_files[:50]:  # Limit to recent 50
-            try:
-                with open(f) as fp:
-                    history.append(json.load(fp))
-            except Exception:
-                pass
+        from truthcore.anomaly_scoring import (
+            AgentBehaviorScorer,
+            KnowledgeHealthScorer,
+            ReadinessAnomalyScorer,
+            ReconciliationAnomalyScorer,
+            ScorecardWriter,
+        )
+
+        scorer_cls = {
+            "readiness": ReadinessAnomalyScorer,
+            "recon": ReconciliationAnomalyScorer,
+            "agent": AgentBehaviorScorer,
+            "knowledge": KnowledgeHealthScorer,
+        }[mode]
+
+        # Load historical data (limit to the 50 most recently modified files),
+        # keeping only the report fields the scorer reads
+        history_files = _recent_json_files(str(inputs), _HISTORY_LIMIT)
+        load = functools.partial(_load_history_file, fields=scorer_cls.HISTORY_FIELDS)
+        # History loading is I/O bound, so threads overlap the reads
+        workers = min(jobs or _MAX_HISTORY_JOBS, len(history_files))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                loaded = list(executor.map(load, history_files))
+        else:
+            loaded = [load(path) for path in history_files]
+        history = [entry for entry in loaded if entry is not None]
 
         # Run compaction if requested
         if compact:
+            from truthcore.parquet_store import HistoryCompactor, ParquetStore
             store = ParquetStore(inputs / "parquet_history")
             compactor = HistoryCompactor(store)
             stats = compactor.compact(dry_run=False)
             click.echo(f"Compaction complete: {stats}")
 
         # Generate scorecard based on mode
-        if mode == "readiness":
-            scorer = ReadinessAnomalyScorer(history)
-        elif mode == "recon":
-            scorer = ReconciliationAnomalyScorer(history)
-        elif mode == "agent":
-            scorer = AgentBehaviorScorer(history)
-        else:  # knowledge
-            scorer = KnowledgeHealthScorer(history)
-
-        scorecard = scorer.score()
+        scorecard = scorer_cls(history).score()
 
         # Write scorecard
         writer = ScorecardWriter(out)
         json_path, md_path = writer.write(scorecard, f"{mode}_intel")
 
-        click.echo(f"Scorecard written to {out}")
-        click.echo(f"  JSON: {json_path}")
-        click.echo(f"  Markdown: {md_path}")
-
         # Write manifest
         manifest = RunManifest.create(
             command="intel",
@@ -559,29 +722,28 @@ def intel(ctx: click.Context, inputs: Path, mode: str, out: Path, compact: bool,
         )
         manifest.duration_ms = int((time.time() - start_time) * 1000)
         manifest.write(out)
+
+        _progress(ctx, f"Scorecard written to {out}", f"  JSON: {json_path}", f"  Markdown: {md_path}")
     except Exception as e:
         handle_error(e, debug)
 
 
 @cli.command()
 @click.option('--rule', '-r', required=True, help='Rule ID to explain')
-@click.option('--data', '-d', required=True, type=click.Path(exists=True, path_type=Path))
-@click.option('--rules', required=True, type=click.Path(exists=True, path_type=Path))
+@click.option('--data', '-d', required=True, type=EXISTING_PATH)
+@click.option('--rules', required=True, type=EXISTING_PATH)
 @click.pass_context
 def explain(ctx: click.Context, rule: str, data: Path, rules: Path):
     """Explain an invariant rule evaluation."""
     debug = ctx.obj.get('debug', False)
 
     try:
-        # Load data
-        with open(data) as f:
-            data_dict = json.load(f)
-
-        # Load rules
-        with open(rules) as f:
-            rules_list = json.load(f)
+        # Load data and rules (memory-mapped, as rule packs can be large)
+        data_dict = jsonio.load_mapped(data)
+        rules_list = jsonio.load_mapped(rules)
 
         # Create explainer
+        from truthcore.invariant_dsl import InvariantExplainer
         explainer = InvariantExplainer(rules_list, data_dict)
         explanation = explainer.explain_rule(rule)
 
@@ -591,10 +753,10 @@ def explain(ctx: click.Context, rule: str, data: Path, rules: Path):
 
 
 @cli.command()
-@click.option('--diff', '-d', type=click.Path(exists=True, path_type=Path), help='Git diff file')
-@click.option('--changed-files', type=click.Path(exists=True, path_type=Path), help='Changed files list')
+@click.option('--diff', '-d', type=EXISTING_PATH, help='Git diff file')
+@click.option('--changed-files', type=EXISTING_PATH, help='Changed files list')
 @click.option('--profile', '-p', default='base', help='Execution profile')
-@click.option('--out', '-o', required=True, type=click.Path(path_type=Path), help='Output path for run_plan.json')
+@click.option('--out', '-o', required=True, type=ANY_PATH, help='Output path for run_plan.json')
 @click.option('--source', '-s', help='Source identifier for the analysis')
 @click.pass_context
 def plan(
@@ -617,6 +779,7 @@ def plan(
             click.echo("Error: Must provide either --diff or --changed-files", err=True)
             sys.exit(1)
 
+        from truthcore.impact import ChangeImpactEngine
         engine = ChangeImpactEngine()
 
         diff_text = None
@@ -640,25 +803,28 @@ def plan(
         # Write run plan
         run_plan.write(out)
 
-        # Show summary
-        click.echo(f"\nRun plan written to: {out}")
-        click.echo(f"Cache key: {run_plan.cache_key}")
-        click.echo("\nImpact Summary:")
-        click.echo(f"  Total changes: {run_plan.impact_summary['total_changes']}")
-        click.echo(f"  Max impact: {run_plan.impact_summary['max_impact']}")
-
+        # Show summary (collected and emitted with a single write)
         selected_engines = [e for e in run_plan.engines if e.include]
 
-        click.echo(f"\nSelected Engines ({len(selected_engines)}):")
+        lines = [
+            f"\nRun plan written to: {out}",
+            f"Cache key: {run_plan.cache_key}",
+            "\nImpact Summary:",
+            f"  Total changes: {run_plan.impact_summary['total_changes']}",
+            f"  Max impact: {run_plan.impact_summary['max_impact']}",
+            f"\nSelected Engines ({len(selected_engines)}):",
+        ]
         for eng in selected_engines:
-            click.echo(f"  [+] {eng.engine_id} (priority: {eng.priority}) - {eng.reason}")
+            lines.append(f"  [+] {eng.engine_id} (priority: {eng.priority}) - {eng.reason}")
 
         if run_plan.exclusions:
-            click.echo(f"\nExclusions ({len(run_plan.exclusions)}):")
+            lines.append(f"\nExclusions ({len(run_plan.exclusions)}):")
             for ex in run_plan.exclusions[:5]:  # Show first 5
-                click.echo(f"  [-] {ex['type']}: {ex['id']} - {ex['reason']}")
+                lines.append(f"  [-] {ex['type']}: {ex['id']} - {ex['reason']}")
             if len(run_plan.exclusions) > 5:
-                click.echo(f"  ... and {len(run_plan.exclusions) - 5} more")
+                lines.append(f"  ... and {len(run_plan.exclusions) - 5} more")
+
+        click.echo("\n".join(lines))
     except Exception as e:
         handle_error(e, debug)
 
@@ -666,11 +832,11 @@ def plan(
 @cli.command(name="graph")
 @click.option(
     '--run-dir', '-r', required=True,
-    type=click.Path(exists=True, path_type=Path),
+    type=EXISTING_PATH,
     help='Run output directory containing run_manifest.json',
 )
-@click.option('--plan', type=click.Path(exists=True, path_type=Path), help='Run plan JSON (optional)')
-@click.option('--out', '-o', required=True, type=click.Path(path_type=Path), help='Output directory for truth graph')
+@click.option('--plan', type=EXISTING_PATH, help='Run plan JSON (optional)')
+@click.option('--out', '-o', required=True, type=ANY_PATH, help='Output directory for truth graph')
 @click.option('--format', type=click.Choice(['json', 'parquet', 'both']), default='json', help='Output format')
 @click.pass_context
 def graph_build(ctx: click.Context, run_dir: Path, plan: Path | None, out: Path, format: str):
@@ -684,6 +850,7 @@ def graph_build(ctx: click.Context, run_dir: Path, plan: Path | None, out: Path,
         out.mkdir(parents=True, exist_ok=True)
 
         # Build graph
+        from truthcore.truth_graph import TruthGraphBuilder
         builder = TruthGraphBuilder()
         truth_graph = builder.build_from_run_directory(run_dir, plan)
 
@@ -703,10 +870,12 @@ def graph_build(ctx: click.Context, run_dir: Path, plan: Path | None, out: Path,
                 click.echo(f"Warning: Could not export to Parquet: {e}", err=True)
 
         # Show stats
-        stats = truth_graph.to_dict()['stats']
-        click.echo("\nGraph Statistics:")
-        click.echo(f"  Nodes: {stats['node_count']}")
-        click.echo(f"  Edges: {stats['edge_count']}")
+        stats = truth_graph.stats()
+        click.echo(
+            "\nGraph Statistics:\n"
+            f"  Nodes: {stats['node_count']}\n"
+            f"  Edges: {stats['edge_count']}"
+        )
     except Exception as e:
         handle_error(e, debug)
 
@@ -714,14 +883,14 @@ def graph_build(ctx: click.Context, run_dir: Path, plan: Path | None, out: Path,
 @cli.command(name="graph-query")
 @click.option(
     '--graph', '-g', required=True,
-    type=click.Path(exists=True, path_type=Path),
+    type=EXISTING_PATH,
     help='Truth graph JSON file',
 )
 @click.option(
     '--where', '-w', required=True,
     help='Query predicate (e.g., "severity=high")',
 )
-@click.option('--out', '-o', type=click.Path(path_type=Path), help='Output file for results')
+@click.option('--out', '-o', type=ANY_PATH, help='Output file for results')
 @click.pass_context
 def graph_query(ctx: click.Context, graph: Path, where: str, out: Path | None):
     """Query a Truth Graph using simple predicates.
@@ -740,37 +909,44 @@ def graph_query(ctx: click.Context, graph: Path, where: str, out: Path | None):
 
     try:
         # Load graph
+        from truthcore.truth_graph import TruthGraph
         truth_graph = TruthGraph.from_json(graph)
 
         # Execute query
         results = truth_graph.query_simple(where)
 
-        # Prepare output
-        output_data = {
-            "query": where,
-            "graph": str(graph),
-            "result_count": len(results),
-            "results": [n.to_dict() for n in results],
-        }
-
-        # Output results
+        # Output results, encoding matched nodes one at a time
         if out:
             out.parent.mkdir(parents=True, exist_ok=True)
-            with open(out, "w", encoding="utf-8") as f:
-                json.dump(output_data, f, indent=2)
+            with open(out, "wb", buffering=jsonio.STREAM_BUFFER_SIZE) as f:
+                _write_query_results(f, where, graph, results)
             click.echo(f"Query results written to: {out}")
         else:
-            click.echo(json.dumps(output_data, indent=2))
+            sys.stdout.flush()  # keep earlier text output ahead of the raw bytes
+            stdout = sys.stdout.buffer
+            _write_query_results(stdout, where, graph, results)
+            stdout.write(b"\n")
+            stdout.flush()
 
         click.echo(f"\nFound {len(results)} matching nodes")
     except Exception as e:
         handle_error(e, debug)
 
 
+def _write_query_results(f: BinaryIO, where: str, graph: Path, results: list[Node]) -> None:
+    """Write graph-query output, streaming the matched nodes."""
+    f.write(b'{\n  "query": ' + jsonio.dumps(where))
+    f.write(b',\n  "graph": ' + jsonio.dumps(str(graph)))
+    f.write(b',\n  "result_count": ' + jsonio.dumps(len(results)))
+    f.write(b',\n  "results": ')
+    jsonio.write_array(f, (n.to_dict() for n in results), level=1)
+    f.write(b"\n}")
+
+
 @cli.command()
 @click.option(
     '--inputs', '-i', required=True,
-    type=click.Path(exists=True, path_type=Path),
+    type=EXISTING_PATH,
     help='Input directory to scan',
 )
 @click.option(
@@ -778,8 +954,8 @@ def graph_query(ctx: click.Context, graph: Path, where: str, out: Path | None):
     help='Policy pack name (built-in: base, security, privacy, '
          'logging, agent) or path to YAML file',
 )
-@click.option('--out', '-o', required=True, type=click.Path(path_type=Path), help='Output directory')
-@click.option('--config', '-c', type=click.Path(exists=True, path_type=Path), help='Policy configuration file')
+@click.option('--out', '-o', required=True, type=ANY_PATH, help='Output directory')
+@click.option('--config', '-c', type=EXISTING_PATH, help='Policy configuration file')
 @click.option('--compat', is_flag=True, help='Enable backward compatibility mode (legacy formats, relaxed validation)')
 @click.pass_context
 def policy_run(ctx: click.Context, inputs: Path, pack: str, out: Path, config: Path | None, compat: bool):
@@ -792,8 +968,6 @@ def policy_run(ctx: click.Context, inputs: Path, pack: str, out: Path, config: P
       truthctl policy run --inputs ./src --pack security --out ./security-report
       truthctl policy run --inputs ./src --pack /path/to/custom-policy.yaml --out ./results
     """
-    import time
-
     from truthcore.policy.engine import PolicyEngine, PolicyPackLoader
     from truthcore.policy.validator import PolicyValidator
 
@@ -872,8 +1046,8 @@ def policy_explain(ctx: click.Context, rule: str, pack: str):
 
         if not policy_rule:
             click.echo(f"Rule not found: {rule}", err=True)
-            available = [r.id for r in policy_pack.get_enabled_rules()]
-            click.echo(f"Available rules: {', '.join(available)}", err=True)
+            available = ", ".join(r.id for r in policy_pack.rules if r.enabled)
+            click.echo(f"Available rules: {available}", err=True)
             sys.exit(1)
 
         explanation = PolicyEngine.explain_rule(policy_rule)
@@ -882,20 +1056,46 @@ def policy_explain(ctx: click.Context, rule: str, pack: str):
         handle_error(e, debug)
 
 
+@functools.lru_cache(maxsize=8)
+def _signer_public_key(private_b64: str | None, public_b64: str | None) -> bytes | None:
+    """Public key of a Signer configured from the environment.
+
+    The arguments are the signing environment variables and serve only as
+    the cache key (Signer reads them itself), so each distinct value is
+    decoded once per process.
+    """
+    from truthcore.provenance.signing import Signer
+
+    return Signer()._public_key
+
+
+def _env_public_key() -> bytes | None:
+    """Public key from TRUTHCORE_SIGNING_PUBLIC_KEY (or derived from the private key)."""
+    return _signer_public_key(
+        os.environ.get("TRUTHCORE_SIGNING_PRIVATE_KEY"), os.environ.get("TRUTHCORE_SIGNING_PUBLIC_KEY")
+    )
+
+
 @cli.command()
 @click.option(
     '--bundle', '-b', required=True,
-    type=click.Path(exists=True, path_type=Path),
+    type=EXISTING_PATH,
     help='Bundle directory to verify',
 )
 @click.option(
     '--public-key', '-k',
-    type=click.Path(exists=True, path_type=Path),
+    type=EXISTING_PATH,
     help='Public key file for signature verification (optional)',
 )
-@click.option('--out', '-o', type=click.Path(path_type=Path), help='Output directory for verification reports')
+@click.option('--out', '-o', type=ANY_PATH, help='Output directory for verification reports')
+@click.option(
+    '--jobs', '-j', type=click.IntRange(min=1), default=None,
+    help='Worker threads for hashing bundle files (default: CPU count)',
+)
 @click.pass_context
-def verify_bundle(ctx: click.Context, bundle: Path, public_key: Path | None, out: Path | None):
+def verify_bundle(
+    ctx: click.Context, bundle: Path, public_key: Path | None, out: Path | None, jobs: int | None
+):
     """Verify an evidence bundle for tampering.
 
     Recomputes file hashes and compares against manifest.
@@ -906,7 +1106,6 @@ def verify_bundle(ctx: click.Context, bundle: Path, public_key: Path | None, out
       truthctl verify-bundle --bundle ./results --public-key ./public.key
       truthctl verify-bundle --bundle ./results --out ./verification-report
     """
-    from truthcore.provenance.signing import Signer
     from truthcore.provenance.verifier import BundleVerifier
 
     debug = ctx.obj.get('debug', False)
@@ -922,13 +1121,12 @@ def verify_bundle(ctx: click.Context, bundle: Path, public_key: Path | None, out
             click.echo(f"Using public key: {public_key}")
         else:
             # Try to load from environment
-            signer = Signer()
-            if signer._public_key:
-                pub_key = signer._public_key
+            pub_key = _env_public_key()
+            if pub_key:
                 click.echo("Using public key from TRUTHCORE_SIGNING_PUBLIC_KEY environment variable")
 
         # Verify
-        verifier = BundleVerifier(public_key=pub_key)
+        verifier = BundleVerifier(public_key=pub_key, max_workers=jobs)
 
         if out:
             result, paths = verifier.verify_and_report(bundle, out)
@@ -938,26 +1136,28 @@ def verify_bundle(ctx: click.Context, bundle: Path, public_key: Path | None, out
         else:
             result = verifier.verify(bundle)
 
-        # Print summary
-        click.echo(f"\nVerification Result: {'✅ VALID' if result.valid else '❌ INVALID'}")
-        click.echo(f"  Files checked: {result.files_checked}")
-        click.echo(f"  Files valid: {result.files_valid}")
+        # Print summary, written in one go
+        report = [
+            f"\nVerification Result: {'✅ VALID' if result.valid else '❌ INVALID'}",
+            f"  Files checked: {result.files_checked}",
+            f"  Files valid: {result.files_valid}",
+        ]
 
         if result.files_tampered:
-            click.echo(f"  ⚠️  Files tampered: {len(result.files_tampered)}")
-            for item in result.files_tampered:
-                click.echo(f"    - {item['path']}")
+            report.append(f"  ⚠️  Files tampered: {len(result.files_tampered)}")
+            report.extend(f"    - {item['path']}" for item in result.files_tampered)
 
         if result.files_missing:
-            click.echo(f"  ⚠️  Files missing: {len(result.files_missing)}")
-            for path in result.files_missing:
-                click.echo(f"    - {path}")
+            report.append(f"  ⚠️  Files missing: {len(result.files_missing)}")
+            report.extend(f"    - {path}" for path in result.files_missing)
 
         if result.files_added:
-            click.echo(f"  ℹ️  Files added (not in manifest): {len(result.files_added)}")
+            report.append(f"  ℹ️  Files added (not in manifest): {len(result.files_added)}")
 
         if result.signature_valid is not None:
-            click.echo(f"  Signature: {'✅ VALID' if result.signature_valid else '❌ INVALID'}")
+            report.append(f"  Signature: {'✅ VALID' if result.signature_valid else '❌ INVALID'}")
+
+        click.echo("\n".join(report))
 
         # Exit with error code if invalid
         if not result.valid:
@@ -967,14 +1167,14 @@ def verify_bundle(ctx: click.Context, bundle: Path, public_key: Path | None, out
 
 
 @cli.command()
-@click.option('--cache-dir', type=click.Path(path_type=Path), help='Cache directory')
+@click.option('--cache-dir', type=ANY_PATH, help='Cache directory')
 @click.pass_context
 def cache_stats(ctx: click.Context, cache_dir: Path | None):
     """Show cache statistics."""
     debug = ctx.obj.get('debug', False)
 
     try:
-        cache = get_cache(cache_dir or Path(".truthcache"))
+        cache = get_cache(cache_dir or Path(".truthcache"), create=False)
         if cache:
             stats = cache.stats()
             click.echo("Cache Statistics:")
@@ -988,7 +1188,7 @@ def cache_stats(ctx: click.Context, cache_dir: Path | None):
 
 
 @cli.command()
-@click.option('--cache-dir', type=click.Path(path_type=Path), help='Cache directory')
+@click.option('--cache-dir', type=ANY_PATH, help='Cache directory')
 @click.option('--max-age', type=int, default=30, help='Maximum age in days')
 @click.pass_context
 def cache_compact(ctx: click.Context, cache_dir: Path | None, max_age: int):
@@ -996,7 +1196,7 @@ def cache_compact(ctx: click.Context, cache_dir: Path | None, max_age: int):
     debug = ctx.obj.get('debug', False)
 
     try:
-        cache = get_cache(cache_dir or Path(".truthcache"))
+        cache = get_cache(cache_dir or Path(".truthcache"), create=False)
         if cache:
             removed = cache.compact(max_age_days=max_age)
             click.echo(f"Removed {removed} old cache entries")
@@ -1007,7 +1207,7 @@ def cache_compact(ctx: click.Context, cache_dir: Path | None, max_age: int):
 
 
 @cli.command()
-@click.option('--cache-dir', type=click.Path(path_type=Path), help='Cache directory')
+@click.option('--cache-dir', type=ANY_PATH, help='Cache directory')
 @click.confirmation_option(prompt='Are you sure you want to clear the cache?')
 @click.pass_context
 def cache_clear(ctx: click.Context, cache_dir: Path | None):
@@ -1015,7 +1215,7 @@ def cache_clear(ctx: click.Context, cache_dir: Path | None):
     debug = ctx.obj.get('debug', False)
 
     try:
-        cache = get_cache(cache_dir or Path(".truthcache"))
+        cache = get_cache(cache_dir or Path(".truthcache"), create=False)
         if cache:
             count = cache.clear()
             click.echo(f"Cleared {count} cache entries")
@@ -1069,18 +1269,18 @@ def bundle_group():
 @click.option(
     "--run-dir", "-r",
     required=True,
-    type=click.Path(exists=True, path_type=Path),
+    type=EXISTING_PATH,
     help="Directory containing run outputs (with run_manifest.json)",
 )
 @click.option(
     "--inputs", "-i",
-    type=click.Path(exists=True, path_type=Path),
+    type=EXISTING_PATH,
     help="Original inputs directory (if separate from run_dir)",
 )
 @click.option(
     "--out", "-o",
     required=True,
-    type=click.Path(path_type=Path),
+    type=ANY_PATH,
     help="Output directory for the bundle",
 )
 @click.option(
@@ -1089,7 +1289,7 @@ def bundle_group():
 )
 @click.option(
     "--mode", "-m",
-    type=click.Choice(["pr", "main", "release"]),
+    type=MODE_CHOICE,
     help="Mode used for the run",
 )
 @click.pass_context
@@ -1113,6 +1313,7 @@ def bundle_export(
     debug = ctx.obj.get("debug", False)
 
     try:
+        from truthcore.replay import BundleExporter
         exporter = BundleExporter()
         bundle = exporter.export(
             run_dir=run_dir,
@@ -1126,9 +1327,9 @@ def bundle_export(
         click.echo("\nBundle contents:")
         click.echo(f"  - Run ID: {bundle.manifest.run_id}")
         click.echo(f"  - Command: {bundle.manifest.command}")
-        click.echo(f"  - Inputs: {bundle.get_input_files().__len__()} files")
-        click.echo(f"  - Configs: {bundle.get_config_files().__len__()} files")
-        click.echo(f"  - Outputs: {bundle.get_output_files().__len__()} files")
+        click.echo(f"  - Inputs: {bundle.input_count} files")
+        click.echo(f"  - Configs: {bundle.config_count} files")
+        click.echo(f"  - Outputs: {bundle.output_count} files")
 
         if bundle.evidence_manifest:
             click.echo("  - Evidence manifest: ✓ (with provenance)")
@@ -1141,18 +1342,18 @@ def bundle_export(
 @click.option(
     "--bundle", "-b",
     required=True,
-    type=click.Path(exists=True, path_type=Path),
+    type=EXISTING_PATH,
     help="Path to replay bundle directory",
 )
 @click.option(
     "--out", "-o",
     required=True,
-    type=click.Path(path_type=Path),
+    type=ANY_PATH,
     help="Output directory for replay results",
 )
 @click.option(
     "--mode", "-m",
-    type=click.Choice(["pr", "main", "release"]),
+    type=MODE_CHOICE,
     help="Override mode (uses bundle mode if not specified)",
 )
 @click.option(
@@ -1199,6 +1400,7 @@ def replay(
 
     try:
         # Load bundle
+        from truthcore.replay import ReplayBundle, ReplayEngine, ReplayReporter
         click.echo(f"Loading bundle: {bundle}")
         replay_bundle = ReplayBundle.load(bundle)
 
@@ -1239,11 +1441,18 @@ def replay(
         click.echo(f"  - JSON: {paths['json']}")
         click.echo(f"  - Markdown: {paths['markdown']}")
 
-        # Show summary
+        # Show summary (tallied in one pass over the file diffs)
+        identical_count = content_diffs = 0
+        for file_diff in result.file_diffs:
+            diff = file_diff.diff
+            if diff.identical:
+                identical_count += 1
+            if diff.content_differences > 0:
+                content_diffs += 1
         click.echo("\nResults:")
         click.echo(f"  - Files compared: {len(result.file_diffs)}")
-        click.echo(f"  - Identical: {sum(1 for d in result.file_diffs if d.diff.identical)}")
-        click.echo(f"  - Different: {sum(1 for d in result.file_diffs if not d.diff.identical)}")
+        click.echo(f"  - Identical: {identical_count}")
+        click.echo(f"  - Different: {len(result.file_diffs) - identical_count}")
 
         if result.identical:
             click.echo("\n✅ Outputs are identical (content-wise)")
@@ -1252,7 +1461,6 @@ def replay(
                 click.echo("\n❌ Differences found (--strict mode)")
                 sys.exit(1)
             else:
-                content_diffs = sum(1 for d in result.file_diffs if d.diff.content_differences > 0)
                 if content_diffs > 0:
                     click.echo(f"\n❌ Content differences found in {content_diffs} files")
                     sys.exit(1)
@@ -1267,24 +1475,24 @@ def replay(
 @click.option(
     "--bundle", "-b",
     required=True,
-    type=click.Path(exists=True, path_type=Path),
+    type=EXISTING_PATH,
     help="Path to replay bundle directory",
 )
 @click.option(
     "--out", "-o",
     required=True,
-    type=click.Path(path_type=Path),
+    type=ANY_PATH,
     help="Output directory for simulation results",
 )
 @click.option(
     "--changes", "-c",
     required=True,
-    type=click.Path(exists=True, path_type=Path),
+    type=EXISTING_PATH,
     help="YAML file with changes to apply",
 )
 @click.option(
     "--mode", "-m",
-    type=click.Choice(["pr", "main", "release"]),
+    type=MODE_CHOICE,
     help="Override mode (uses bundle mode if not specified)",
 )
 @click.option(
@@ -1341,6 +1549,7 @@ def simulate(
 
     try:
         # Load bundle
+        from truthcore.replay import ReplayBundle, SimulationChanges, SimulationEngine, SimulationReporter
         click.echo(f"Loading bundle: {bundle}")
         replay_bundle = ReplayBundle.load(bundle)
 
@@ -1413,8 +1622,8 @@ def simulate(
 @cli.command()
 @click.option('--host', '-h', default='127.0.0.1', help='Host to bind to')
 @click.option('--port', '-p', default=8000, help='Port to listen on')
-@click.option('--cache-dir', type=click.Path(path_type=Path), help='Cache directory')
-@click.option('--static-dir', type=click.Path(path_type=Path), help='Static files directory for GUI')
+@click.option('--cache-dir', type=ANY_PATH, help='Cache directory')
+@click.option('--static-dir', type=ANY_PATH, help='Static files directory for GUI')
 @click.option('--reload', is_flag=True, help='Enable auto-reload for development')
 @click.option('--workers', '-w', default=1, help='Number of worker processes')
 @click.option('--debug', is_flag=True, help='Enable debug mode')
@@ -1492,6 +1701,221 @@ def serve(
         handle_error(e, debug or ctx.obj.get('debug', False))
 
 
+@functools.cache
+def _dashboard_dir() -> Path:
+    """Locate the dashboard sources in the repository checkout (src/truthcore/ -> repo root)."""
+    return Path(__file__).resolve().parents[2] / "dashboard"
+
+
+# Files and directories under the dashboard directory that feed `npm run build`
+_DASHBOARD_BUILD_INPUTS = (
+    "src", "index.html", "package.json", "package-lock.json", "tsconfig.json", "vite.config.ts",
+)
+
+
+def _iter_mtimes(root: str) -> Iterator[int]:
+    """Yield st_mtime_ns for root, or for every file beneath it if it is a directory."""
+    try:
+        st = os.stat(root)
+    except FileNotFoundError:
+        return
+    if not os.path.isdir(root):
+        yield st.st_mtime_ns
+        return
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir():
+                    stack.append(entry.path)
+                else:
+                    yield entry.stat().st_mtime_ns
+
+
+def _dist_is_fresh(dashboard_dir: Path) -> bool:
+    """Check whether dist/ was built after every build input last changed.
+
+    Stops at the first source file newer than the oldest built file.
+    """
+    oldest_output = min(_iter_mtimes(os.path.join(dashboard_dir, "dist")), default=None)
+    if oldest_output is None:
+        return False
+    return not any(
+        mtime > oldest_output
+        for name in _DASHBOARD_BUILD_INPUTS
+        for mtime in _iter_mtimes(os.path.join(dashboard_dir, name))
+    )
+
+
+# Lines of npm output kept for the error message when a build fails
+_NPM_OUTPUT_TAIL = 200
+
+
+def _run_npm(args: list[str], cwd: Path) -> None:
+    """Run an npm command, keeping only the tail of its output.
+
+    stdout and stderr are merged and read line by line into a bounded
+    deque, so memory stays flat however verbose the build is.
+
+    Raises:
+        subprocess.CalledProcessError: If npm exits nonzero; its output
+            attribute holds the last _NPM_OUTPUT_TAIL lines
+    """
+    import subprocess
+    from collections import deque
+
+    cmd = ["npm", *args]
+    with subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True) as proc:
+        assert proc.stdout is not None
+        tail = deque(proc.stdout, maxlen=_NPM_OUTPUT_TAIL)
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, output="".join(tail))
+
+
+def _build_dashboard(dashboard_dir: Path, force: bool) -> bool:
+    """Run `npm run build` unless dist/ is already up to date.
+
+    Returns:
+        True if the build ran, False if it was skipped
+    """
+    if not force and _dist_is_fresh(dashboard_dir):
+        return False
+    _run_npm(["run", "build"], dashboard_dir)
+    return True
+
+
+# Trees with fewer files than this are copied on the calling thread
+_PARALLEL_COPY_MIN_FILES = 8
+_MAX_COPY_JOBS = 16
+
+
+def _copy_file(pair: tuple[str, str]) -> None:
+    """Copy one file's contents (in-kernel on Linux) and then its metadata."""
+    src, dst = pair
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _copy_file_contents(pair: tuple[str, str]) -> None:
+    """Copy one file's contents only."""
+    shutil.copyfile(*pair)
+
+
+def _copy_trees(trees: Iterable[tuple[str, str]], *, keep_metadata: bool = True) -> int:
+    """Merge-copy directory trees, returning the number of files copied.
+
+    Destination directories are created during a scandir walk; the files
+    are then copied on a thread pool, since the kernel-side copies behind
+    shutil.copyfile release the GIL. Equivalent to copytree(...,
+    dirs_exist_ok=True) for each (src, dst) pair, or to copytree with
+    copy_function=copyfile when keep_metadata is False (for build output,
+    whose timestamps and modes nothing reads).
+    """
+    pairs: list[tuple[str, str]] = []
+    stack = list(trees)
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        os.makedirs(dst_dir, exist_ok=True)
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    stack.append((entry.path, target))
+                else:
+                    pairs.append((entry.path, target))
+
+    copy = _copy_file if keep_metadata else _copy_file_contents
+    if len(pairs) < _PARALLEL_COPY_MIN_FILES:
+        for pair in pairs:
+            copy(pair)
+    else:
+        with ThreadPoolExecutor(max_workers=min(_MAX_COPY_JOBS, len(pairs))) as executor:
+            # Consume the results so copy errors propagate
+            for _ in executor.map(copy, pairs):
+                pass
+    return len(pairs)
+
+
+def _encode_embedded_runs(f: BinaryIO, runs_data: Iterable[dict], *, pretty: bool = False) -> None:
+    """Write the `window.__EMBEDDED_RUNS__ = [...];` statement, encoding one run at a time.
+
+    The payload is only read by the dashboard, so it is compact JSON unless
+    pretty is set (used with --debug).
+    """
+    f.write(b"window.__EMBEDDED_RUNS__ = ")
+    if pretty:
+        jsonio.write_array(f, runs_data, level=0)
+    else:
+        sep = b"["
+        for run in runs_data:
+            f.write(sep)
+            f.write(jsonio.dumps(run, indent=False))
+            sep = b","
+        f.write(b"[]" if sep == b"[" else b"]")
+    f.write(b";")
+
+
+def _write_embedded_runs(path: Path, runs_data: Iterable[dict], *, pretty: bool = False) -> None:
+    """Write embedded-runs.js straight to the file, without building the whole document first."""
+    with open(path, "wb", buffering=jsonio.STREAM_BUFFER_SIZE) as f:
+        _encode_embedded_runs(f, runs_data, pretty=pretty)
+
+
+class _ScriptSafeWriter(io.RawIOBase):
+    """Binary writer that escapes "</" so JSON can sit inside an inline <script>.
+
+    "<\\/" is the same JSON string. Escaping per write is safe because every
+    write from jsonio holds whole encoded values, so no string spans two.
+    """
+
+    def __init__(self, f: BinaryIO) -> None:
+        self._f = f
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._f.write(bytes(data).replace(b"</", b"<\\/"))
+        return len(data)
+
+
+def _embed_runs(
+    dashboard_out: Path, runs_data: Iterable[dict], *, pretty: bool = False, external: bool = False
+) -> None:
+    """Embed run data into a built dashboard.
+
+    By default the data is inlined as a <script> block in index.html, so the
+    page needs no second request before it can render. With external set (or
+    when there is no index.html to inline into) it is written to
+    embedded-runs.js and loaded with a <script src>, for deployments whose
+    Content-Security-Policy forbids inline scripts. Either way the payload is
+    encoded one run at a time straight into the output file.
+    """
+    index_path = dashboard_out / "index.html"
+    if external or not index_path.exists():
+        _write_embedded_runs(dashboard_out / "embedded-runs.js", runs_data, pretty=pretty)
+        if not index_path.exists():
+            return
+
+    # Split as bytes: the page is copied through unchanged, never decoded
+    with open(index_path, "rb") as f:
+        head, body_end, tail = f.read().partition(b"</body>")
+    if not body_end:
+        return
+
+    # Add script before closing body
+    with open(index_path, "wb", buffering=jsonio.STREAM_BUFFER_SIZE) as f:
+        f.write(head)
+        if external:
+            f.write(b'<script src="embedded-runs.js"></script>')
+        else:
+            f.write(b"<script>")
+            _encode_embedded_runs(cast(BinaryIO, _ScriptSafeWriter(f)), runs_data, pretty=pretty)
+            f.write(b"</script>")
+        f.write(b"\n  </body>")
+        f.write(tail)
+
+
 @cli.group(name="dashboard")
 def dashboard_group():
     """Build and serve the Truth Core dashboard."""
@@ -1499,11 +1923,22 @@ def dashboard_group():
 
 
 @dashboard_group.command(name="build")
-@click.option('--runs', '-r', required=True, type=click.Path(exists=True, path_type=Path), help='Runs directory')
-@click.option('--out', '-o', required=True, type=click.Path(path_type=Path), help='Output directory')
+@click.option('--runs', '-r', required=True, type=EXISTING_PATH, help='Runs directory')
+@click.option('--out', '-o', required=True, type=ANY_PATH, help='Output directory')
 @click.option('--embedded/--no-embedded', default=True, help='Embed run data in dashboard')
+@click.option('--force-build', is_flag=True, help='Run npm build even if dist/ is up to date')
+@click.option(
+    '--external-data', is_flag=True,
+    help='Write run data to embedded-runs.js instead of inlining it (for CSP without inline scripts)',
+)
+@click.option(
+    '--jobs', '-j', type=click.IntRange(min=1), default=1,
+    help='Worker threads for loading runs (default: 1; raise for slow or network storage)',
+)
 @click.pass_context
-def dashboard_build(ctx: click.Context, runs: Path, out: Path, embedded: bool):
+def dashboard_build(
+    ctx: click.Context, runs: Path, out: Path, embedded: bool, force_build: bool, external_data: bool, jobs: int
+):
     """Build the dashboard as static files.
 
     Creates a production-ready static dashboard that can be hosted
@@ -1513,14 +1948,12 @@ def dashboard_build(ctx: click.Context, runs: Path, out: Path, embedded: bool):
       truthctl dashboard build --runs ./my-runs --out ./dashboard-dist
       truthctl dashboard build --runs ./runs --out ./dist --no-embedded
     """
-    import json
-    import shutil
     import subprocess
 
     debug = ctx.obj.get('debug', False)
 
     try:
-        dashboard_dir = Path(__file__).parent.parent.parent.parent / "dashboard"
+        dashboard_dir = _dashboard_dir()
 
         if not dashboard_dir.exists():
             click.echo(f"Error: Dashboard directory not found at {dashboard_dir}", err=True)
@@ -1529,13 +1962,8 @@ def dashboard_build(ctx: click.Context, runs: Path, out: Path, embedded: bool):
         click.echo(f"Building dashboard from {dashboard_dir}...")
 
         # Build the dashboard
-        subprocess.run(
-            ["npm", "run", "build"],
-            cwd=dashboard_dir,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        if not _build_dashboard(dashboard_dir, force_build):
+            click.echo("  dist/ is up to date, skipping npm build")
 
         # Copy built files
         dist_dir = dashboard_dir / "dist"
@@ -1543,79 +1971,55 @@ def dashboard_build(ctx: click.Context, runs: Path, out: Path, embedded: bool):
             click.echo("Error: Dashboard build failed - dist directory not created", err=True)
             sys.exit(1)
 
-        out.mkdir(parents=True, exist_ok=True)
-
         # Copy dashboard files
-        for item in dist_dir.iterdir():
-            dest = out / item.name
-            if item.is_dir():
-                shutil.copytree(item, dest, dirs_exist_ok=True)
-            else:
-                shutil.copy2(item, dest)
+        _copy_trees([(str(dist_dir), str(out))], keep_metadata=False)
 
         # If embedded mode, copy and embed runs
         if embedded:
             click.echo(f"Embedding run data from {runs}...")
 
             # Load all runs
-            runs_data = []
-            for run_dir in runs.iterdir():
-                if run_dir.is_dir():
-                    run_data = load_run_data(run_dir)
-                    if run_data:
-                        runs_data.append(run_data)
-
-            # Create embedded data file
-            embedded_js = f"window.__EMBEDDED_RUNS__ = {json.dumps(runs_data, indent=2)};"
-
-            with open(out / "embedded-runs.js", "w") as f:
-                f.write(embedded_js)
-
-            # Inject into index.html
-            index_path = out / "index.html"
-            if index_path.exists():
-                with open(index_path) as f:
-                    html = f.read()
-
-                # Add script tag before closing body
-                html = html.replace(
-                    "</body>",
-                    '<script src="embedded-runs.js"></script>\n  </body>'
-                )
+            runs_data = _load_runs(_run_dirs(runs), jobs)
 
-                with open(index_path, "w") as f:
-                    f.write(html)
+            # Create embedded data file and inject it into index.html
+            _embed_runs(out, runs_data, pretty=debug, external=external_data)
 
             click.echo(f"  Embedded {len(runs_data)} runs")
 
-        click.echo(f"Dashboard built successfully: {out}")
-        click.echo(f"  Open {out / 'index.html'} in a browser")
+        click.echo("\n".join([
+            f"Dashboard built successfully: {out}",
+            f"  Open {out / 'index.html'} in a browser",
+        ]))
 
     except subprocess.CalledProcessError as e:
-        click.echo(f"Build failed: {e.stderr}", err=True)
+        click.echo(f"Build failed:\n{e.output}", err=True)
         sys.exit(1)
     except Exception as e:
         handle_error(e, debug)
 
 
 @dashboard_group.command(name="serve")
-@click.option('--runs', '-r', required=True, type=click.Path(exists=True, path_type=Path), help='Runs directory')
+@click.option('--runs', '-r', required=True, type=EXISTING_PATH, help='Runs directory')
 @click.option('--port', '-p', default=8787, help='Port to serve on')
 @click.option('--host', '-h', default='127.0.0.1', help='Host to bind to')
 @click.option('--open/--no-open', default=True, help='Open browser automatically')
+@click.option('--dev/--no-dev', default=False, help='Run the Vite dev server with hot reload (requires Node)')
 @click.pass_context
-def dashboard_serve(ctx: click.Context, runs: Path, port: int, host: str, open: bool):
+def dashboard_serve(ctx: click.Context, runs: Path, port: int, host: str, open: bool, dev: bool):
     """Serve the dashboard locally.
 
-    Builds and serves the dashboard with hot-reload for development.
+    Serves the built dashboard, with the runs embedded, from a threaded
+    static HTTP server. Use --dev for the Vite dev server with hot reload.
 
     Examples:
       truthctl dashboard serve --runs ./my-runs
       truthctl dashboard serve --runs ./runs --port 8080
+      truthctl dashboard serve --runs ./runs --dev
     """
     import subprocess
-    import time
+    import tempfile
     import webbrowser
+    from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 
     debug = ctx.obj.get('debug', False)
 
@@ -1624,12 +2028,40 @@ def dashboard_serve(ctx: click.Context, runs: Path, port: int, host: str, open:
         click.echo("⚠️  Warning: Binding to 0.0.0.0 exposes the dashboard on all network interfaces", err=True)
 
     try:
-        dashboard_dir = Path(__file__).parent.parent.parent.parent / "dashboard"
+        dashboard_dir = _dashboard_dir()
 
         if not dashboard_dir.exists():
             click.echo(f"Error: Dashboard directory not found at {dashboard_dir}", err=True)
             sys.exit(1)
 
+        if not dev:
+            # View-only: serve the built dist/ without starting Node
+            try:
+                if not _build_dashboard(dashboard_dir, force=False):
+                    click.echo("dist/ is up to date, skipping npm build")
+            except subprocess.CalledProcessError as e:
+                click.echo(f"Build failed:\n{e.output}", err=True)
+                sys.exit(1)
+
+            serve_dir = Path(tempfile.mkdtemp(prefix="truthcore-dashboard-"))
+            try:
+                _copy_trees([(str(dashboard_dir / "dist"), str(serve_dir))], keep_metadata=False)
+                _embed_runs(serve_dir, _load_runs(_run_dirs(runs)), pretty=debug)
+
+                handler = functools.partial(SimpleHTTPRequestHandler, directory=str(serve_dir))
+                with ThreadingHTTPServer((host, port), handler) as server:
+                    click.echo(f"Serving dashboard on http://{host}:{port}")
+                    click.echo(f"Using runs from: {runs}")
+                    click.echo("Press Ctrl+C to stop")
+
+                    # The socket is already listening, so no need to wait
+                    if open and host == '127.0.0.1':
+                        webbrowser.open(f"http://{host}:{port}")
+                    server.serve_forever()
+            finally:
+                shutil.rmtree(serve_dir, ignore_errors=True)
+            return
+
         click.echo(f"Starting dashboard server on http://{host}:{port}")
         click.echo(f"Using runs from: {runs}")
         click.echo("Press Ctrl+C to stop")
@@ -1662,11 +2094,28 @@ def dashboard_serve(ctx: click.Context, runs: Path, port: int, host: str, open:
 
 
 @dashboard_group.command(name="snapshot")
-@click.option('--runs', '-r', required=True, type=click.Path(exists=True, path_type=Path), help='Runs directory')
-@click.option('--out', '-o', required=True, type=click.Path(path_type=Path), help='Output directory')
+@click.option('--runs', '-r', required=True, type=EXISTING_PATH, help='Runs directory')
+@click.option('--out', '-o', required=True, type=ANY_PATH, help='Output directory')
 @click.option('--name', '-n', help='Snapshot name (default: timestamp)')
+@click.option('--force-build', is_flag=True, help='Run npm build even if dist/ is up to date')
+@click.option(
+    '--external-data', is_flag=True,
+    help='Write run data to embedded-runs.js instead of inlining it (for CSP without inline scripts)',
+)
+@click.option(
+    '--jobs', '-j', type=click.IntRange(min=1), default=1,
+    help='Worker threads for loading runs (default: 1; raise for slow or network storage)',
+)
 @click.pass_context
-def dashboard_snapshot(ctx: click.Context, runs: Path, out: Path, name: str | None):
+def dashboard_snapshot(
+    ctx: click.Context,
+    runs: Path,
+    out: Path,
+    name: str | None,
+    force_build: bool,
+    external_data: bool,
+    jobs: int,
+):
     """Create a portable snapshot of runs + dashboard.
 
     Creates a self-contained directory with:
@@ -1678,14 +2127,12 @@ def dashboard_snapshot(ctx: click.Context, runs: Path, out: Path, name: str | No
       truthctl dashboard snapshot --runs ./my-runs --out ./snapshot
       truthctl dashboard snapshot --runs ./runs --out ./export --name v1.0-results
     """
-    import json
-    import shutil
     import subprocess
 
     debug = ctx.obj.get('debug', False)
 
     try:
-        snapshot_name = name or f"truthcore-snapshot-{int(time.time())}"
+        snapshot_name = name or f"truthcore-snapshot-{time.time_ns() // 10**9}"
         snapshot_dir = out / snapshot_name
 
         click.echo(f"Creating snapshot: {snapshot_name}")
@@ -1699,58 +2146,32 @@ def dashboard_snapshot(ctx: click.Context, runs: Path, out: Path, name: str | No
 
         # Copy runs
         click.echo(f"Copying runs from {runs}...")
-        run_count = 0
-        for run_dir in runs.iterdir():
-            if run_dir.is_dir():
-                dest = runs_out / run_dir.name
-                shutil.copytree(run_dir, dest, dirs_exist_ok=True)
-                run_count += 1
+        # Listed once; the same run directories are embedded below
+        run_dirs = _run_dirs(runs)
+        run_trees = [(str(run_dir), str(runs_out / run_dir.name)) for run_dir in run_dirs]
+        _copy_trees(run_trees)
+        run_count = len(run_trees)
 
         click.echo(f"  Copied {run_count} runs")
 
         # Build dashboard
-        dashboard_dir = Path(__file__).parent.parent.parent.parent / "dashboard"
+        dashboard_dir = _dashboard_dir()
 
         if dashboard_dir.exists():
             click.echo("Building dashboard...")
 
             # Build
-            subprocess.run(
-                ["npm", "run", "build"],
-                cwd=dashboard_dir,
-                capture_output=True,
-                check=True,
-            )
+            if not _build_dashboard(dashboard_dir, force_build):
+                click.echo("  dist/ is up to date, skipping npm build")
 
             # Copy built files
             dist_dir = dashboard_dir / "dist"
-            for item in dist_dir.iterdir():
-                dest = dashboard_out / item.name
-                if item.is_dir():
-                    shutil.copytree(item, dest, dirs_exist_ok=True)
-                else:
-                    shutil.copy2(item, dest)
+            _copy_trees([(str(dist_dir), str(dashboard_out))], keep_metadata=False)
 
             # Load and embed runs data
-            runs_data = []
-            for run_dir in runs.iterdir():
-                if run_dir.is_dir():
-                    run_data = load_run_data(run_dir)
-                    if run_data:
-                        runs_data.append(run_data)
-
-            embedded_js = f"window.__EMBEDDED_RUNS__ = {json.dumps(runs_data, indent=2)};"
-            with open(dashboard_out / "embedded-runs.js", "w") as f:
-                f.write(embedded_js)
-
-            # Inject into index.html
-            index_path = dashboard_out / "index.html"
-            if index_path.exists():
-                with open(index_path) as f:
-                    html = f.read()
-                html = html.replace("</body>", '<script src="embedded-runs.js"></script>\n  </body>')
-                with open(index_path, "w") as f:
-                    f.write(html)
+            runs_data = _load_runs(run_dirs, jobs)
+
+            _embed_runs(dashboard_out, runs_data, pretty=debug, external=external_data)
 
         # Create README
         readme_content = f"""# Truth Core Snapshot: {snapshot_name}
@@ -1774,51 +2195,223 @@ Created: {time.strftime('%Y-%m-%d %H:%M:%S')}
         with open(snapshot_dir / "README.txt", "w") as f:
             f.write(readme_content)
 
-        click.echo(f"Snapshot created: {snapshot_dir}")
-        click.echo(f"  Runs: {run_count}")
-        click.echo(f"  Dashboard: {dashboard_out / 'index.html'}")
+        click.echo("\n".join([
+            f"Snapshot created: {snapshot_dir}",
+            f"  Runs: {run_count}",
+            f"  Dashboard: {dashboard_out / 'index.html'}",
+        ]))
 
+    except subprocess.CalledProcessError as e:
+        click.echo(f"Build failed:\n{e.output}", err=True)
+        sys.exit(1)
     except Exception as e:
         handle_error(e, debug)
 
 
+# Optional run artifacts embedded in the dashboard, by run_data key
+_RUN_ARTIFACTS = {
+    "verdict": "verdict.json",
+    "readiness": "readiness.json",
+    "invariants": "invariants.json",
+    "policy": "policy_findings.json",
+    "provenance": "verification_report.json",
+    "intel_scorecard": "intel_scorecard.json",
+}
+
+
 def load_run_data(run_dir: Path) -> dict | None:
-    """Load run data from a directory."""
-    import json
+    """Load run data from a directory.
 
-    run_id = run_dir.name
-    run_data = {"run_id": run_id, "files": []}
+    The directory is listed once and the listing answers which artifacts
+    exist, rather than stat'ing each candidate file.
+    """
+    try:
+        with os.scandir(run_dir) as it:
+            entries = {entry.name: entry.path for entry in it}
+    except OSError:
+        return None
 
     # Load manifest (required)
-    manifest_path = run_dir / "run_manifest.json"
-    if not manifest_path.exists():
+    if "run_manifest.json" not in entries:
         return None
 
-    with open(manifest_path) as f:
-        run_data["manifest"] = json.load(f)
+    run_data = {"run_id": run_dir.name, "files": []}
+    run_data["manifest"] = jsonio.load_file(entries["run_manifest.json"])
 
     # Load optional files
-    files_to_load = {
-        "verdict": "verdict.json",
-        "readiness": "readiness.json",
-        "invariants": "invariants.json",
-        "policy": "policy_findings.json",
-        "provenance": "verification_report.json",
-        "intel_scorecard": "intel_scorecard.json",
-    }
-
-    for key, filename in files_to_load.items():
-        path = run_dir / filename
-        if path.exists():
-            with open(path) as f:
-                run_data[key] = json.load(f)
+    for key, filename in _RUN_ARTIFACTS.items():
+        if filename in entries:
+            run_data[key] = jsonio.load_file(entries[filename])
             run_data["files"].append(filename)
 
     return run_data
 
 
+def _run_dirs(runs: Path) -> list[Path]:
+    """List the run directories under runs in one scandir pass.
+
+    DirEntry.is_dir() answers from the directory listing where the
+    filesystem reports entry types, so only symlinks need a stat.
+    """
+    with os.scandir(runs) as it:
+        return [Path(entry.path) for entry in it if entry.is_dir()]
+
+
+def _load_runs(run_dirs: list[Path], jobs: int = 1) -> list[dict]:
+    """Load each run directory, skipping those without a manifest.
+
+    Loading is serial by default: with the run files in the page cache,
+    parsing dominates and threads only add overhead. jobs > 1 overlaps
+    the reads on a thread pool, which pays off on slow or network
+    storage. Results keep directory order either way.
+    """
+    workers = min(jobs, len(run_dirs))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            loaded = list(executor.map(load_run_data, run_dirs))
+    else:
+        loaded = [load_run_data(run_dir) for run_dir in run_dirs]
+    return [run_data for run_data in loaded if run_data]
+
+
+# Demo run artifacts; run_id and timestamp are filled in per run
+_DEMO_MANIFEST = {
+    "version": "1.0.0",
+    "run_id": "",
+    "command": "judge",
+    "timestamp": "",
+    "duration_ms": 1234,
+    "profile": "demo",
+    "config": {"strict": True},
+    "input_hash": "sha256:demo",
+    "config_hash": "sha256:demo",
+    "metadata": {},
+}
+
+_DEMO_VERDICT = {
+    "version": "2.0.0",
+    "timestamp": "",
+    "run_id": "",
+    "verdict": "CONDITIONAL",
+    "score": 85,
+    "threshold": 90,
+    "total_findings": 3,
+    "findings_by_severity": {
+        "BLOCKER": 0,
+        "CRITICAL": 0,
+        "HIGH": 1,
+        "MEDIUM": 2,
+        "LOW": 0,
+        "INFO": 0,
+    },
+    "findings": [
+        {
+            "id": "demo-1",
+            "severity": "HIGH",
+            "category": "quality",
+            "engine": "demo",
+            "rule": "test_coverage",
+            "message": "Test coverage below threshold (75% < 80%)",
+        },
+        {
+            "id": "demo-2",
+            "severity": "MEDIUM",
+            "category": "style",
+            "engine": "demo",
+            "rule": "line_length",
+            "message": "3 lines exceed 100 characters",
+        },
+        {
+            "id": "demo-3",
+            "severity": "MEDIUM",
+            "category": "security",
+            "engine": "demo",
+            "rule": "dependency_check",
+            "message": "2 dependencies have known vulnerabilities",
+        },
+    ],
+    "subscores": {
+        "security": 90,
+        "quality": 75,
+        "performance": 95,
+        "style": 85,
+    },
+}
+
+_DEMO_INVARIANTS = {
+    "version": "1.0.0",
+    "timestamp": "",
+    "results": [
+        {
+            "rule_id": "no_blockers",
+            "name": "No Blocker Issues",
+            "passed": True,
+            "severity": "BLOCKER",
+        },
+        {
+            "rule_id": "tests_pass",
+            "name": "All Tests Pass",
+            "passed": True,
+            "severity": "CRITICAL",
+        },
+        {
+            "rule_id": "coverage_threshold",
+            "name": "Coverage >= 80%",
+            "passed": False,
+            "severity": "HIGH",
+            "message": "Current coverage: 75%",
+        },
+    ],
+}
+
+_DEMO_POLICY = {
+    "version": "1.0.0",
+    "timestamp": "",
+    "pack_name": "demo",
+    "rules_evaluated": 10,
+    "rules_triggered": 2,
+    "findings": [
+        {
+            "rule_id": "DEPRECATED_API",
+            "severity": "MEDIUM",
+            "message": "Using deprecated API: old_function()",
+            "file": "src/example.py",
+        },
+    ],
+}
+
+_DEMO_PROVENANCE = {
+    "version": "1.0.0",
+    "timestamp": "",
+    "bundle_hash": "sha256:demo-bundle",
+    "files": [
+        {"path": "verdict.json", "hash": "sha256:abc", "algorithm": "sha256", "size": 1234},
+        {"path": "invariants.json", "hash": "sha256:def", "algorithm": "sha256", "size": 567},
+    ],
+}
+
+
+def _demo_documents(run_id: str, timestamp: str) -> dict[str, dict]:
+    """Fill in the demo templates, keyed by the file each is written to.
+
+    Only the top-level run_id and timestamp vary, so each document is a
+    shallow copy of its template. Overriding an existing key keeps its
+    position, so the written files match the template layout.
+    """
+    documents = {
+        "run_manifest.json": {**_DEMO_MANIFEST, "run_id": run_id},
+        "verdict.json": {**_DEMO_VERDICT, "run_id": run_id},
+        "invariants.json": dict(_DEMO_INVARIANTS),
+        "policy_findings.json": dict(_DEMO_POLICY),
+        "verification_report.json": dict(_DEMO_PROVENANCE),
+    }
+    for document in documents.values():
+        document["timestamp"] = timestamp
+    return documents
+
+
 @dashboard_group.command(name="demo")
-@click.option('--out', '-o', required=True, type=click.Path(path_type=Path), help='Output directory')
+@click.option('--out', '-o', required=True, type=ANY_PATH, help='Output directory')
 @click.option('--open/--no-open', default=True, help='Open browser after building')
 @click.pass_context
 def dashboard_demo(ctx: click.Context, out: Path, open: bool):
@@ -1833,10 +2426,7 @@ def dashboard_demo(ctx: click.Context, out: Path, open: bool):
       truthctl dashboard demo --out ./demo-out
       truthctl dashboard demo --out ./demo --no-open
     """
-    import json
-    import shutil
     import subprocess
-    import time
     import webbrowser
 
     debug = ctx.obj.get('debug', False)
@@ -1855,182 +2445,31 @@ def dashboard_demo(ctx: click.Context, out: Path, open: bool):
 
         timestamp = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
 
-        # Create manifest
-        manifest = {
-            "version": "1.0.0",
-            "run_id": run_id,
-            "command": "judge",
-            "timestamp": timestamp,
-            "duration_ms": 1234,
-            "profile": "demo",
-            "config": {"strict": True},
-            "input_hash": "sha256:demo",
-            "config_hash": "sha256:demo",
-            "metadata": {},
-        }
-
-        with open(run_dir / "run_manifest.json", "w") as f:
-            json.dump(manifest, f, indent=2)
-
-        # Create verdict
-        verdict = {
-            "version": "2.0.0",
-            "timestamp": timestamp,
-            "run_id": run_id,
-            "verdict": "CONDITIONAL",
-            "score": 85,
-            "threshold": 90,
-            "total_findings": 3,
-            "findings_by_severity": {
-                "BLOCKER": 0,
-                "CRITICAL": 0,
-                "HIGH": 1,
-                "MEDIUM": 2,
-                "LOW": 0,
-                "INFO": 0,
-            },
-            "findings": [
-                {
-                    "id": "demo-1",
-                    "severity": "HIGH",
-                    "category": "quality",
-                    "engine": "demo",
-                    "rule": "test_coverage",
-                    "message": "Test coverage below threshold (75% < 80%)",
-                },
-                {
-                    "id": "demo-2",
-                    "severity": "MEDIUM",
-                    "category": "style",
-                    "engine": "demo",
-                    "rule": "line_length",
-                    "message": "3 lines exceed 100 characters",
-                },
-                {
-                    "id": "demo-3",
-                    "severity": "MEDIUM",
-                    "category": "security",
-                    "engine": "demo",
-                    "rule": "dependency_check",
-                    "message": "2 dependencies have known vulnerabilities",
-                },
-            ],
-            "subscores": {
-                "security": 90,
-                "quality": 75,
-                "performance": 95,
-                "style": 85,
-            },
-        }
-
-        with open(run_dir / "verdict.json", "w") as f:
-            json.dump(verdict, f, indent=2)
-
-        # Create invariants
-        invariants = {
-            "version": "1.0.0",
-            "timestamp": timestamp,
-            "results": [
-                {
-                    "rule_id": "no_blockers",
-                    "name": "No Blocker Issues",
-                    "passed": True,
-                    "severity": "BLOCKER",
-                },
-                {
-                    "rule_id": "tests_pass",
-                    "name": "All Tests Pass",
-                    "passed": True,
-                    "severity": "CRITICAL",
-                },
-                {
-                    "rule_id": "coverage_threshold",
-                    "name": "Coverage >= 80%",
-                    "passed": False,
-                    "severity": "HIGH",
-                    "message": "Current coverage: 75%",
-                },
-            ],
-        }
-
-        with open(run_dir / "invariants.json", "w") as f:
-            json.dump(invariants, f, indent=2)
-
-        # Create policy findings
-        policy = {
-            "version": "1.0.0",
-            "timestamp": timestamp,
-            "pack_name": "demo",
-            "rules_evaluated": 10,
-            "rules_triggered": 2,
-            "findings": [
-                {
-                    "rule_id": "DEPRECATED_API",
-                    "severity": "MEDIUM",
-                    "message": "Using deprecated API: old_function()",
-                    "file": "src/example.py",
-                },
-            ],
-        }
-
-        with open(run_dir / "policy_findings.json", "w") as f:
-            json.dump(policy, f, indent=2)
-
-        # Create provenance
-        provenance = {
-            "version": "1.0.0",
-            "timestamp": timestamp,
-            "bundle_hash": "sha256:demo-bundle",
-            "files": [
-                {"path": "verdict.json", "hash": "sha256:abc", "algorithm": "sha256", "size": 1234},
-                {"path": "invariants.json", "hash": "sha256:def", "algorithm": "sha256", "size": 567},
-            ],
-        }
-
-        with open(run_dir / "verification_report.json", "w") as f:
-            json.dump(provenance, f, indent=2)
+        documents = _demo_documents(run_id, timestamp)
+        jsonio.dump_files(run_dir, documents)
 
         click.echo(f"Created demo run: {run_id}")
 
         # Build dashboard
-        dashboard_dir = Path(__file__).parent.parent.parent.parent / "dashboard"
+        dashboard_dir = _dashboard_dir()
         dashboard_out = out / "dashboard"
 
         if dashboard_dir.exists():
             click.echo("Building dashboard...")
 
-            subprocess.run(
-                ["npm", "run", "build"],
-                cwd=dashboard_dir,
-                capture_output=True,
-                check=True,
-            )
+            _run_npm(["run", "build"], dashboard_dir)
 
             # Copy built files
             dist_dir = dashboard_dir / "dist"
-            dashboard_out.mkdir(exist_ok=True)
+            _copy_trees([(str(dist_dir), str(dashboard_out))], keep_metadata=False)
 
-            for item in dist_dir.iterdir():
-                dest = dashboard_out / item.name
-                if item.is_dir():
-                    shutil.copytree(item, dest, dirs_exist_ok=True)
-                else:
-                    shutil.copy2(item, dest)
-
-            # Embed demo data
-            run_data = load_run_data(run_dir)
-            if run_data:
-                embedded_js = f"window.__EMBEDDED_RUNS__ = {json.dumps([run_data], indent=2)};"
-                with open(dashboard_out / "embedded-runs.js", "w") as f:
-                    f.write(embedded_js)
-
-                # Inject into index.html
-                index_path = dashboard_out / "index.html"
-                with open(index_path) as f:
-                    html = f.read()
-                html = html.replace("</body>", '<script src="embedded-runs.js"></script>\n  </body>')
-                with open(index_path, "w") as f:
-                    f.write(html)
+            # Embed the demo documents as written, the same shape load_run_data() reads back
+            run_data = {"run_id": run_id, "files": [], "manifest": documents["run_manifest.json"]}
+            for key, filename in _RUN_ARTIFACTS.items():
+                if filename in documents:
+                    run_data[key] = documents[filename]
+                    run_data["files"].append(filename)
+            _embed_runs(dashboard_out, [run_data], pretty=debug)
 
             click.echo(f"Dashboard built: {dashboard_out / 'index.html'}")
 
@@ -2038,10 +2477,15 @@ def dashboard_demo(ctx: click.Context, out: Path, open: bool):
                 url = f"file://{dashboard_out / 'index.html'}"
                 webbrowser.open(url)
 
-        click.echo(f"Demo created successfully in: {out}")
-        click.echo(f"  Run: {run_dir}")
-        click.echo(f"  Dashboard: {dashboard_out / 'index.html'}")
+        click.echo("\n".join([
+            f"Demo created successfully in: {out}",
+            f"  Run: {run_dir}",
+            f"  Dashboard: {dashboard_out / 'index.html'}",
+        ]))
 
+    except subprocess.CalledProcessError as e:
+        click.echo(f"Build failed:\n{e.output}", err=True)
+        sys.exit(1)
     except Exception as e:
         handle_error(e, debug)
 
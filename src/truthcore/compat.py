@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 import click
 
+from truthcore import jsonio
+
 if TYPE_CHECKING:
     from pathlib import Path
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CompatOptions:
     """Compatibility options for backward compatibility.
 
@@ -63,6 +64,10 @@ def apply_compat_decorator(cmd):
     )(cmd)
 
 
+# Output fields added after v1, dropped in legacy format
+_NEWER_FIELDS = frozenset({"version", "engines", "categories", "top_findings", "reasoning"})
+
+
 def transform_output_for_compat(data: dict[str, Any], opts: CompatOptions) -> dict[str, Any]:
     """Transform output data for compatibility mode.
 
@@ -76,20 +81,13 @@ def transform_output_for_compat(data: dict[str, Any], opts: CompatOptions) -> di
     if not opts.legacy_format:
         return data
 
-    result = dict(data)
-
     # Legacy format modifications
-    if "verdict" in result and opts.v1_output:
-        # Convert v2 format to v1 format
-        result = _convert_verdict_v2_to_v1(result)
-
-    # Remove newer fields for legacy compatibility
-    newer_fields = ["version", "engines", "categories", "top_findings", "reasoning"]
-    for field in newer_fields:
-        if field in result:
-            del result[field]
+    if "verdict" in data and opts.v1_output:
+        # Convert v2 format to v1 format (its fields are all legacy ones)
+        return _convert_verdict_v2_to_v1(data)
 
-    return result
+    # Remove newer fields for legacy compatibility, copying in one pass
+    return {key: value for key, value in data.items() if key not in _NEWER_FIELDS}
 
 
 def _convert_verdict_v2_to_v1(data: dict[str, Any]) -> dict[str, Any]:
@@ -126,8 +124,7 @@ def write_compat_output(
     transformed = transform_output_for_compat(data, opts)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(transformed, f, indent=2, sort_keys=True)
+    jsonio.dump_file(output_path, transformed, sort_keys=True)
 
 
 def get_compat_help_text(command_name: str) -> str:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from truthcore.connectors.base import BaseConnector, ConnectorConfig, ConnectorResult
+from truthcore.connectors.base import BaseConnector, ConnectorConfig, ConnectorResult, MemberFilter
 from truthcore.connectors.http import HTTPConnector
 from truthcore.connectors.local import LocalConnector
 
@@ -21,6 +21,7 @@ __all__ = [
     "BaseConnector",
     "ConnectorConfig",
     "ConnectorResult",
+    "MemberFilter",
     "LocalConnector",
     "HTTPConnector",
     "GitHubActionsConnector",
@@ -29,6 +30,14 @@ __all__ = [
     "list_connectors",
 ]
 
+# Connector classes by name; None when the optional module failed to import
+_CONNECTORS: dict[str, type[BaseConnector] | None] = {
+    "local": LocalConnector,
+    "http": HTTPConnector,
+    "github-actions": GitHubActionsConnector,
+    "s3": S3Connector,
+}
+
 
 def get_connector(name: str, config: ConnectorConfig | None = None) -> BaseConnector | None:
     """Get a connector by name.
@@ -40,14 +49,7 @@ def get_connector(name: str, config: ConnectorConfig | None = None) -> BaseConne
     Returns:
         Connector instance or None if not available
     """
-    connectors = {
-        "local": LocalConnector,
-        "http": HTTPConnector,
-        "github-actions": GitHubActionsConnector,
-        "s3": S3Connector,
-    }
-
-    connector_class = connectors.get(name)
+    connector_class = _CONNECTORS.get(name)
     if connector_class is None:
         return None
 
@@ -64,13 +66,6 @@ def list_connectors() -> list[dict[str, str | bool]]:
     Returns:
         List of connector info dicts with name and available status
     """
-    result = []
-
-    for name in ["local", "http", "github-actions", "s3"]:
-        connector = get_connector(name)
-        result.append({
-            "name": name,
-            "available": connector is not None and connector.is_available,
-        })
-
-    return result
+    # get_connector() already checked is_available, which for s3 builds a
+    # boto3 session, so it is not asked again here
+    return [{"name": name, "available": get_connector(name) is not None} for name in _CONNECTORS]
@@ -2,13 +2,41 @@
 
 from __future__ import annotations
 
+import os
+import re
+import shutil
+import tempfile
+import zipfile
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Callable, Collection, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, BinaryIO
 
+# Downloads up to this size stay in memory; larger ones spill to a temp file
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+# Read size for response bodies and copy size for archive members
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+COPY_CHUNK_SIZE = 1024 * 1024
 
-@dataclass
+# Selects zip members to extract: one name, a collection of names, or a
+# compiled pattern matched against the whole name (None = all members)
+MemberFilter = str | Collection[str] | re.Pattern[str] | None
+
+
+def _member_matcher(members: MemberFilter) -> Callable[[str], bool] | None:
+    """Turn a MemberFilter into a predicate on member names."""
+    if members is None:
+        return None
+    if isinstance(members, re.Pattern):
+        return lambda name: members.fullmatch(name) is not None
+    if isinstance(members, str):
+        return lambda name: name == members
+    return frozenset(members).__contains__
+
+
+@dataclass(frozen=True, slots=True)
 class ConnectorResult:
     """Result from fetching inputs via a connector.
 
@@ -21,43 +49,50 @@ class ConnectorResult:
     """
     success: bool
     local_path: Path | None = None
-    files: list[str] = None  # type: ignore[assignment]
-    metadata: dict[str, Any] = None  # type: ignore[assignment]
+    files: list[str] = field(default_factory=list)
+    metadata: dict[str, Any] = field(default_factory=dict)
     error: str | None = None
 
-    def __post_init__(self):
-        """Initialize default values for optional fields."""
-        if self.files is None:
-            self.files = []
-        if self.metadata is None:
-            self.metadata = {}
 
+# Dangerous extensions blocked unless a config supplies its own list
+_DEFAULT_BLOCKED_EXTENSIONS = frozenset({
+    ".exe", ".dll", ".bat", ".cmd", ".sh", ".bin",
+    ".so", ".dylib", ".app", ".msi", ".dmg", ".pkg",
+})
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ConnectorConfig:
     """Base configuration for connectors.
 
     Attributes:
         max_size_bytes: Maximum total size of inputs to fetch (default 100MB)
         max_files: Maximum number of files to fetch (default 1000)
-        allowed_extensions: List of allowed file extensions (None = all)
-        blocked_extensions: List of blocked file extensions
+        allowed_extensions: Allowed file extensions (None = all)
+        blocked_extensions: Blocked file extensions
         sanitize_paths: Whether to sanitize paths for security
+        extract_workers: Threads used to extract zip members (default 1)
+        copy_workers: Threads used to copy files from a local directory (default 1)
+        http_cache_dir: Directory for HTTP downloads revalidated by ETag /
+            Last-Modified (None = no caching)
     """
     max_size_bytes: int = 100 * 1024 * 1024  # 100MB
     max_files: int = 1000
-    allowed_extensions: list[str] | None = None
-    blocked_extensions: list[str] = None  # type: ignore[assignment]
+    allowed_extensions: Collection[str] | None = None
+    blocked_extensions: Collection[str] = _DEFAULT_BLOCKED_EXTENSIONS
     sanitize_paths: bool = True
+    extract_workers: int = 1
+    copy_workers: int = 1
+    http_cache_dir: Path | None = None
 
     def __post_init__(self):
-        """Initialize default blocked extensions."""
+        """Store the extension lists as frozensets for O(1) membership checks."""
+        if self.allowed_extensions is not None:
+            object.__setattr__(self, 'allowed_extensions', frozenset(self.allowed_extensions))
         if self.blocked_extensions is None:
-            # Block dangerous extensions
-            self.blocked_extensions = [
-                ".exe", ".dll", ".bat", ".cmd", ".sh", ".bin",
-                ".so", ".dylib", ".app", ".msi", ".dmg", ".pkg",
-            ]
+            object.__setattr__(self, 'blocked_extensions', _DEFAULT_BLOCKED_EXTENSIONS)
+        else:
+            object.__setattr__(self, 'blocked_extensions', frozenset(self.blocked_extensions))
 
 
 class BaseConnector(ABC):
@@ -114,25 +149,161 @@ class BaseConnector(ABC):
 
         # Check for path traversal attempts
         # Block absolute paths that could escape
-        if (path.startswith('/') or path.startswith('\\')) and '..' in path:
+        if path[:1] in ('/', '\\') and '..' in path:
             return False
 
-        # Check extension
-        if self.config.blocked_extensions:
-            ext = Path(path).suffix.lower()
-            if ext in self.config.blocked_extensions:
+        # Check extension (a string split; no Path object needed)
+        blocked = self.config.blocked_extensions
+        allowed = self.config.allowed_extensions
+        if blocked or allowed:
+            ext = os.path.splitext(path)[1].lower()
+            if blocked and ext in blocked:
                 return False
-
-        if self.config.allowed_extensions:
-            ext = Path(path).suffix.lower()
-            if ext not in self.config.allowed_extensions:
+            if allowed and ext not in allowed:
                 return False
 
         return True
 
+    @staticmethod
+    def iter_sized_entries(root: Path | str) -> Iterator[tuple[os.DirEntry[str], int]]:
+        """Walk root recursively, yielding each regular file with its size.
+
+        Files come in the same order as Path.rglob("*"): a directory's own
+        entries first, then its subdirectories depth-first. Symlinked
+        directories are not descended into. Sizes come from the DirEntry's
+        cached stat result, so each file is stat'ed at most once.
+
+        Args:
+            root: Directory to walk
+
+        Yields:
+            (entry, size in bytes) for every file under root
+        """
+        subdirs = []
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file():
+                    yield entry, entry.stat().st_size
+        for subdir in subdirs:
+            yield from BaseConnector.iter_sized_entries(subdir)
+
+    @staticmethod
+    def spool_download(response: BinaryIO, limit: int | None = None) -> IO[bytes] | None:
+        """Read a response body into a spooled temporary file.
+
+        The body is read in chunks, so at most SPOOL_MAX_SIZE bytes are
+        held in memory and an oversized download is abandoned as soon as
+        it passes the limit rather than after it has been read in full.
+
+        Args:
+            response: Readable response body
+            limit: Maximum body size in bytes (None = unlimited)
+
+        Returns:
+            The body, rewound to the start, or None if it exceeded limit
+        """
+        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        total = 0
+        while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+            total += len(chunk)
+            if limit is not None and total > limit:
+                spool.close()
+                return None
+            spool.write(chunk)
+        spool.seek(0)
+        return spool
+
+    def extract_zip_members(
+        self, archive: IO[bytes], destination: Path, members: MemberFilter = None
+    ) -> tuple[list[str], int, list[str]]:
+        """Extract a zip archive's files into destination, within the config limits.
+
+        Members are copied out in COPY_CHUNK_SIZE pieces, so a large member
+        is never held in memory whole. The limits are applied in a serial
+        pass over the archive index first, so the same members are chosen
+        however many extract_workers copy them out. Members left out by
+        the members filter are never decompressed and do not count
+        towards the limits.
+
+        Args:
+            archive: Seekable zip archive
+            destination: Destination directory
+            members: Only extract matching members (None = all)
+
+        Returns:
+            Tuple of (extracted member names, total uncompressed bytes, errors)
+
+        Raises:
+            zipfile.BadZipFile: If archive is not a valid zip file
+        """
+        selected: list[zipfile.ZipInfo] = []
+        total_size = 0
+        errors: list[str] = []
+        created_dirs: set[Path] = set()
+        # Resolved once; each member is then checked with string operations
+        root = os.path.join(os.path.realpath(destination), "")
+        wanted = _member_matcher(members)
+
+        with zipfile.ZipFile(archive) as zf:
+            for info in zf.infolist():
+                # Skip directories and members the caller did not ask for
+                member = info.filename
+                if info.is_dir() or (wanted is not None and not wanted(member)):
+                    continue
+
+                # Validate path
+                if not self.validate_path(member):
+                    errors.append(f"Skipped blocked file: {member}")
+                    continue
+
+                # Keep relative members (e.g. "a/../../x") inside destination
+                if not os.path.normpath(os.path.join(root, member)).startswith(root):
+                    errors.append(f"Skipped path outside destination: {member}")
+                    continue
+
+                # Check file count
+                if len(selected) >= self.config.max_files:
+                    errors.append(f"Reached max file limit ({self.config.max_files})")
+                    break
+
+                # Check size limit
+                if not self.check_size_limit(total_size, info.file_size):
+                    errors.append(f"Reached max size limit ({self.config.max_size_bytes} bytes)")
+                    break
+
+                # Members cluster in a few directories; create each one once
+                parent = (destination / member).parent
+                if parent not in created_dirs:
+                    parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(parent)
+                selected.append(info)
+                total_size += info.file_size
+
+            def extract(info: zipfile.ZipInfo) -> None:
+                # ZipFile serializes the underlying reads, so members can be
+                # decompressed (zlib releases the GIL) on several threads
+                with zf.open(info) as src, open(destination / info.filename, "wb") as dst:
+                    shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+
+            workers = min(self.config.extract_workers, len(selected))
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    list(executor.map(extract, selected))
+            else:
+                for info in selected:
+                    extract(info)
+
+        return [info.filename for info in selected], total_size, errors
+
     def check_size_limit(self, current_size: int, new_file_size: int) -> bool:
         """Check if adding a file would exceed size limit.
 
+        new_file_size should come from metadata already at hand (an archive
+        listing, an object listing, or iter_sized_entries()) rather than a
+        fresh stat per file.
+
         Args:
             current_size: Current total size in bytes
             new_file_size: Size of file to add
@@ -2,18 +2,28 @@
 
 from __future__ import annotations
 
-import io
-import json
 import os
-import zipfile
-from typing import TYPE_CHECKING
+import re
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, cast
 from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
-from truthcore.connectors.base import BaseConnector, ConnectorConfig, ConnectorResult
+from truthcore import jsonio
+from truthcore.connectors.base import BaseConnector, ConnectorConfig, ConnectorResult, MemberFilter
 
-if TYPE_CHECKING:
-    from pathlib import Path
+_NEXT_LINK = re.compile(r'<([^>]+)>\s*;\s*rel="next"')
+
+
+def _next_page_url(link_header: str) -> str | None:
+    """Return the rel="next" URL from a GitHub Link header, if any."""
+    match = _NEXT_LINK.search(link_header)
+    return match.group(1) if match else None
 
 
 class GitHubActionsConnector(BaseConnector):
@@ -29,6 +39,10 @@ class GitHubActionsConnector(BaseConnector):
     """
 
     GITHUB_API_URL = "https://api.github.com"
+    # Wait for the rate limit window to reset once fewer requests than this remain
+    RATE_LIMIT_THRESHOLD = 5
+    # Longest wait (seconds) for a rate limit; longer ones fail instead of stalling
+    RATE_LIMIT_MAX_WAIT = 300.0
 
     def __init__(self, config: ConnectorConfig | None = None, token: str | None = None):
         """Initialize with optional GitHub token.
@@ -39,6 +53,16 @@ class GitHubActionsConnector(BaseConnector):
         """
         super().__init__(config)
         self._token = token or os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+        # Shared by every API request; urllib copies them into each Request
+        self._headers = {
+            "Authorization": f"Bearer {self._token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        # Last X-RateLimit-Remaining / X-RateLimit-Reset seen, shared by fetch_many's threads
+        self._rate_limit_lock = threading.Lock()
+        self._rate_limit_remaining: int | None = None
+        self._rate_limit_reset = 0.0
 
     @property
     def name(self) -> str:
@@ -50,13 +74,14 @@ class GitHubActionsConnector(BaseConnector):
         """Check if GitHub token is configured."""
         return self._token is not None and len(self._token) > 0
 
-    def fetch(self, source: str, destination: Path) -> ConnectorResult:
+    def fetch(self, source: str, destination: Path, members: MemberFilter = None) -> ConnectorResult:
         """Download artifact from GitHub Actions.
 
         Args:
             source: Source in format "owner/repo/run_id/artifact_name" or
                    "github://owner/repo/run_id/artifact_name"
             destination: Destination directory for extracted artifact
+            members: Only extract matching members of the artifact (None = all)
 
         Returns:
             ConnectorResult with status and file list
@@ -89,20 +114,161 @@ class GitHubActionsConnector(BaseConnector):
                 )
 
             # Download and extract
-            return self._download_and_extract(download_url, destination, owner, repo, run_id, artifact_name)
+            return self._download_and_extract(
+                download_url, destination, owner, repo, run_id, artifact_name, members
+            )
 
-        except HTTPError as e:
-            if e.code == 401:
+        except Exception as e:
+            return self._error_result(e)
+
+    def fetch_many(self, sources: list[str], destination: Path) -> list[ConnectorResult]:
+        """Download several artifacts concurrently.
+
+        Sources from the same workflow run share one artifact listing, and
+        the downloads then run on a thread pool. Each artifact is extracted
+        into its own destination / artifact_name directory.
+
+        Args:
+            sources: Sources in any format accepted by fetch()
+            destination: Parent directory for the extracted artifacts
+
+        Returns:
+            One ConnectorResult per source, in the same order
+        """
+        if not self.is_available:
+            return [self.fetch(source, destination) for source in sources]
+
+        results: list[ConnectorResult | None] = [None] * len(sources)
+        runs: dict[tuple[str, str, str], list[tuple[int, str]]] = {}
+        for index, source in enumerate(sources):
+            parsed = self._parse_source(source)
+            if not parsed or Path(parsed[3]).name != parsed[3]:
+                results[index] = ConnectorResult(
+                    success=False,
+                    error=f"Invalid source format: {source}. Expected: owner/repo/run_id/artifact_name"
+                )
+                continue
+            owner, repo, run_id, artifact_name = parsed
+            runs.setdefault((owner, repo, run_id), []).append((index, artifact_name))
+
+        downloads = []
+        for (owner, repo, run_id), wanted in runs.items():
+            try:
+                urls: dict[str, str] = {}
+                for artifact in self._iter_artifacts(owner, repo, run_id):
+                    urls.setdefault(artifact.get("name"), artifact.get("archive_download_url"))
+            except Exception as e:
+                for index, _ in wanted:
+                    results[index] = self._error_result(e)
+                continue
+            for index, artifact_name in wanted:
+                if not urls.get(artifact_name):
+                    results[index] = ConnectorResult(
+                        success=False,
+                        error=f"Artifact '{artifact_name}' not found in run {run_id}"
+                    )
+                else:
+                    downloads.append((index, urls[artifact_name], owner, repo, run_id, artifact_name))
+
+        def download(job: tuple[int, str, str, str, str, str]) -> tuple[int, ConnectorResult]:
+            index, url, owner, repo, run_id, artifact_name = job
+            artifact_dir = destination / artifact_name
+            try:
+                artifact_dir.mkdir(parents=True, exist_ok=True)
+                return index, self._download_and_extract(url, artifact_dir, owner, repo, run_id, artifact_name)
+            except Exception as e:
+                return index, self._error_result(e)
+
+        if downloads:
+            with ThreadPoolExecutor(max_workers=min(16, len(downloads))) as executor:
+                for index, result in executor.map(download, downloads):
+                    results[index] = result
+
+        return cast("list[ConnectorResult]", results)
+
+    @staticmethod
+    def _error_result(error: Exception) -> ConnectorResult:
+        """Map an API or network failure to a ConnectorResult."""
+        if isinstance(error, HTTPError):
+            if error.code == 401:
                 return ConnectorResult(success=False, error="GitHub authentication failed (401)")
-            elif e.code == 404:
+            elif error.code == 404:
                 return ConnectorResult(success=False, error="Artifact or repository not found (404)")
-            elif e.code == 403:
+            elif error.code == 403:
                 return ConnectorResult(success=False, error="GitHub API rate limit exceeded (403)")
-            return ConnectorResult(success=False, error=f"GitHub API error: {e.code}")
-        except URLError as e:
-            return ConnectorResult(success=False, error=f"Network error: {e.reason}")
-        except Exception as e:
-            return ConnectorResult(success=False, error=f"Error: {e}")
+            return ConnectorResult(success=False, error=f"GitHub API error: {error.code}")
+        if isinstance(error, URLError):
+            return ConnectorResult(success=False, error=f"Network error: {error.reason}")
+        return ConnectorResult(success=False, error=f"Error: {error}")
+
+    def _open(self, req: Request, timeout: float) -> Any:
+        """Open an API request, pacing calls by GitHub's rate limit headers.
+
+        Waits for the rate limit window to reset before the call when few
+        requests remain, and retries once after a 403/429 rate limit
+        response that says how long to wait (Retry-After or X-RateLimit-Reset).
+
+        Args:
+            req: Request to open
+            timeout: Socket timeout in seconds
+
+        Returns:
+            The urlopen() response
+        """
+        with self._rate_limit_lock:
+            if self._rate_limit_remaining is not None and self._rate_limit_remaining < self.RATE_LIMIT_THRESHOLD:
+                delay = self._rate_limit_reset - time.time()
+                if 0 < delay <= self.RATE_LIMIT_MAX_WAIT:
+                    time.sleep(delay)
+                self._rate_limit_remaining = None
+
+        try:
+            response = urlopen(req, timeout=timeout)
+        except HTTPError as e:
+            self._record_rate_limit(e.headers)
+            delay = self._rate_limit_delay(e)
+            if delay is None:
+                raise
+            time.sleep(delay)
+            response = urlopen(req, timeout=timeout)
+        self._record_rate_limit(response.headers)
+        return response
+
+    def _record_rate_limit(self, headers: Any) -> None:
+        """Remember the rate limit headers of an API response, if it has them."""
+        remaining = (headers or {}).get("X-RateLimit-Remaining")
+        reset = (headers or {}).get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            with self._rate_limit_lock:
+                self._rate_limit_remaining = int(remaining)
+                self._rate_limit_reset = float(reset)
+        except ValueError:
+            pass
+
+    def _rate_limit_delay(self, error: HTTPError) -> float | None:
+        """Return how long to wait before retrying a rate limited request.
+
+        Returns:
+            Seconds to wait, or None if the error is not a rate limit or the
+            wait would exceed RATE_LIMIT_MAX_WAIT
+        """
+        if error.code not in (403, 429):
+            return None
+        headers = error.headers or {}
+        retry_after = headers.get("Retry-After")
+        reset = headers.get("X-RateLimit-Reset")
+        try:
+            if retry_after is not None:
+                delay = float(retry_after)
+            elif headers.get("X-RateLimit-Remaining") == "0" and reset is not None:
+                delay = float(reset) - time.time()
+            else:
+                return None
+        except ValueError:
+            return None
+        return max(0.0, delay) if delay <= self.RATE_LIMIT_MAX_WAIT else None
 
     def _parse_source(self, source: str) -> tuple[str, str, str, str] | None:
         """Parse source string into components.
@@ -147,25 +313,47 @@ class GitHubActionsConnector(BaseConnector):
         Returns:
             Download URL or None if not found
         """
-        url = f"{self.GITHUB_API_URL}/repos/{owner}/{repo}/actions/runs/{run_id}/artifacts"
-
-        req = Request(url)
-        req.add_header("Authorization", f"Bearer {self._token}")
-        req.add_header("Accept", "application/vnd.github+json")
-        req.add_header("X-GitHub-Api-Version", "2022-11-28")
-
-        with urlopen(req, timeout=30) as response:
-            data = json.loads(response.read().decode("utf-8"))
-
-        # Find matching artifact
-        for artifact in data.get("artifacts", []):
+        # Let the API filter by name, but still check each name in case the
+        # filter is ignored and the artifact is past the first page
+        for artifact in self._iter_artifacts(owner, repo, run_id, artifact_name):
             if artifact.get("name") == artifact_name:
                 return artifact.get("archive_download_url")
 
         return None
 
+    def _iter_artifacts(
+        self, owner: str, repo: str, run_id: str, name: str | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Yield a workflow run's artifacts, following Link rel="next" pages lazily.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            run_id: Workflow run ID
+            name: Only list artifacts with this name
+
+        Yields:
+            Artifact objects from the GitHub API
+        """
+        query = urlencode({"name": name, "per_page": 100} if name is not None else {"per_page": 100})
+        url: str | None = f"{self.GITHUB_API_URL}/repos/{owner}/{repo}/actions/runs/{run_id}/artifacts?{query}"
+
+        while url:
+            req = Request(url, headers=self._headers)
+            with self._open(req, timeout=30) as response:
+                data = jsonio.loads(response.read())
+                url = _next_page_url(response.headers.get("Link", ""))
+            yield from data.get("artifacts", [])
+
     def _download_and_extract(
-        self, download_url: str, destination: Path, owner: str, repo: str, run_id: str, artifact_name: str
+        self,
+        download_url: str,
+        destination: Path,
+        owner: str,
+        repo: str,
+        run_id: str,
+        artifact_name: str,
+        members: MemberFilter = None,
     ) -> ConnectorResult:
         """Download artifact zip and extract to destination.
 
@@ -176,56 +364,19 @@ class GitHubActionsConnector(BaseConnector):
             repo: Repository name
             run_id: Workflow run ID
             artifact_name: Artifact name
+            members: Only extract matching members (None = all)
 
         Returns:
             ConnectorResult
         """
-        req = Request(download_url)
-        req.add_header("Authorization", f"Bearer {self._token}")
-        req.add_header("Accept", "application/vnd.github+json")
-
-        files_extracted: list[str] = []
-        total_size = 0
-        errors: list[str] = []
+        req = Request(download_url, headers=self._headers)
 
-        with urlopen(req, timeout=60) as response:
-            zip_data = response.read()
+        with self._open(req, timeout=60) as response:
+            archive = self.spool_download(response)
 
         # Extract zip
-        with zipfile.ZipFile(io.BytesIO(zip_data)) as zf:
-            for member in zf.namelist():
-                # Skip directories
-                if member.endswith("/"):
-                    continue
-
-                # Validate path
-                if not self.validate_path(member):
-                    errors.append(f"Skipped blocked file: {member}")
-                    continue
-
-                # Check file count
-                if len(files_extracted) >= self.config.max_files:
-                    errors.append(f"Reached max file limit ({self.config.max_files})")
-                    break
-
-                # Get file info
-                info = zf.getinfo(member)
-
-                # Check size limit
-                if not self.check_size_limit(total_size, info.file_size):
-                    errors.append(f"Reached max size limit ({self.config.max_size_bytes} bytes)")
-                    break
-
-                # Extract file
-                dest_path = destination / member
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
-
-                with zf.open(member) as src, open(dest_path, "wb") as dst:
-                    shutil_data = src.read()
-                    dst.write(shutil_data)
-
-                files_extracted.append(member)
-                total_size += info.file_size
+        with archive:
+            files_extracted, total_size, errors = self.extract_zip_members(archive, destination, members)
 
         return ConnectorResult(
             success=True,
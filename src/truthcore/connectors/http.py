@@ -2,16 +2,29 @@
 
 from __future__ import annotations
 
-import io
+import hashlib
+import http.client
+import json
+import os
 import random
+import shutil
 import time
 import zipfile
+import zlib
+from collections.abc import Callable
 from pathlib import Path
+from typing import IO, Any, BinaryIO
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlparse
 from urllib.request import Request, urlopen
 
-from truthcore.connectors.base import BaseConnector, ConnectorConfig, ConnectorResult
+from truthcore.connectors.base import (
+    DOWNLOAD_CHUNK_SIZE,
+    BaseConnector,
+    ConnectorConfig,
+    ConnectorResult,
+    MemberFilter,
+)
 
 # Default retry configuration
 DEFAULT_MAX_RETRIES = 3
@@ -19,6 +32,214 @@ DEFAULT_BASE_DELAY = 1.0  # seconds
 DEFAULT_MAX_DELAY = 30.0  # seconds
 DEFAULT_TIMEOUT = 30  # seconds
 
+ZIP_CONTENT_TYPES = ("application/zip", "application/x-zip-compressed")
+
+
+class HTTPCache:
+    """On-disk copies of downloads, revalidated with conditional requests.
+
+    Each URL is stored as a body file plus a JSON sidecar holding the
+    ETag / Last-Modified validators and content type the server sent.
+    A cached body is only reused after the server answers a conditional
+    request with 304 Not Modified, so it never goes stale.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory holding cached downloads (created on first store)
+        """
+        self.cache_dir = cache_dir
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.body", self.cache_dir / f"{key}.json"
+
+    def lookup(self, url: str) -> dict[str, Any] | None:
+        """Return the stored validators for url, or None if it is not cached."""
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, "rb") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return meta if body_path.exists() else None
+
+    @staticmethod
+    def conditional_headers(meta: dict[str, Any]) -> dict[str, str]:
+        """Build the If-None-Match / If-Modified-Since headers for a cached entry."""
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    @staticmethod
+    def storable(headers: Any) -> bool:
+        """Return whether a response can be revalidated later and may be stored."""
+        if "no-store" in headers.get("Cache-Control", "").lower():
+            return False
+        return bool(headers.get("ETag") or headers.get("Last-Modified"))
+
+    def body_path(self, url: str) -> Path:
+        """Return the path of the cached body for url."""
+        return self._paths(url)[0]
+
+    def store(self, url: str, response: BinaryIO, headers: Any, limit: int) -> dict[str, Any] | None:
+        """Save a response body and its validators, replacing any older copy.
+
+        Args:
+            url: Requested URL
+            response: Response body
+            headers: Response headers
+            limit: Maximum body size in bytes
+
+        Returns:
+            The stored validators, or None if the body exceeded limit
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        body_path, meta_path = self._paths(url)
+        tmp_path = body_path.with_suffix(".tmp")
+        self.discard(url)
+        total = 0
+        try:
+            with open(tmp_path, "wb") as f:
+                while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+                    total += len(chunk)
+                    if total > limit:
+                        break
+                    f.write(chunk)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        if total > limit:
+            tmp_path.unlink()
+            return None
+
+        meta = {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "content_type": headers.get("Content-Type", ""),
+        }
+        os.replace(tmp_path, body_path)
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        return meta
+
+    def discard(self, url: str) -> None:
+        """Remove any cached copy of url."""
+        for path in self._paths(url):
+            path.unlink(missing_ok=True)
+
+
+class _ResumableBody:
+    """A response body that picks up where it left off if the connection drops.
+
+    When the server advertised Accept-Ranges: bytes, a read that fails
+    part-way (reset, timeout, truncated body) reopens the URL with a
+    Range request for the remaining bytes, guarded by If-Range on the
+    ETag, and carries on. Readers only ever see read(); a server that
+    answers with anything but 206 Partial Content re-raises the original
+    error rather than restarting a body that has already been consumed.
+    """
+
+    def __init__(
+        self,
+        req: Request,
+        response: Any,
+        timeout: float,
+        max_resumes: int,
+        backoff: Callable[[int], float],
+    ) -> None:
+        self.headers = response.headers
+        self._req = req
+        self._response = response
+        self._timeout = timeout
+        self._backoff = backoff
+        accepts_ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+        self._resumes_left = max_resumes if accepts_ranges else 0
+        self._resumes = 0
+        self._position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes, resuming the transfer if it is interrupted."""
+        while True:
+            try:
+                chunk = self._response.read(size)
+            except (OSError, http.client.IncompleteRead) as e:
+                if not self._resumes_left:
+                    raise
+                self._resume(e)
+                continue
+            self._position += len(chunk)
+            return chunk
+
+    def _resume(self, error: Exception) -> None:
+        self._resumes_left -= 1
+        time.sleep(self._backoff(self._resumes))
+        self._resumes += 1
+        self._response.close()
+
+        headers = dict(self._req.header_items())
+        headers["Range"] = f"bytes={self._position}-"
+        etag = self.headers.get("ETag")
+        if etag:
+            headers["If-Range"] = etag
+        response = urlopen(Request(self._req.full_url, headers=headers), timeout=self._timeout)
+        if response.status != 206:
+            response.close()
+            raise error
+        self._response = response
+
+    def close(self) -> None:
+        """Close the current connection."""
+        self._response.close()
+
+    def __enter__(self) -> _ResumableBody:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class _DecodedBody:
+    """A response body with its gzip or deflate Content-Encoding undone as it is read.
+
+    Decompression is incremental and capped at the requested read size,
+    so size limits apply to decoded bytes without buffering the body.
+    """
+
+    def __init__(self, response: Any, encoding: str) -> None:
+        self.headers = response.headers
+        self._response = response
+        wbits = 16 + zlib.MAX_WBITS if encoding == "gzip" else zlib.MAX_WBITS
+        self._decompressor = zlib.decompressobj(wbits)
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size decoded bytes (everything remaining if size < 0)."""
+        if size < 0:
+            return b"".join(iter(lambda: self.read(DOWNLOAD_CHUNK_SIZE), b""))
+        while True:
+            data = self._decompressor.unconsumed_tail
+            if not data:
+                data = self._response.read(DOWNLOAD_CHUNK_SIZE)
+                if not data:
+                    return self._decompressor.flush()
+            decoded = self._decompressor.decompress(data, size)
+            if decoded:
+                return decoded
+
+
+def _decode_content(response: Any) -> Any:
+    """Wrap response to undo a gzip/deflate Content-Encoding, if it has one."""
+    encoding = response.headers.get("Content-Encoding", "").strip().lower()
+    if encoding in ("gzip", "x-gzip", "deflate"):
+        return _DecodedBody(response, "deflate" if encoding == "deflate" else "gzip")
+    return response
+
 
 class HTTPConnector(BaseConnector):
     """Connector for fetching artifacts via HTTP(S).
@@ -76,6 +297,7 @@ class HTTPConnector(BaseConnector):
         destination: Path,
         max_retries: int = DEFAULT_MAX_RETRIES,
         timeout: int = DEFAULT_TIMEOUT,
+        members: MemberFilter = None,
     ) -> ConnectorResult:
         """Download artifact from HTTP(S) URL with retry logic.
 
@@ -84,6 +306,7 @@ class HTTPConnector(BaseConnector):
             destination: Destination directory for downloaded content
             max_retries: Maximum number of retry attempts
             timeout: Request timeout in seconds
+            members: For zip archives, only extract matching members (None = all)
 
         Returns:
             ConnectorResult with status and file list
@@ -107,34 +330,51 @@ class HTTPConnector(BaseConnector):
 
         last_error: Exception | None = None
 
+        cache_dir = self.config.http_cache_dir
+        cache = HTTPCache(cache_dir) if cache_dir is not None else None
+        cached = cache.lookup(source) if cache is not None else None
+
+        # Built once; a Request can be passed to urlopen() again on retry
+        req = Request(source)
+        req.add_header("User-Agent", "truth-core/0.2.0")
+        req.add_header("Accept-Encoding", "gzip, deflate")
+        if cached is not None:
+            for header, value in HTTPCache.conditional_headers(cached).items():
+                req.add_header(header, value)
+
         for attempt in range(max_retries + 1):
             try:
-                req = Request(source)
-                req.add_header("User-Agent", "truth-core/0.2.0")
-
-                with urlopen(req, timeout=timeout) as response:
+                opened = urlopen(req, timeout=timeout)
+                with _ResumableBody(req, opened, timeout, max_retries, self._calculate_backoff) as response:
                     content_type = response.headers.get("Content-Type", "")
-                    data = response.read()
+                    content = _decode_content(response)
+
+                    if cache is not None:
+                        if HTTPCache.storable(response.headers):
+                            cached = cache.store(source, content, response.headers, self.config.max_size_bytes)
+                            if cached is None:
+                                return self._size_limit_error()
+                            return self._fetch_cached(cache, source, cached, destination, parsed.path, members)
+                        cache.discard(source)
+
+                    # Single files are written out as they arrive; a zip
+                    # needs its central directory, at the end, before
+                    # anything can be extracted
+                    if not self._is_zip(source, content_type):
+                        return self._save_file(content, destination, source, parsed.path)
+                    body = self.spool_download(content, self.config.max_size_bytes)
 
                 # Check size limit
-                if len(data) > self.config.max_size_bytes:
-                    return ConnectorResult(
-                        success=False,
-                        error=f"Downloaded content exceeds size limit ({self.config.max_size_bytes} bytes)"
-                    )
-
-                # Determine if it's a zip file
-                is_zip = (
-                    source.endswith(".zip") or
-                    content_type in ("application/zip", "application/x-zip-compressed")
-                )
-
-                if is_zip:
-                    return self._extract_zip(data, destination, source)
-                else:
-                    return self._save_file(data, destination, source, parsed.path)
+                if body is None:
+                    return self._size_limit_error()
+
+                with body:
+                    return self._extract_zip(body, destination, source, members)
 
             except HTTPError as e:
+                # Unchanged since it was cached
+                if e.code == 304 and cache is not None and cached is not None:
+                    return self._fetch_cached(cache, source, cached, destination, parsed.path, members)
                 # Don't retry on 4xx client errors (except 429 rate limit)
                 if e.code in (400, 401, 403, 404, 405, 422) and attempt == 0:
                     return ConnectorResult(success=False, error=f"HTTP error: {e.code}")
@@ -171,83 +411,93 @@ class HTTPConnector(BaseConnector):
                 success=False, error=f"Error after {max_retries + 1} attempts: {last_error}"
             )
 
-    def _extract_zip(self, data: bytes, destination: Path, source: str) -> ConnectorResult:
+    @staticmethod
+    def _is_zip(source: str, content_type: str) -> bool:
+        """Return whether a download should be treated as a zip archive."""
+        return source.endswith(".zip") or content_type in ZIP_CONTENT_TYPES
+
+    def _fetch_cached(
+        self,
+        cache: HTTPCache,
+        source: str,
+        meta: dict[str, Any],
+        destination: Path,
+        path: str,
+        members: MemberFilter = None,
+    ) -> ConnectorResult:
+        """Extract or copy a cached download into destination.
+
+        Args:
+            cache: Cache holding the download
+            source: Original source URL
+            meta: Stored validators and content type for source
+            destination: Destination directory
+            path: URL path component
+            members: For zip archives, only extract matching members (None = all)
+
+        Returns:
+            ConnectorResult
+        """
+        body_path = cache.body_path(source)
+        if self._is_zip(source, meta["content_type"]):
+            with open(body_path, "rb") as body:
+                return self._extract_zip(body, destination, source, members)
+        return self._save_file(body_path, destination, source, path)
+
+    def _extract_zip(
+        self, archive: IO[bytes], destination: Path, source: str, members: MemberFilter = None
+    ) -> ConnectorResult:
         """Extract zip file to destination.
 
         Args:
-            data: Zip file data
+            archive: Downloaded zip file
             destination: Destination directory
             source: Original source URL
+            members: Only extract matching members (None = all)
 
         Returns:
             ConnectorResult
         """
-        files_extracted: list[str] = []
-        total_size = 0
-        errors: list[str] = []
-
         try:
-            with zipfile.ZipFile(io.BytesIO(data)) as zf:
-                for member in zf.namelist():
-                    # Skip directories
-                    if member.endswith("/"):
-                        continue
-
-                    # Validate path
-                    if not self.validate_path(member):
-                        errors.append(f"Skipped blocked file: {member}")
-                        continue
-
-                    # Check file count
-                    if len(files_extracted) >= self.config.max_files:
-                        errors.append(f"Reached max file limit ({self.config.max_files})")
-                        break
-
-                    # Get file info
-                    info = zf.getinfo(member)
-
-                    # Check size limit
-                    if not self.check_size_limit(total_size, info.file_size):
-                        errors.append(f"Reached max size limit ({self.config.max_size_bytes} bytes)")
-                        break
-
-                    # Extract file
-                    dest_path = destination / member
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-
-                    with zf.open(member) as src, open(dest_path, "wb") as dst:
-                        file_data = src.read()
-                        dst.write(file_data)
-
-                    files_extracted.append(member)
-                    total_size += info.file_size
-
-            return ConnectorResult(
-                success=True,
-                local_path=destination,
-                files=files_extracted,
-                metadata={
-                    "source": source,
-                    "type": "zip",
-                    "files_extracted": len(files_extracted),
-                    "total_bytes": total_size,
-                    "errors": errors if errors else None,
-                }
-            )
-
+            files_extracted, total_size, errors = self.extract_zip_members(archive, destination, members)
         except zipfile.BadZipFile:
             return ConnectorResult(
                 success=False,
                 error="Downloaded file is not a valid ZIP archive"
             )
 
+        return ConnectorResult(
+            success=True,
+            local_path=destination,
+            files=files_extracted,
+            metadata={
+                "source": source,
+                "type": "zip",
+                "files_extracted": len(files_extracted),
+                "total_bytes": total_size,
+                "errors": errors if errors else None,
+            }
+        )
+
+    def _size_limit_error(self) -> ConnectorResult:
+        """Return the result for a download over max_size_bytes."""
+        return ConnectorResult(
+            success=False,
+            error=f"Downloaded content exceeds size limit ({self.config.max_size_bytes} bytes)"
+        )
+
     def _save_file(
-        self, data: bytes, destination: Path, source: str, path: str
+        self, response: BinaryIO | Path, destination: Path, source: str, path: str
     ) -> ConnectorResult:
-        """Save single file to destination.
+        """Stream a single file to destination as it is downloaded.
+
+        The filename is checked before the body is read, and a partial file
+        is removed if the download fails or passes the size limit. A body
+        already on disk (a cached download) is copied with
+        shutil.copyfile(), which stays in the kernel (sendfile) on Linux.
 
         Args:
-            data: File data
+            response: Response body, or the path of a downloaded body
             destination: Destination directory
             source: Original source URL
             path: URL path component
@@ -276,9 +526,33 @@ class HTTPConnector(BaseConnector):
                 error="Filename contains path traversal attempt"
             )
 
-        with open(dest_file, "wb") as f:
-            f.write(data)
+        limit = self.config.max_size_bytes
+        if isinstance(response, Path):
+            total_size = response.stat().st_size
+            if total_size > limit:
+                return self._size_limit_error()
+            shutil.copyfile(response, dest_file)
+            return self._saved_file_result(destination, filename, source, total_size)
 
+        total_size = 0
+        try:
+            with open(dest_file, "wb") as f:
+                while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+                    total_size += len(chunk)
+                    if total_size > limit:
+                        break
+                    f.write(chunk)
+        except BaseException:
+            dest_file.unlink(missing_ok=True)
+            raise
+        if total_size > limit:
+            dest_file.unlink()
+            return self._size_limit_error()
+        return self._saved_file_result(destination, filename, source, total_size)
+
+    @staticmethod
+    def _saved_file_result(destination: Path, filename: str, source: str, total_size: int) -> ConnectorResult:
+        """Build the result for a single saved file."""
         return ConnectorResult(
             success=True,
             local_path=destination,
@@ -287,6 +561,6 @@ class HTTPConnector(BaseConnector):
                 "source": source,
                 "type": "file",
                 "files_extracted": 1,
-                "total_bytes": len(data),
+                "total_bytes": total_size,
             }
         )
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -73,37 +75,46 @@ class LocalConnector(BaseConnector):
                 total_size = file_size
                 file_count = 1
             else:
-                # Directory - walk and copy
-                for src_file in source_path.rglob("*"):
-                    if not src_file.is_file():
-                        continue
-
+                # Directory - walk and apply the limits, then copy
+                prefix_len = len(os.path.join(source_path, ""))
+                created_dirs: set[Path] = set()
+                copies: list[tuple[str, Path, str]] = []
+                for entry, file_size in self.iter_sized_entries(source_path):
                     # Check file count limit
                     if file_count >= self.config.max_files:
                         errors.append(f"Reached max file limit ({self.config.max_files})")
                         break
 
                     # Validate path
-                    rel_path = src_file.relative_to(source_path)
-                    if not self.validate_path(str(rel_path)):
+                    rel_path = entry.path[prefix_len:]
+                    if not self.validate_path(rel_path):
                         continue
 
-                    file_size = src_file.stat().st_size
-
                     # Check size limit
                     if not self.check_size_limit(total_size, file_size):
                         errors.append(f"Reached max size limit ({self.config.max_size_bytes} bytes)")
                         break
 
-                    # Copy file
+                    # Create parents here so copy threads only copy
                     dest_file = destination / rel_path
-                    dest_file.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(src_file, dest_file)
-
-                    files_copied.append(str(rel_path))
+                    if dest_file.parent not in created_dirs:
+                        dest_file.parent.mkdir(parents=True, exist_ok=True)
+                        created_dirs.add(dest_file.parent)
+                    copies.append((entry.path, dest_file, rel_path))
                     total_size += file_size
                     file_count += 1
 
+                def copy(job: tuple[str, Path, str]) -> str:
+                    shutil.copy2(job[0], job[1])
+                    return job[2]
+
+                workers = min(self.config.copy_workers, len(copies))
+                if workers > 1:
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        files_copied.extend(executor.map(copy, copies))
+                else:
+                    files_copied.extend(map(copy, copies))
+
             return ConnectorResult(
                 success=True,
                 local_path=destination,
@@ -8,6 +8,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
+from truthcore import jsonio
+
 if TYPE_CHECKING:
     from pathlib import Path
 
@@ -128,11 +130,25 @@ class RunPlan:
             "metadata": dict(sorted(self.metadata.items())),
         }
 
+    def selected_ids(self) -> tuple[list[str], list[str]]:
+        """Return the included engine IDs and invariant rule IDs."""
+        return (
+            [e.engine_id for e in self.engines if e.include],
+            [i.rule_id for i in self.invariants if i.include],
+        )
+
+    def serialize(self) -> bytes:
+        """Serialize run plan to JSON bytes.
+
+        Encoded from the current fields on every call, so edits made after
+        analyze() are always reflected.
+        """
+        return jsonio.dumps(self.to_dict())
+
     def write(self, output_path: Path) -> None:
         """Write run plan to file."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, sort_keys=False)
+        output_path.write_bytes(self.serialize())
 
 
 class GitDiffParser:
@@ -665,14 +681,14 @@ class ChangeImpactEngine:
         selector = EngineSelector(self.changes, profile)
         engine_decisions = selector.select_engines()
 
-        # Get selected engine IDs for invariant selection
-        selected_engines = [e.engine_id for e in engine_decisions if e.include]
-        invariant_decisions = selector.select_invariants(selected_engines)
-
-        # Generate exclusions with reasons
+        # Split engine decisions into selected IDs (for invariant selection)
+        # and exclusions with reasons, in a single pass
+        selected_engines: list[str] = []
         exclusions = []
         for engine in engine_decisions:
-            if not engine.include:
+            if engine.include:
+                selected_engines.append(engine.engine_id)
+            else:
                 exclusions.append(
                     {
                         "type": "engine",
@@ -681,6 +697,7 @@ class ChangeImpactEngine:
                     }
                 )
 
+        invariant_decisions = selector.select_invariants(selected_engines)
         for invariant in invariant_decisions:
             if not invariant.include:
                 exclusions.append(
@@ -719,8 +736,7 @@ class ChangeImpactEngine:
         )
 
         # Compute cache key
-        plan_dict = self.plan.to_dict()
-        self.plan.cache_key = hash_dict(plan_dict)
+        self.plan.cache_key = hash_dict(self.plan.to_dict())
 
         return self.plan
 
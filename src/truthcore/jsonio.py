@@ -0,0 +1,220 @@
+"""Fast JSON reading and writing for CLI and engine hot paths.
+
+Uses orjson when it is installed (``pip install truth-core[fast]``) and
+falls back to the stdlib json module otherwise. Decode failures raise a
+``ValueError`` subclass in both cases (``orjson.JSONDecodeError`` subclasses
+``json.JSONDecodeError``), so callers can catch ``ValueError`` uniformly.
+
+Both backends emit the same layout: UTF-8 bytes, 2-space indentation and
+non-ASCII characters written as-is. Only float exponent notation differs
+(``1e-05`` vs ``0.00001``); parsed values are identical.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Iterator, Mapping
+    from pathlib import Path
+
+# Buffer size for streamed writes
+STREAM_BUFFER_SIZE = 256 * 1024
+
+# orjson is optional - only import if available
+ORJSON_AVAILABLE = find_spec("orjson") is not None
+
+if ORJSON_AVAILABLE:
+    import orjson
+
+# ijson is optional - used to stream selected fields out of large files
+IJSON_AVAILABLE = find_spec("ijson") is not None
+
+if IJSON_AVAILABLE:
+    import ijson
+
+# Files at least this large are streamed by load_fields() when ijson is available
+STREAM_PARSE_THRESHOLD = 64 * 1024
+
+_SCALAR_EVENTS = frozenset({"null", "boolean", "integer", "double", "number", "string"})
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Parse JSON from bytes or str."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def load_file(path: Path | str) -> Any:
+    """Read and parse a JSON file in one pass over its raw bytes."""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def load_mapped(path: Path | str) -> Any:
+    """Parse a JSON file through a read-only memory map.
+
+    With orjson the mapped pages are parsed in place, skipping the copy
+    into a bytes object that read() makes; worthwhile for large inputs.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped; let the parser report them
+            return loads(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if ORJSON_AVAILABLE:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+            return json.loads(mm[:])
+
+
+def load_fields(path: Path | str, fields: Collection[str]) -> Any:
+    """Load only the given top-level keys of a JSON object file.
+
+    Files of STREAM_PARSE_THRESHOLD bytes or more are streamed with ijson
+    when it is installed, so values under other keys are never built as
+    Python objects. Smaller files (or all files without ijson) are parsed
+    whole and then trimmed. Documents that are not objects are returned
+    unchanged.
+
+    Args:
+        path: JSON file to read
+        fields: Top-level keys to keep
+
+    Returns:
+        Dict containing whichever of the fields are present
+    """
+    with open(path, "rb") as f:
+        if IJSON_AVAILABLE and os.fstat(f.fileno()).st_size >= STREAM_PARSE_THRESHOLD:
+            return _stream_fields(f, fields)
+        data = loads(f.read())
+    if not isinstance(data, dict):
+        return data
+    return {key: data[key] for key in fields if key in data}
+
+
+def _stream_fields(f: BinaryIO, fields: Collection[str]) -> Any:
+    """Build only the wanted top-level values from an ijson event stream."""
+    try:
+        return _select_fields(f, ijson.parse(f, use_float=True), fields)
+    except ijson.JSONError as e:
+        # ijson errors do not subclass ValueError; keep the module's contract
+        raise ValueError(str(e)) from e
+
+
+def _select_fields(f: BinaryIO, events: Iterator[tuple[str, str, Any]], fields: Collection[str]) -> Any:
+    first = next(events, None)
+    if first is None or first[1] != "start_map":
+        # Not an object: nothing to select from, so parse it whole
+        f.seek(0)
+        return loads(f.read())
+
+    result: dict[str, Any] = {}
+    key: str | None = None
+    builder = None
+    for prefix, event, value in events:
+        if prefix == "" and event == "map_key":
+            key = value
+            builder = ijson.ObjectBuilder() if key in fields else None
+            continue
+        if builder is None:
+            continue
+        builder.event(event, value)
+        if prefix == key and (event in _SCALAR_EVENTS or event in ("end_map", "end_array")):
+            result[key] = builder.value
+            builder = None
+    return result
+
+
+def dumps(obj: Any, *, indent: bool = True, sort_keys: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with 2-space indentation (compact otherwise)
+        sort_keys: Sort dictionary keys at every level
+
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    if indent:
+        text = json.dumps(obj, indent=2, sort_keys=sort_keys, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, sort_keys=sort_keys, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
+def dump_file(path: Path | str, obj: Any, *, indent: bool = True, sort_keys: bool = False) -> None:
+    """Serialize obj and write it to path.
+
+    The document is encoded to bytes up front and written with one write()
+    call, instead of json.dump's stream of small text-mode writes.
+    """
+    data = dumps(obj, indent=indent, sort_keys=sort_keys)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def dump_files(directory: Path | str, documents: Mapping[str, Any], *, sort_keys: bool = False) -> None:
+    """Write several JSON documents into one directory.
+
+    Every document is encoded before anything is written, then the files
+    are created relative to a single open directory descriptor so the
+    output path is resolved once rather than per file. Platforms without
+    dir_fd support fall back to dump_file().
+
+    Args:
+        directory: Existing output directory
+        documents: Mapping of file name to JSON-serializable object
+        sort_keys: Sort dictionary keys at every level
+    """
+    encoded = [(name, dumps(obj, sort_keys=sort_keys)) for name, obj in documents.items()]
+    if os.open not in os.supports_dir_fd:
+        for name, data in encoded:
+            with open(os.path.join(directory, name), "wb") as f:
+                f.write(data)
+        return
+
+    dir_fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        for name, data in encoded:
+            fd = os.open(name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666, dir_fd=dir_fd)
+            with open(fd, "wb") as f:
+                f.write(data)
+    finally:
+        os.close(dir_fd)
+
+
+def write_nested(f: BinaryIO, obj: Any, *, level: int, sort_keys: bool = False) -> None:
+    """Write an indented value that sits `level` containers deep in a document."""
+    f.write(dumps(obj, sort_keys=sort_keys).replace(b"\n", b"\n" + b"  " * level))
+
+
+def write_array(f: BinaryIO, items: Iterable[Any], *, level: int, sort_keys: bool = False) -> None:
+    """Stream items as an indented JSON array, encoding one element at a time.
+
+    The bytes match what dumps(..., indent=True) produces for the same list
+    nested `level` containers deep, so large collections can be written
+    without first building the whole list (or document) in memory.
+    """
+    item_sep = b"\n" + b"  " * (level + 1)
+    first = True
+    for item in items:
+        f.write(b"[" + item_sep if first else b"," + item_sep)
+        write_nested(f, item, level=level + 1, sort_keys=sort_keys)
+        first = False
+    f.write(b"[]" if first else b"\n" + b"  " * level + b"]")
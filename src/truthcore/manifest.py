@@ -171,6 +171,11 @@ class RunManifest:
     # Additional metadata
     metadata: dict[str, Any] = field(default_factory=lambda: {})
 
+    # Last computed cache key, paired with the fields it was derived from
+    _cache_key_memo: tuple[tuple[Any, ...], str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         """Normalize timestamp after initialization."""
         if not self.timestamp.endswith('Z'):
@@ -290,12 +295,20 @@ class RunManifest:
     def compute_cache_key(self) -> str:
         """Compute cache key from manifest content.
 
-        This combines command, config hash, and input hashes.
+        This combines command, config hash, and input hashes. The result
+        is reused until one of those fields changes.
         """
+        input_hashes = [f.content_hash for f in self.input_files]
+        fingerprint = (self.command, self.config_hash, tuple(input_hashes), self.truthcore_version)
+        if self._cache_key_memo is not None and self._cache_key_memo[0] == fingerprint:
+            return self._cache_key_memo[1]
+
         key_data = {
             "command": self.command,
             "config_hash": self.config_hash,
-            "input_hashes": [f.content_hash for f in self.input_files],
+            "input_hashes": input_hashes,
             "truthcore_version": self.truthcore_version,
         }
-        return hash_dict(key_data)
+        cache_key = hash_dict(key_data)
+        self._cache_key_memo = (fingerprint, cache_key)
+        return cache_key
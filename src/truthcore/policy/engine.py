@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import time
 import uuid
@@ -455,6 +456,12 @@ class PolicyEngine:
         return "\n".join(lines)
 
 
+@functools.lru_cache(maxsize=32)
+def _load_pack_file(path: str, mtime_ns: int, size: int) -> PolicyPack:
+    """Parse a pack file; mtime_ns and size only key the cache."""
+    return PolicyPack.from_yaml(Path(path))
+
+
 class PolicyPackLoader:
     """Loader for built-in and custom policy packs."""
 
@@ -470,6 +477,10 @@ class PolicyPackLoader:
     def load_pack(cls, name_or_path: str) -> PolicyPack:
         """Load a policy pack by name or path.
 
+        Parsed packs are cached per file version (path, mtime, size), so
+        repeated loads of an unchanged pack skip YAML parsing. The returned
+        pack is shared between callers and must not be mutated.
+
         Args:
             name_or_path: Built-in pack name or path to YAML file
 
@@ -480,6 +491,13 @@ class PolicyPackLoader:
             FileNotFoundError: If pack not found
             ValueError: If pack is invalid
         """
+        pack_path = cls._resolve_pack_path(name_or_path)
+        st = pack_path.stat()
+        return _load_pack_file(str(pack_path), st.st_mtime_ns, st.st_size)
+
+    @classmethod
+    def _resolve_pack_path(cls, name_or_path: str) -> Path:
+        """Find the YAML file for a built-in pack name or a path."""
         # Check if built-in
         if name_or_path in cls.BUILT_IN_PACKS:
             # Try to find in package
@@ -492,14 +510,14 @@ class PolicyPackLoader:
                     package_dir = Path(spec.origin).parent
                     pack_path = package_dir / "policy" / "packs" / f"{name_or_path}.yaml"
                     if pack_path.exists():
-                        return PolicyPack.from_yaml(pack_path)
+                        return pack_path
             except Exception:
                 pass
 
             # Fallback to relative path
             pack_path = Path(cls.BUILT_IN_PACKS[name_or_path])
             if pack_path.exists():
-                return PolicyPack.from_yaml(pack_path)
+                return pack_path
 
             raise FileNotFoundError(f"Built-in pack not found: {name_or_path}")
 
@@ -508,7 +526,7 @@ class PolicyPackLoader:
         if not pack_path.exists():
             raise FileNotFoundError(f"Policy pack not found: {name_or_path}")
 
-        return PolicyPack.from_yaml(pack_path)
+        return pack_path
 
     @classmethod
     def list_built_in(cls) -> list[str]:
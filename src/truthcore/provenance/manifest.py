@@ -79,11 +79,10 @@ class ManifestEntry:
         # Compute relative path
         rel_path = str(file_path.relative_to(base_dir)).replace("\\", "/")
 
-        # Compute SHA-256
-        sha256_hash = hashlib.sha256()
+        # Compute SHA-256 (file_digest reads into one reusable buffer and
+        # hands it to OpenSSL, avoiding a new bytes object per chunk)
         with open(safe_path, "rb") as f:
-            while chunk := f.read(8192):
-                sha256_hash.update(chunk)
+            sha256_hash = hashlib.file_digest(f, "sha256")
 
         # Guess content type
         content_type, _ = mimetypes.guess_type(str(file_path))
@@ -11,11 +11,17 @@ If keys not provided, signing is skipped but manifest is still generated.
 from __future__ import annotations
 
 import base64
+import functools
 import hashlib
 import os
 from dataclasses import dataclass
 from importlib.util import find_spec
-from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
 
 
 class SigningError(Exception):
@@ -30,6 +36,18 @@ class VerificationError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=64)
+def _ed25519_public_key(public_key: bytes) -> Ed25519PublicKey:
+    """Decode a raw Ed25519 public key.
+
+    Cached so that verifying many signatures from the same key decodes and
+    validates the curve point once rather than per signature.
+    """
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+
+    return Ed25519PublicKey.from_public_bytes(public_key)
+
+
 @dataclass
 class Signature:
     """Signature data structure (minisign-compatible)."""
@@ -207,9 +225,7 @@ class Signer:
         pub_key = signature.public_key or self._public_key
 
         if self._has_crypto:
-            from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
-
-            verify_key = Ed25519PublicKey.from_public_bytes(pub_key)
+            verify_key = _ed25519_public_key(bytes(pub_key))
             try:
                 verify_key.verify(signature.signature, message)
                 return True
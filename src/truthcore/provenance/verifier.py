@@ -2,16 +2,79 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import mmap
+import os
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from truthcore import jsonio
 from truthcore.provenance.manifest import EvidenceManifest
 from truthcore.provenance.signing import Signature, Signer, VerificationError
 from truthcore.security import SecurityError, SecurityLimits, check_path_safety
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Files at least this large are hashed through a read-only memory map
+MMAP_HASH_THRESHOLD = 64 * 1024
+
+# Bundles with fewer files than this are hashed on the calling thread
+PARALLEL_HASH_MIN_FILES = 8
+
+# Size of the per-thread buffer reused for hashing smaller files
+_HASH_BUFFER_SIZE = 1 << 20
+
+_hash_local = threading.local()
+
+
+def _hash_buffer() -> memoryview:
+    """Return this thread's reusable hashing buffer."""
+    view = getattr(_hash_local, "view", None)
+    if view is None:
+        view = _hash_local.view = memoryview(bytearray(_HASH_BUFFER_SIZE))
+    return view
+
+
+def hash_file(path: Path | str) -> str:
+    """Compute the SHA-256 hex digest of a file.
+
+    Large regular files are mapped and hashed without any read() copies;
+    everything else is read with readinto() into a buffer that is reused
+    across calls, so no bytes object is allocated per chunk.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    hasher = hashlib.sha256()
+    with open(path, "rb", buffering=0) as f:
+        st = os.fstat(f.fileno())
+        if st.st_size >= MMAP_HASH_THRESHOLD and stat.S_ISREG(st.st_mode):
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
+        else:
+            view = _hash_buffer()
+            while n := f.readinto(view):
+                hasher.update(view[:n])
+    return hasher.hexdigest()
+
+
+def _hash_or_error(path: Path) -> str | Exception:
+    """Hash a file, returning the exception instead of raising it."""
+    try:
+        return hash_file(path)
+    except Exception as e:
+        return e
+
 
 @dataclass
 class VerificationResult:
@@ -46,8 +109,7 @@ class VerificationResult:
     def write_json(self, path: Path) -> None:
         """Write to JSON file."""
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, sort_keys=True)
+        jsonio.dump_file(path, self.to_dict(), sort_keys=True)
 
     def write_markdown(self, path: Path) -> None:
         """Write to Markdown file."""
@@ -116,11 +178,32 @@ class BundleVerifier:
         self,
         public_key: bytes | None = None,
         limits: SecurityLimits | None = None,
+        max_workers: int | None = None,
     ) -> None:
         self.public_key = public_key
         self.limits = limits or SecurityLimits()
+        self.max_workers = max_workers
         self._signer = Signer(public_key=public_key) if public_key else None
 
+    def hash_files(self, paths: Sequence[Path]) -> list[str | Exception]:
+        """Hash files, in parallel when there are enough of them.
+
+        Hashing is kernel reads plus OpenSSL work that releases the GIL, so
+        threads overlap both disk latency and digest computation.
+
+        Args:
+            paths: Files to hash
+
+        Returns:
+            For each path, its SHA-256 hex digest or the exception raised
+            while reading it
+        """
+        workers = min(self.max_workers or os.cpu_count() or 1, len(paths))
+        if workers <= 1 or len(paths) < PARALLEL_HASH_MIN_FILES:
+            return [_hash_or_error(path) for path in paths]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="verify") as executor:
+            return list(executor.map(_hash_or_error, paths))
+
     def verify(
         self,
         bundle_dir: Path,
@@ -209,39 +292,23 @@ class BundleVerifier:
             result.errors.append("Signature present but no public key provided for verification")
 
         # Verify all files in manifest
-        current_files = set()
-        for entry in manifest.entries:
+        current_files = {entry.path for entry in manifest.entries}
+        digests = self.hash_files([bundle_dir / entry.path for entry in manifest.entries])
+        for entry, actual_hash in zip(manifest.entries, digests, strict=True):
             result.files_checked += 1
-            file_path = bundle_dir / entry.path
-
-            # Track for detecting added files
-            current_files.add(entry.path)
 
-            # Check file exists
-            if not file_path.exists():
+            if isinstance(actual_hash, (FileNotFoundError, NotADirectoryError)):
                 result.files_missing.append(entry.path)
-                continue
-
-            # Check file hash
-            try:
-                import hashlib
-
-                hasher = hashlib.sha256()
-                with open(file_path, "rb") as f:
-                    while chunk := f.read(8192):
-                        hasher.update(chunk)
-                actual_hash = hasher.hexdigest()
-
-                if actual_hash == entry.sha256:
-                    result.files_valid += 1
-                else:
-                    result.files_tampered.append({
-                        "path": entry.path,
-                        "expected_hash": entry.sha256,
-                        "actual_hash": actual_hash,
-                    })
-            except Exception as e:
-                result.errors.append(f"Error checking {entry.path}: {e}")
+            elif isinstance(actual_hash, Exception):
+                result.errors.append(f"Error checking {entry.path}: {actual_hash}")
+            elif actual_hash == entry.sha256:
+                result.files_valid += 1
+            else:
+                result.files_tampered.append({
+                    "path": entry.path,
+                    "expected_hash": entry.sha256,
+                    "actual_hash": actual_hash,
+                })
 
         # Check for added files (files in bundle but not in manifest)
         for file_path in bundle_dir.rglob("*"):
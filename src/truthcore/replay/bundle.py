@@ -14,7 +14,9 @@ Bundle structure:
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import shutil
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -36,6 +38,30 @@ DEFAULT_ALLOWLIST = {
     "cache_hit",
 }
 
+# Bundle bookkeeping files that are not part of a run's outputs
+_EVIDENCE_FILES = frozenset({"evidence.manifest.json", "evidence.sig"})
+
+# Suffixes get_config_files() matches
+_CONFIG_SUFFIXES = (".json", ".yaml", ".yml")
+
+
+def _count_files(root: Path, exclude: frozenset[str] = frozenset()) -> int:
+    """Count files beneath root (as rglob would find them) without building a list."""
+    count = 0
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except FileNotFoundError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file() and entry.name not in exclude:
+                    count += 1
+    return count
+
 
 @dataclass
 class ReplayBundle:
@@ -194,10 +220,29 @@ class ReplayBundle:
 
         files = []
         for f in self.outputs_dir.rglob("*"):
-            if f.is_file() and f.name not in ("evidence.manifest.json", "evidence.sig"):
+            if f.is_file() and f.name not in _EVIDENCE_FILES:
                 files.append(f)
         return sorted(files)
 
+    @functools.cached_property
+    def input_count(self) -> int:
+        """Number of input files, counted once without sorting a path list."""
+        return _count_files(self.inputs_dir)
+
+    @functools.cached_property
+    def config_count(self) -> int:
+        """Number of configuration files, counted once."""
+        try:
+            with os.scandir(self.config_dir) as it:
+                return sum(1 for entry in it if entry.name.endswith(_CONFIG_SUFFIXES))
+        except FileNotFoundError:
+            return 0
+
+    @functools.cached_property
+    def output_count(self) -> int:
+        """Number of output files, counted once."""
+        return _count_files(self.outputs_dir, _EVIDENCE_FILES)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert bundle info to dictionary."""
         return {
@@ -210,9 +255,9 @@ class ReplayBundle:
             "has_config": self.config_dir.exists(),
             "has_outputs": self.outputs_dir.exists(),
             "has_evidence_manifest": self.evidence_manifest is not None,
-            "input_count": len(self.get_input_files()),
-            "config_count": len(self.get_config_files()),
-            "output_count": len(self.get_output_files()),
+            "input_count": self.input_count,
+            "config_count": self.config_count,
+            "output_count": self.output_count,
         }
 
 
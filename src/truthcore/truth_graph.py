@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import os
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+from truthcore import jsonio
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 
 class NodeType(Enum):
@@ -42,6 +47,10 @@ class Severity(Enum):
     BLOCKER = "blocker"
 
 
+# Severity ordering used by severity>= queries, lowest first
+_SEVERITY_RANK = {sev.value: rank for rank, sev in enumerate(Severity)}
+
+
 class EntityType(Enum):
     """Types of entities that can be affected."""
 
@@ -375,57 +384,66 @@ class TruthGraph:
 
         return results
 
-    def query_simple(self, predicate: str) -> list[Node]:
-        """Simple query with predicate string.
+    @staticmethod
+    def compile_predicate(predicate: str) -> Callable[[Node], bool]:
+        """Parse a query_simple predicate string into a node test.
 
-        Supports:
-            - key=value (exact match)
-            - key=contains:substring (contains match)
-            - severity>=level (severity >= level)
+        The predicate is parsed once, so matching a large graph costs one
+        closure call per node rather than re-reading the predicate.
 
         Args:
-            predicate: Query predicate string
+            predicate: Query predicate string (see query_simple)
 
         Returns:
-            List of matching nodes
+            Function returning True for nodes that match
         """
-        results: list[Node] = []
-
-        # Parse predicate
         if ">=" in predicate and "severity" in predicate:
             # Severity comparison
             level = predicate.split(">=")[1].strip()
-            severity_levels = ["info", "low", "medium", "high", "critical", "blocker"]
-            if level in severity_levels:
-                min_index = severity_levels.index(level)
-                for node in self.nodes.values():
-                    if node.type == NodeType.FINDING:
-                        node_sev = node.properties.get("severity", "info")
-                        if node_sev in severity_levels:
-                            if severity_levels.index(node_sev) >= min_index:
-                                results.append(node)
-
-        elif "contains:" in predicate:
+            min_rank = _SEVERITY_RANK.get(level)
+            if min_rank is None:
+                return lambda node: False
+
+            def severity_at_least(node: Node) -> bool:
+                if node.type != NodeType.FINDING:
+                    return False
+                rank = _SEVERITY_RANK.get(node.properties.get("severity", "info"))
+                return rank is not None and rank >= min_rank
+
+            return severity_at_least
+
+        if "contains:" in predicate:
             # Contains match
             key, value = predicate.split("=contains:", 1)
             key = key.strip()
             value = value.strip()
-            for node in self.nodes.values():
-                if key in node.properties:
-                    prop_value = str(node.properties[key])
-                    if value in prop_value:
-                        results.append(node)
+            return lambda node: key in node.properties and value in str(node.properties[key])
 
-        elif "=" in predicate:
+        if "=" in predicate:
             # Exact match
             key, value = predicate.split("=", 1)
             key = key.strip()
             value = value.strip()
-            for node in self.nodes.values():
-                if str(node.properties.get(key)) == value:
-                    results.append(node)
+            return lambda node: str(node.properties.get(key)) == value
 
-        return results
+        return lambda node: False
+
+    def query_simple(self, predicate: str) -> list[Node]:
+        """Simple query with predicate string.
+
+        Supports:
+            - key=value (exact match)
+            - key=contains:substring (contains match)
+            - severity>=level (severity >= level)
+
+        Args:
+            predicate: Query predicate string
+
+        Returns:
+            List of matching nodes
+        """
+        matches = self.compile_predicate(predicate)
+        return [node for node in self.nodes.values() if matches(node)]
 
     def get_connected(self, node_id: str, edge_type: EdgeType | None = None) -> list[Node]:
         """Get nodes connected to a given node."""
@@ -442,6 +460,13 @@ class TruthGraph:
 
         return connected
 
+    def stats(self) -> dict[str, int]:
+        """Get node and edge counts without serializing the graph."""
+        return {
+            "node_count": len(self.nodes),
+            "edge_count": len(self.edges),
+        }
+
     def to_dict(self) -> dict[str, Any]:
         """Convert graph to dictionary."""
         return {
@@ -450,17 +475,42 @@ class TruthGraph:
             "metadata": dict(sorted(self.metadata.items())),
             "nodes": [n.to_dict() for n in sorted(self.nodes.values(), key=lambda x: x.id)],
             "edges": [e.to_dict() for e in sorted(self.edges.values(), key=lambda x: x.id)],
-            "stats": {
-                "node_count": len(self.nodes),
-                "edge_count": len(self.edges),
-            },
+            "stats": self.stats(),
         }
 
+    def stream_json(self, f: BinaryIO) -> None:
+        """Write the graph as JSON to a binary stream.
+
+        Produces the same document as to_dict() dumped with sorted keys, but
+        encodes nodes and edges one at a time so the full dictionary form of
+        a large graph is never held in memory.
+        """
+        f.write(b'{\n  "created_at": ' + jsonio.dumps(self.created_at))
+        f.write(b',\n  "edges": ')
+        jsonio.write_array(
+            f,
+            (e.to_dict() for e in sorted(self.edges.values(), key=lambda x: x.id)),
+            level=1,
+            sort_keys=True,
+        )
+        f.write(b',\n  "metadata": ')
+        jsonio.write_nested(f, self.metadata, level=1, sort_keys=True)
+        f.write(b',\n  "nodes": ')
+        jsonio.write_array(
+            f,
+            (n.to_dict() for n in sorted(self.nodes.values(), key=lambda x: x.id)),
+            level=1,
+            sort_keys=True,
+        )
+        f.write(b',\n  "stats": ')
+        jsonio.write_nested(f, self.stats(), level=1, sort_keys=True)
+        f.write(b',\n  "version": ' + jsonio.dumps(self.version) + b"\n}")
+
     def to_json(self, output_path: Path) -> None:
         """Export graph to JSON file."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, sort_keys=True)
+        with open(output_path, "wb", buffering=jsonio.STREAM_BUFFER_SIZE) as f:
+            self.stream_json(f)
 
     def to_parquet(self, output_path: Path) -> None:
         """Export graph to Parquet files (nodes and edges)."""
@@ -546,8 +596,7 @@ class TruthGraph:
     @classmethod
     def from_json(cls, input_path: Path) -> TruthGraph:
         """Load graph from JSON file."""
-        with open(input_path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = jsonio.load_file(input_path)
         return cls.from_dict(data)
 
 
@@ -563,8 +612,7 @@ class TruthGraphBuilder:
         run_plan_path: Path | None = None,
     ) -> Node:
         """Add a run node from a run manifest."""
-        with open(manifest_path, encoding="utf-8") as f:
-            manifest = json.load(f)
+        manifest = jsonio.load_file(manifest_path)
 
         run_id = manifest.get("run_id", "unknown")
         command = manifest.get("command", "unknown")
@@ -588,9 +636,8 @@ class TruthGraphBuilder:
         nodes: list[Node] = []
 
         try:
-            with open(readiness_path, encoding="utf-8") as f:
-                data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            data = jsonio.load_file(readiness_path)
+        except (FileNotFoundError, ValueError):
             return nodes
 
         # Add readiness engine node
@@ -661,9 +708,8 @@ class TruthGraphBuilder:
         nodes: list[Node] = []
 
         try:
-            with open(recon_path, encoding="utf-8") as f:
-                data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            data = jsonio.load_file(recon_path)
+        except (FileNotFoundError, ValueError):
             return nodes
 
         # Add reconciliation engine node
@@ -708,9 +754,8 @@ class TruthGraphBuilder:
         nodes: list[Node] = []
 
         try:
-            with open(trace_path, encoding="utf-8") as f:
-                data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            data = jsonio.load_file(trace_path)
+        except (FileNotFoundError, ValueError):
             return nodes
 
         # Add trace engine node
@@ -742,24 +787,32 @@ class TruthGraphBuilder:
         run_plan_path: Path | None = None,
     ) -> TruthGraph:
         """Build complete graph from a run output directory."""
-        manifest_path = run_dir / "run_manifest.json"
+        # List the directory once; DirEntry type checks reuse the readdir
+        # result instead of issuing a stat per candidate output file.
+        try:
+            with os.scandir(run_dir) as it:
+                present = {entry.name for entry in it if entry.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            present = set()
 
-        if not manifest_path.exists():
+        if "run_manifest.json" not in present:
             raise ValueError(f"No manifest found in {run_dir}")
 
         # Add run
-        run_node = self.add_run_from_manifest(manifest_path, run_plan_path)
+        run_node = self.add_run_from_manifest(run_dir / "run_manifest.json", run_plan_path)
         run_id = run_node.properties.get("run_id", "unknown")
 
         # Add findings from various outputs
-        self.add_findings_from_readiness(run_id, run_dir / "readiness.json")
-        self.add_findings_from_recon(run_id, run_dir / "recon_run.json")
-        self.add_findings_from_trace(run_id, run_dir / "trace_report.json")
+        if "readiness.json" in present:
+            self.add_findings_from_readiness(run_id, run_dir / "readiness.json")
+        if "recon_run.json" in present:
+            self.add_findings_from_recon(run_id, run_dir / "recon_run.json")
+        if "trace_report.json" in present:
+            self.add_findings_from_trace(run_id, run_dir / "trace_report.json")
 
         # Add UI geometry findings if present
-        ui_geo_path = run_dir / "ui_geometry.json"
-        if ui_geo_path.exists():
-            self._add_ui_geometry_findings(run_id, ui_geo_path)
+        if "ui_geometry.json" in present:
+            self._add_ui_geometry_findings(run_id, run_dir / "ui_geometry.json")
 
         return self.graph
 
@@ -772,9 +825,8 @@ class TruthGraphBuilder:
         nodes: list[Node] = []
 
         try:
-            with open(ui_geo_path, encoding="utf-8") as f:
-                data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            data = jsonio.load_file(ui_geo_path)
+        except (FileNotFoundError, ValueError):
             return nodes
 
         # Add UI geometry engine node
@@ -6,11 +6,12 @@ click target information to verify UI elements are actually reachable.
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from truthcore import jsonio
+
 
 @dataclass
 class BoundingBox:
@@ -120,8 +121,7 @@ class UIGeometryParser:
         if not self.facts_path.exists():
             return
 
-        with open(self.facts_path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = jsonio.load_file(self.facts_path)
 
         # Parse viewports
         for vp_data in data.get("viewports", []):
@@ -0,0 +1,627 @@
+"""Tests for the truthctl CLI commands."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from truthcore.cli import cli
+
+
+@pytest.fixture
+def inputs_dir(tmp_path: Path) -> Path:
+    """Create a small inputs directory."""
+    inputs = tmp_path / "inputs"
+    inputs.mkdir()
+    (inputs / "data.json").write_text('{"a": 1}')
+    return inputs
+
+
+class TestCanonicalOutputs:
+    """Command outputs are written without sort_keys, so their dicts must already be sorted."""
+
+    @pytest.mark.parametrize(
+        ("args", "filename"),
+        [
+            (["judge", "--no-manifest"], "readiness.json"),
+            (["recon"], "recon_run.json"),
+            (["index"], "kb_index.json"),
+        ],
+    )
+    def test_output_key_order_is_canonical(
+        self, tmp_path: Path, inputs_dir: Path, args: list[str], filename: str
+    ):
+        """Test that written JSON matches a sort_keys=True dump byte for byte."""
+        out = tmp_path / "out"
+        result = CliRunner().invoke(cli, [*args, "--inputs", str(inputs_dir), "--out", str(out)])
+        assert result.exit_code == 0, result.output
+
+        text = (out / filename).read_text()
+        assert text == json.dumps(json.loads(text), indent=2, sort_keys=True)
+
+    def test_trace_output_key_order_is_canonical(self, tmp_path: Path, inputs_dir: Path):
+        """Test that trace_report.json is written in canonical key order."""
+        out = tmp_path / "out"
+        data_file = inputs_dir / "data.json"
+        result = CliRunner().invoke(
+            cli, ["trace", "--inputs", str(data_file), "--fsm", str(data_file), "--out", str(out)]
+        )
+        assert result.exit_code == 0, result.output
+
+        text = (out / "trace_report.json").read_text()
+        assert text == json.dumps(json.loads(text), indent=2, sort_keys=True)
+
+
+class TestRunManifest:
+    """Test run manifests written by commands."""
+
+    @pytest.mark.parametrize("command", ["recon", "index"])
+    def test_manifest_complete_when_command_returns(self, tmp_path: Path, inputs_dir: Path, command: str):
+        """Test run_manifest.json is fully written before the command returns."""
+        out = tmp_path / "out"
+        result = CliRunner().invoke(cli, [command, "--inputs", str(inputs_dir), "--out", str(out)])
+        assert result.exit_code == 0, result.output
+
+        manifest = json.loads((out / "run_manifest.json").read_text())
+        assert manifest["command"] == command
+
+
+class TestGraphQuery:
+    """Test graph-query output."""
+
+    def test_stdout_results_are_valid_json(self, tmp_path: Path):
+        """Test results streamed to stdout parse and precede the summary line."""
+        from truthcore.truth_graph import TruthGraph
+
+        graph = TruthGraph()
+        graph.add_run("run-123", "judge", {})
+        graph.add_run("run-456", "recon", {})
+        graph_file = tmp_path / "graph.json"
+        graph.to_json(graph_file)
+
+        result = CliRunner().invoke(cli, ["graph-query", "--graph", str(graph_file), "--where", "command=judge"])
+        assert result.exit_code == 0, result.output
+
+        body, summary = result.output.rsplit("\n\nFound ", 1)
+        data = json.loads(body)
+        assert data["result_count"] == 1
+        assert data["results"][0]["properties"]["run_id"] == "run-123"
+        assert summary.strip() == "1 matching nodes"
+
+
+class TestIntel:
+    """Test the intel command's history loading."""
+
+    @pytest.mark.parametrize("jobs", [[], ["--jobs", "1"], ["--jobs", "4"]], ids=["auto", "1", "4"])
+    def test_intel_skips_empty_and_malformed_history(self, tmp_path: Path, jobs: list[str]):
+        """Test that unreadable history files are skipped rather than failing the run."""
+        history = tmp_path / "history"
+        (history / "nested").mkdir(parents=True)
+        (history / "good.json").write_text('{"passed": true, "findings": []}')
+        (history / "nested" / "good2.json").write_text('{"passed": false, "findings": []}')
+        (history / "empty.json").write_text("")
+        (history / "broken.json").write_text("{not json")
+
+        out = tmp_path / "out"
+        result = CliRunner().invoke(
+            cli, ["intel", "--inputs", str(history), "--mode", "readiness", "--out", str(out), *jobs]
+        )
+        assert result.exit_code == 0, result.output
+        assert (out / "readiness_intel_scorecard.json").exists()
+
+    @pytest.mark.parametrize("stream", [False, True], ids=["whole", "streamed"])
+    @pytest.mark.parametrize("mode", ["readiness", "recon", "agent", "knowledge"])
+    def test_field_selection_matches_full_parse(self, tmp_path: Path, monkeypatch, mode: str, stream: bool):
+        """Test scoring the selected history fields gives the same scorecard as the full reports."""
+        import os
+
+        from truthcore import jsonio
+        from truthcore.anomaly_scoring import (
+            AgentBehaviorScorer,
+            KnowledgeHealthScorer,
+            ReadinessAnomalyScorer,
+            ReconciliationAnomalyScorer,
+        )
+
+        if stream:
+            if not jsonio.IJSON_AVAILABLE:
+                pytest.skip("ijson not installed")
+            monkeypatch.setattr(jsonio, "STREAM_PARSE_THRESHOLD", 0)
+
+        history = tmp_path / "history"
+        history.mkdir()
+        reports = []
+        for i in range(8):
+            report = {
+                "findings": [{"id": f"f{j}", "severity": "low"} for j in range(i)],
+                "passed": i % 2 == 0,
+                "summary": {"total": i * 3, "balance_check": i % 3 == 0, "exception_count": i},
+                "metrics": {"tool_success_rate": 0.5 + i / 20, "avg_latency_ms": 100.5 + i * 7},
+                "stats": {"stale_count": i * 2, "total": 40 + i},
+            }
+            path = history / f"run{i}.json"
+            path.write_text(json.dumps(report))
+            # run0 is the newest, matching the newest-first history order
+            mtime = (100 - i) * 10**9
+            os.utime(path, ns=(mtime, mtime))
+            reports.append(report)
+
+        out = tmp_path / "out"
+        result = CliRunner().invoke(cli, ["intel", "--inputs", str(history), "--mode", mode, "--out", str(out)])
+        assert result.exit_code == 0, result.output
+
+        scorer_cls = {
+            "readiness": ReadinessAnomalyScorer,
+            "recon": ReconciliationAnomalyScorer,
+            "agent": AgentBehaviorScorer,
+            "knowledge": KnowledgeHealthScorer,
+        }[mode]
+        expected = json.loads(json.dumps(scorer_cls(reports).score()))
+        assert json.loads((out / f"{mode}_intel_scorecard.json").read_text()) == expected
+
+    def test_recent_json_files_keeps_newest(self, tmp_path: Path):
+        """Test history selection keeps the newest non-empty files, newest first."""
+        import os
+
+        from truthcore.cli import _recent_json_files
+
+        (tmp_path / "nested").mkdir()
+        names = ["a.json", "nested/b.json", "c.json", "nested/d.json"]
+        for i, name in enumerate(names):
+            path = tmp_path / name
+            path.write_text("{}")
+            os.utime(path, ns=(i * 10**9, i * 10**9))
+        (tmp_path / "empty.json").write_text("")
+        (tmp_path / "notes.txt").write_text("{}")
+
+        recent = _recent_json_files(str(tmp_path), 3)
+        assert recent == [str(tmp_path / name) for name in ["nested/d.json", "c.json", "nested/b.json"]]
+
+
+class TestJudge:
+    """Test judge progress output."""
+
+    def test_quiet_suppresses_progress(self, tmp_path: Path, inputs_dir: Path):
+        """Test --quiet silences progress output but still writes results."""
+        out = tmp_path / "out"
+        result = CliRunner().invoke(cli, ["--quiet", "judge", "--inputs", str(inputs_dir), "--out", str(out)])
+        assert result.exit_code == 0, result.output
+        assert result.output == ""
+        assert (out / "readiness.json").exists()
+
+    def test_phase_headers_precede_details(self, tmp_path: Path, inputs_dir: Path):
+        """Test each phase header is printed before that phase's detail lines."""
+        out = tmp_path / "out"
+        result = CliRunner().invoke(cli, ["judge", "--inputs", str(inputs_dir), "--out", str(out)])
+        assert result.exit_code == 0, result.output
+
+        lines = result.output.splitlines()
+        assert lines.index("Generating evidence manifest...") < lines.index(
+            f"  Manifest: {out / 'evidence.manifest.json'}"
+        )
+        assert lines.index("Generating verdict...") < lines.index(f"Results written to {out}")
+
+
+class TestJudgeRunPlan:
+    """Test judge reading a previously generated run plan."""
+
+    def test_run_plan_is_reparsed_when_changed(self, tmp_path: Path, inputs_dir: Path):
+        """Test the cached plan parse is keyed on the file's mtime and size."""
+        from truthcore.cli import _load_plan
+
+        plan_path = tmp_path / "run_plan.json"
+        plan_path.write_text(json.dumps({
+            "engines": [{"engine_id": "readiness", "include": True}, {"engine_id": "recon", "include": False}],
+            "invariants": [],
+        }))
+        args = ["judge", "--inputs", str(inputs_dir), "--out", str(tmp_path / "out"),
+                "--plan-out", str(plan_path), "--no-manifest"]
+
+        _load_plan.cache_clear()
+        assert CliRunner().invoke(cli, args).exit_code == 0
+        assert CliRunner().invoke(cli, args).exit_code == 0
+        assert _load_plan.cache_info().hits == 1
+
+        plan_path.write_text(json.dumps({"engines": [], "invariants": [{"rule_id": "r1", "include": True}]}))
+        st = plan_path.stat()
+        assert _load_plan(str(plan_path), st.st_mtime_ns, st.st_size) == ((), ("r1",))
+
+
+class TestVerifyBundle:
+    """Test the verify-bundle summary."""
+
+    def test_summary_lists_tampered_files(self, tmp_path: Path, inputs_dir: Path):
+        """Test a tampered bundle fails and its summary names the tampered file."""
+        out = tmp_path / "out"
+        assert CliRunner().invoke(cli, ["judge", "--inputs", str(inputs_dir), "--out", str(out)]).exit_code == 0
+
+        result = CliRunner().invoke(cli, ["verify-bundle", "--bundle", str(out)])
+        assert result.exit_code == 0, result.output
+        assert "Verification Result: ✅ VALID" in result.output
+
+        (out / "readiness.json").write_text("{}")
+        result = CliRunner().invoke(cli, ["verify-bundle", "--bundle", str(out)])
+        assert result.exit_code == 1
+        lines = result.output.splitlines()
+        assert lines[lines.index("  ⚠️  Files tampered: 1") + 1] == "    - readiness.json"
+
+    def test_env_public_key_follows_environment(self, monkeypatch):
+        """Test the environment public key is decoded once per value and tracks changes."""
+        from truthcore.cli import _env_public_key, _signer_public_key
+        from truthcore.provenance.signing import Signer
+
+        monkeypatch.delenv("TRUTHCORE_SIGNING_PRIVATE_KEY", raising=False)
+        monkeypatch.delenv("TRUTHCORE_SIGNING_PUBLIC_KEY", raising=False)
+        _signer_public_key.cache_clear()
+        assert _env_public_key() is None
+
+        first, second = Signer.generate_keys()[1], Signer.generate_keys()[1]
+        monkeypatch.setenv("TRUTHCORE_SIGNING_PUBLIC_KEY", Signer.keys_to_env_format(b"", first)[1])
+        assert _env_public_key() == first
+        assert _env_public_key() == first
+        assert _signer_public_key.cache_info().hits == 1
+
+        monkeypatch.setenv("TRUTHCORE_SIGNING_PUBLIC_KEY", Signer.keys_to_env_format(b"", second)[1])
+        assert _env_public_key() == second
+
+
+class TestCacheCommands:
+    """Test cache maintenance commands."""
+
+    def test_cache_stats_does_not_create_missing_cache(self, tmp_path: Path):
+        """Test inspecting a cache that does not exist leaves no directory behind."""
+        cache_dir = tmp_path / "cache"
+        result = CliRunner().invoke(cli, ["cache-stats", "--cache-dir", str(cache_dir)])
+        assert result.exit_code == 0, result.output
+        assert "Cache not available" in result.output
+        assert not cache_dir.exists()
+
+    def test_judge_help_does_not_create_cache(self, tmp_path: Path):
+        """Test the background cache prewarm never creates the cache directory."""
+        cache_dir = tmp_path / "cache"
+        result = CliRunner().invoke(cli, ["--cache-dir", str(cache_dir), "judge", "--help"])
+        assert result.exit_code == 0, result.output
+        result = CliRunner().invoke(cli, ["--cache-dir", str(cache_dir), "judge", "--profile"])
+        assert result.exit_code != 0
+
+        import time
+        time.sleep(0.1)  # let any prewarm thread finish
+        assert not cache_dir.exists()
+
+    def test_readonly_judge_does_not_create_cache(self, tmp_path: Path, inputs_dir: Path):
+        """Test a read-only cache run against a missing directory skips the cache."""
+        cache_dir = tmp_path / "cache"
+        result = CliRunner().invoke(cli, [
+            "--cache-dir", str(cache_dir), "--cache-readonly",
+            "judge", "--inputs", str(inputs_dir), "--out", str(tmp_path / "out"), "--no-manifest",
+        ])
+        assert result.exit_code == 0, result.output
+        assert not cache_dir.exists()
+
+
+class TestDashboard:
+    """Test dashboard build helpers."""
+
+    @pytest.mark.parametrize("count", [3, 20])
+    def test_copy_trees_merges_and_keeps_mtime(self, tmp_path: Path, count: int):
+        """Test tree copies merge into existing output and preserve file metadata."""
+        import os
+
+        from truthcore.cli import _copy_trees
+
+        src = tmp_path / "src"
+        (src / "assets").mkdir(parents=True)
+        for i in range(count):
+            (src / "assets" / f"f{i}.js").write_text(f"// {i}")
+        (src / "index.html").write_text("<html></html>")
+        os.utime(src / "index.html", ns=(10**9, 10**9))
+        dst = tmp_path / "dst"
+        dst.mkdir()
+        (dst / "keep.txt").write_text("kept")
+
+        assert _copy_trees([(str(src), str(dst))]) == count + 1
+        assert (dst / "keep.txt").read_text() == "kept"
+        assert (dst / "assets" / f"f{count - 1}.js").read_text() == f"// {count - 1}"
+        assert (dst / "index.html").stat().st_mtime_ns == 10**9
+
+    @pytest.mark.parametrize("count", [3, 20])
+    def test_copy_trees_contents_only(self, tmp_path: Path, count: int):
+        """Test keep_metadata=False copies the same files without carrying over mtimes."""
+        import os
+
+        from truthcore.cli import _copy_trees
+
+        src = tmp_path / "src"
+        (src / "assets").mkdir(parents=True)
+        for i in range(count):
+            (src / "assets" / f"f{i}.js").write_text(f"// {i}")
+            os.utime(src / "assets" / f"f{i}.js", ns=(10**9, 10**9))
+        dst = tmp_path / "dst"
+
+        assert _copy_trees([(str(src), str(dst))], keep_metadata=False) == count
+        copied = dst / "assets" / f"f{count - 1}.js"
+        assert copied.read_text() == f"// {count - 1}"
+        assert copied.stat().st_mtime_ns != 10**9
+
+    @pytest.mark.parametrize("pretty", [False, True])
+    @pytest.mark.parametrize("count", [0, 1, 3])
+    def test_write_embedded_runs(self, tmp_path: Path, pretty: bool, count: int):
+        """Test embedded-runs.js holds the runs as a JSON array, compact unless pretty."""
+        from truthcore.cli import _write_embedded_runs
+
+        runs = [{"run_id": f"run-{i}", "files": ["verdict.json"], "note": "é"} for i in range(count)]
+        path = tmp_path / "embedded-runs.js"
+        _write_embedded_runs(path, iter(runs), pretty=pretty)
+
+        text = path.read_text(encoding="utf-8")
+        assert text.startswith("window.__EMBEDDED_RUNS__ = ") and text.endswith(";")
+        payload = text[len("window.__EMBEDDED_RUNS__ = "):-1]
+        assert json.loads(payload) == runs
+        assert ("\n" in payload) == (pretty and count > 0)
+
+    @pytest.mark.parametrize("jobs", [1, 4])
+    @pytest.mark.parametrize("count", [3, 20])
+    def test_load_runs_matches_serial_load(self, tmp_path: Path, count: int, jobs: int):
+        """Test run loading returns every run with a manifest, in directory order."""
+        from truthcore.cli import _load_runs, _run_dirs, load_run_data
+
+        for i in range(count):
+            run_dir = tmp_path / f"run-{i:02d}"
+            run_dir.mkdir()
+            (run_dir / "run_manifest.json").write_text(json.dumps({"run_id": i}))
+            (run_dir / "verdict.json").write_text(json.dumps({"verdict": "PASS"}))
+        (tmp_path / "no-manifest").mkdir()
+        (tmp_path / "stray.json").write_text("{}")
+
+        expected = [
+            load_run_data(run_dir) for run_dir in tmp_path.iterdir()
+            if run_dir.is_dir() and run_dir.name != "no-manifest"
+        ]
+        assert _run_dirs(tmp_path) == [path for path in tmp_path.iterdir() if path.is_dir()]
+        assert _load_runs(_run_dirs(tmp_path), jobs) == expected
+        assert len(expected) == count
+
+    def test_load_run_data_reads_present_artifacts(self, tmp_path: Path):
+        """Test only artifacts present in the run directory are loaded, in a fixed order."""
+        from truthcore.cli import load_run_data
+
+        run_dir = tmp_path / "run-1"
+        run_dir.mkdir()
+        assert load_run_data(run_dir) is None
+        assert load_run_data(tmp_path / "missing") is None
+
+        (run_dir / "run_manifest.json").write_text('{"run_id": "run-1"}')
+        (run_dir / "policy_findings.json").write_text('{"findings": []}')
+        (run_dir / "verdict.json").write_text('{"verdict": "PASS"}')
+        (run_dir / "notes.json").write_text("{}")
+        assert load_run_data(run_dir) == {
+            "run_id": "run-1",
+            "files": ["verdict.json", "policy_findings.json"],
+            "manifest": {"run_id": "run-1"},
+            "verdict": {"verdict": "PASS"},
+            "policy": {"findings": []},
+        }
+
+    def test_dist_is_fresh(self, tmp_path: Path):
+        """Test the npm build is only considered current when dist/ is newer than every input."""
+        import os
+
+        from truthcore.cli import _dist_is_fresh
+
+        (tmp_path / "src" / "components").mkdir(parents=True)
+        (tmp_path / "src" / "components" / "App.tsx").write_text("")
+        (tmp_path / "package.json").write_text("{}")
+        assert _dist_is_fresh(tmp_path) is False
+
+        (tmp_path / "dist" / "assets").mkdir(parents=True)
+        (tmp_path / "dist" / "index.html").write_text("")
+        (tmp_path / "dist" / "assets" / "app.js").write_text("")
+        for path in [tmp_path / "src" / "components" / "App.tsx", tmp_path / "package.json"]:
+            os.utime(path, ns=(10**9, 10**9))
+        for path in [tmp_path / "dist" / "index.html", tmp_path / "dist" / "assets" / "app.js"]:
+            os.utime(path, ns=(2 * 10**9, 2 * 10**9))
+        assert _dist_is_fresh(tmp_path) is True
+
+        os.utime(tmp_path / "src" / "components" / "App.tsx", ns=(3 * 10**9, 3 * 10**9))
+        assert _dist_is_fresh(tmp_path) is False
+
+    @pytest.fixture
+    def fake_npm(self, tmp_path: Path, monkeypatch) -> Path:
+        """Put an `npm` on PATH that prints 300 numbered lines to stdout and stderr, then fails."""
+        import os
+        import sys
+
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        npm = bin_dir / "npm"
+        npm.write_text(
+            f"#!{sys.executable}\n"
+            "import sys\n"
+            "for i in range(300):\n"
+            "    print(f'line {i}', file=sys.stderr if i % 2 else sys.stdout, flush=True)\n"
+            "sys.exit(2)\n"
+        )
+        npm.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+        return npm
+
+    def test_run_npm_keeps_output_tail_on_failure(self, tmp_path: Path, fake_npm: Path):
+        """Test a failed npm run reports only the last lines of its merged output."""
+        import subprocess
+
+        from truthcore.cli import _NPM_OUTPUT_TAIL, _run_npm
+
+        with pytest.raises(subprocess.CalledProcessError) as excinfo:
+            _run_npm(["run", "build"], tmp_path)
+        assert excinfo.value.returncode == 2
+        lines = excinfo.value.output.splitlines()
+        assert lines == [f"line {i}" for i in range(300 - _NPM_OUTPUT_TAIL, 300)]
+
+    def test_build_failure_prints_npm_tail(self, tmp_path: Path, fake_npm: Path, monkeypatch, runs_dir: Path):
+        """Test dashboard build exits nonzero and shows npm's last output lines."""
+        import truthcore.cli as cli_module
+
+        dashboard_dir = tmp_path / "dashboard"
+        dashboard_dir.mkdir()
+        monkeypatch.setattr(cli_module, "_dashboard_dir", lambda: dashboard_dir)
+
+        result = CliRunner().invoke(
+            cli, ["dashboard", "build", "--runs", str(runs_dir), "--out", str(tmp_path / "site")]
+        )
+        assert result.exit_code == 1
+        assert "Build failed:" in result.output
+        assert "line 299" in result.output and "line 0\n" not in result.output
+
+    def test_serve_static_embeds_runs_and_cleans_up(self, tmp_path: Path, monkeypatch):
+        """Test the default (non --dev) serve path serves dist/ with runs embedded from a temp dir."""
+        from http.server import ThreadingHTTPServer
+
+        import truthcore.cli as cli_module
+
+        dashboard_dir = tmp_path / "dashboard"
+        (dashboard_dir / "dist").mkdir(parents=True)
+        (dashboard_dir / "dist" / "index.html").write_text("<html><body></body></html>")
+        runs = tmp_path / "runs"
+        (runs / "run-1").mkdir(parents=True)
+        (runs / "run-1" / "run_manifest.json").write_text('{"run_id": "run-1"}')
+        monkeypatch.setattr(cli_module, "_dashboard_dir", lambda: dashboard_dir)
+
+        served: dict[str, Path] = {}
+
+        def fake_serve_forever(server):
+            serve_dir = Path(server.RequestHandlerClass.keywords["directory"])
+            served["dir"] = serve_dir
+            served["index"] = (serve_dir / "index.html").read_text()
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(ThreadingHTTPServer, "serve_forever", fake_serve_forever)
+        result = CliRunner().invoke(
+            cli, ["dashboard", "serve", "--runs", str(runs), "--port", "0", "--no-open"]
+        )
+        assert result.exit_code == 0, result.output
+        assert "Server stopped" in result.output
+        assert '<script>window.__EMBEDDED_RUNS__ = [{"run_id":"run-1"' in served["index"]
+        assert not served["dir"].exists()
+
+    def test_dashboard_dir_is_in_the_checkout(self):
+        """Test the dashboard sources are found next to src/ in the repository."""
+        from truthcore.cli import _dashboard_dir
+
+        assert (_dashboard_dir() / "package.json").is_file()
+
+    @pytest.fixture
+    def built_dashboard(self, tmp_path: Path, monkeypatch) -> Path:
+        """Point the CLI at a dashboard whose dist/ is newer than its sources."""
+        import os
+        import subprocess
+
+        import truthcore.cli as cli_module
+
+        dashboard_dir = tmp_path / "dashboard"
+        (dashboard_dir / "src").mkdir(parents=True)
+        (dashboard_dir / "src" / "main.ts").write_text("")
+        os.utime(dashboard_dir / "src" / "main.ts", ns=(10**9, 10**9))
+        (dashboard_dir / "dist" / "assets").mkdir(parents=True)
+        (dashboard_dir / "dist" / "index.html").write_text("<html><body></body></html>")
+        (dashboard_dir / "dist" / "assets" / "app.js").write_text("")
+        monkeypatch.setattr(cli_module, "_dashboard_dir", lambda: dashboard_dir)
+
+        def no_npm(*args, **kwargs):
+            raise AssertionError("npm build should be skipped for a fresh dist/")
+
+        monkeypatch.setattr(subprocess, "run", no_npm)
+        return dashboard_dir
+
+    @pytest.fixture
+    def runs_dir(self, tmp_path: Path) -> Path:
+        """Create a runs directory holding one run."""
+        runs = tmp_path / "runs"
+        (runs / "run-1").mkdir(parents=True)
+        (runs / "run-1" / "run_manifest.json").write_text('{"run_id": "run-1"}')
+        return runs
+
+    @pytest.mark.parametrize("external", [False, True], ids=["inline", "external"])
+    def test_build_embeds_runs_into_dist_copy(
+        self, tmp_path: Path, built_dashboard: Path, runs_dir: Path, external: bool
+    ):
+        """Test dashboard build copies a fresh dist/ and embeds the runs without rebuilding."""
+        out = tmp_path / "site"
+        args = ["dashboard", "build", "--runs", str(runs_dir), "--out", str(out)]
+        result = CliRunner().invoke(cli, args + ["--external-data"] * external)
+        assert result.exit_code == 0, result.output
+        assert "skipping npm build" in result.output
+
+        assert (out / "assets" / "app.js").exists()
+        index = (out / "index.html").read_text()
+        if external:
+            assert '<script src="embedded-runs.js"></script>' in index
+            assert '"run_id":"run-1"' in (out / "embedded-runs.js").read_text()
+        else:
+            assert '<script>window.__EMBEDDED_RUNS__ = [{"run_id":"run-1"' in index
+            assert not (out / "embedded-runs.js").exists()
+        assert "<script" not in (built_dashboard / "dist" / "index.html").read_text()
+
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_inline_runs_cannot_close_the_script(self, tmp_path: Path, pretty: bool):
+        """Test "</script>" inside run data is escaped when inlined into index.html."""
+        from truthcore.cli import _embed_runs
+
+        (tmp_path / "index.html").write_text("<html><body></body></html>")
+        runs = [{"run_id": "run-1", "note": "</script><b>x</b>"}]
+        _embed_runs(tmp_path, runs, pretty=pretty)
+
+        html = (tmp_path / "index.html").read_text()
+        script = html[html.index("<script>") + len("<script>"):html.index("</script>")]
+        assert json.loads(script[len("window.__EMBEDDED_RUNS__ = "):-1]) == runs
+        assert html.endswith("</script>\n  </body></html>")
+
+    def test_snapshot_copies_runs_and_dashboard(self, tmp_path: Path, built_dashboard: Path, runs_dir: Path):
+        """Test dashboard snapshot holds the runs and the dashboard with the runs embedded."""
+        out = tmp_path / "export"
+        result = CliRunner().invoke(
+            cli, ["dashboard", "snapshot", "--runs", str(runs_dir), "--out", str(out), "--name", "snap"]
+        )
+        assert result.exit_code == 0, result.output
+
+        snapshot = out / "snap"
+        assert (snapshot / "runs" / "run-1" / "run_manifest.json").exists()
+        assert (snapshot / "dashboard" / "assets" / "app.js").exists()
+        assert '"run_id":"run-1"' in (snapshot / "dashboard" / "index.html").read_text()
+        assert (snapshot / "README.txt").exists()
+
+    def test_demo_writes_run_from_templates(self, tmp_path: Path, monkeypatch):
+        """Test dashboard demo fills run_id and timestamp into every artifact."""
+        import truthcore.cli as cli_module
+
+        monkeypatch.setattr(cli_module, "_dashboard_dir", lambda: tmp_path / "no-dashboard")
+        out = tmp_path / "demo"
+        result = CliRunner().invoke(cli, ["dashboard", "demo", "--out", str(out), "--no-open"])
+        assert result.exit_code == 0, result.output
+
+        (run_dir,) = (out / "runs").iterdir()
+        run_data = cli_module.load_run_data(run_dir)
+        assert run_data["manifest"]["run_id"] == run_dir.name
+        assert run_data["verdict"]["run_id"] == run_dir.name
+        assert list(run_data["manifest"])[:4] == ["version", "run_id", "command", "timestamp"]
+        artifacts = ("manifest", "verdict", "invariants", "policy", "provenance")
+        timestamps = {run_data[key]["timestamp"] for key in artifacts}
+        assert len(timestamps) == 1 and "" not in timestamps
+        assert cli_module._DEMO_MANIFEST["run_id"] == cli_module._DEMO_VERDICT["timestamp"] == ""
+
+    def test_demo_embeds_the_run_it_wrote(self, tmp_path: Path, built_dashboard: Path, monkeypatch):
+        """Test the demo embeds the same run data load_run_data() reads from its files."""
+        import truthcore.cli as cli_module
+
+        monkeypatch.setattr(cli_module, "_run_npm", lambda args, cwd: None)
+        out = tmp_path / "demo"
+        result = CliRunner().invoke(cli, ["dashboard", "demo", "--out", str(out), "--no-open"])
+        assert result.exit_code == 0, result.output
+
+        (run_dir,) = (out / "runs").iterdir()
+        html = (out / "dashboard" / "index.html").read_text()
+        script = html[html.index("<script>") + len("<script>"):html.index("</script>")]
+        embedded = json.loads(script[len("window.__EMBEDDED_RUNS__ = "):-1])
+        assert embedded == [cli_module.load_run_data(run_dir)]
@@ -0,0 +1,43 @@
+"""Tests for the CLI compatibility layer."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from truthcore.compat import CompatOptions, transform_output_for_compat, write_compat_output
+
+
+class TestTransformOutputForCompat:
+    """Test legacy output transformation."""
+
+    def test_disabled_returns_data_unchanged(self):
+        """Test the data is passed through as-is without legacy format."""
+        data = {"version": "2.0.0", "findings": []}
+        assert transform_output_for_compat(data, CompatOptions()) is data
+
+    def test_legacy_format_drops_newer_fields(self):
+        """Test newer fields are dropped without modifying the input."""
+        data = {"version": "2.0.0", "engines": ["a"], "reasoning": "r", "findings": [], "passed": True}
+        result = transform_output_for_compat(data, CompatOptions(legacy_format=True))
+        assert result == {"findings": [], "passed": True}
+        assert "version" in data
+
+    def test_v1_output_converts_verdict(self, tmp_path: Path):
+        """Test v2 verdicts are converted to the v1 layout and written with sorted keys."""
+        data = {
+            "version": "2.0.0",
+            "verdict": "SHIP",
+            "mode": "main",
+            "summary": {"total_findings": 2, "lows": 2},
+            "top_findings": [],
+        }
+        path = tmp_path / "verdict.json"
+        write_compat_output(data, path, CompatOptions.from_flag(True))
+
+        text = path.read_text()
+        result = json.loads(text)
+        assert text == json.dumps(result, indent=2, sort_keys=True)
+        assert result["passed"] is True
+        assert result["total_findings"] == 2
+        assert "version" not in result and "top_findings" not in result
@@ -0,0 +1,387 @@
+"""Tests for input connectors."""
+
+from __future__ import annotations
+
+import dataclasses
+import io
+import re
+import zipfile
+import zlib
+from urllib.error import HTTPError
+
+import pytest
+
+import truthcore.connectors.github as github_module
+import truthcore.connectors.http as http_module
+from truthcore.connectors import (
+    ConnectorConfig,
+    ConnectorResult,
+    GitHubActionsConnector,
+    HTTPConnector,
+    LocalConnector,
+    get_connector,
+    list_connectors,
+)
+
+
+class TestRegistry:
+    """Test connector lookup."""
+
+    def test_get_connector(self, monkeypatch):
+        """Test lookups return available connectors only."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.delenv("GH_TOKEN", raising=False)
+        assert isinstance(get_connector("local"), LocalConnector)
+        assert get_connector("unknown") is None
+        assert get_connector("github-actions") is None
+
+        monkeypatch.setenv("GITHUB_TOKEN", "token")
+        assert get_connector("github-actions") is not None
+
+    def test_list_connectors(self, monkeypatch):
+        """Test every registered connector is listed with its availability."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.delenv("GH_TOKEN", raising=False)
+        listed = {entry["name"]: entry["available"] for entry in list_connectors()}
+        assert listed["local"] is True
+        assert listed["http"] is True
+        assert listed["github-actions"] is False
+        assert set(listed) == {"local", "http", "github-actions", "s3"}
+
+
+class TestValidatePath:
+    """Test connector path validation."""
+
+    def test_blocked_and_allowed_extensions(self):
+        """Test extension checks are case-insensitive and apply both lists."""
+        connector = LocalConnector(ConnectorConfig(allowed_extensions=[".json", ".sh"]))
+        assert connector.validate_path("reports/run.JSON") is True
+        assert connector.validate_path("reports/run.yaml") is False
+        assert connector.validate_path("scripts/run.SH") is False
+        assert connector.validate_path("/tmp/../etc/passwd.json") is False
+        assert connector.validate_path("\\share\\..\\passwd.json") is False
+        assert connector.validate_path("archive.tar.JSON") is True
+        assert connector.config.allowed_extensions == frozenset({".json", ".sh"})
+        assert LocalConnector(ConnectorConfig(blocked_extensions=None)).validate_path("run.exe") is False
+
+    def test_sanitize_disabled_allows_everything(self):
+        """Test validation is skipped entirely when sanitize_paths is off."""
+        connector = LocalConnector(ConnectorConfig(sanitize_paths=False))
+        assert connector.validate_path("tool.exe") is True
+
+
+class TestDataclasses:
+    """Test the connector value types."""
+
+    def test_config_and_result_are_frozen(self):
+        """Test configs and results reject reassignment and keep separate defaults."""
+        config = ConnectorConfig()
+        assert ".exe" in config.blocked_extensions
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.max_files = 1
+
+        first, second = ConnectorResult(success=True), ConnectorResult(success=True)
+        first.files.append("a.json")
+        assert second.files == [] and second.metadata == {}
+
+
+class TestLocalConnector:
+    """Test copying inputs from a local directory."""
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_fetch_directory(self, tmp_path, workers):
+        """Test nested files are copied in rglob order, skipping blocked ones."""
+        source = tmp_path / "src"
+        (source / "a" / "b").mkdir(parents=True)
+        (source / "top.json").write_text("{}")
+        (source / "run.sh").write_text("echo")
+        (source / "a" / "mid.json").write_text('{"x": 1}')
+        (source / "a" / "b" / "deep.json").write_text("[]")
+
+        result = LocalConnector(ConnectorConfig(copy_workers=workers)).fetch(str(source), tmp_path / "out")
+        expected = [
+            str(p.relative_to(source)) for p in source.rglob("*") if p.is_file() and p.suffix != ".sh"
+        ]
+        assert result.success is True
+        assert result.files == expected
+        assert result.metadata["total_bytes"] == 2 + 8 + 2
+        assert (tmp_path / "out" / "a" / "b" / "deep.json").read_text() == "[]"
+        assert not (tmp_path / "out" / "run.sh").exists()
+
+        limited = LocalConnector(ConnectorConfig(max_files=1, copy_workers=workers)).fetch(
+            str(source), tmp_path / "limited"
+        )
+        assert limited.files == expected[:1]
+        assert limited.metadata["errors"] == ["Reached max file limit (1)"]
+
+
+class FakeResponse(io.BytesIO):
+    """A urlopen() response serving a fixed body."""
+
+    def __init__(self, body: bytes, content_type: str = "application/octet-stream", **headers: str):
+        super().__init__(body)
+        self.headers = {"Content-Type": content_type, **headers}
+
+
+class TestHTTPConnector:
+    """Test downloading artifacts over HTTP."""
+
+    @pytest.fixture
+    def serve(self, monkeypatch):
+        """Make urlopen() answer every request with the given body."""
+        def serve(body: bytes, content_type: str = "application/octet-stream", **headers: str):
+            monkeypatch.setattr(
+                http_module, "urlopen", lambda req, timeout: FakeResponse(body, content_type, **headers)
+            )
+        return serve
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_fetch_zip_extracts_members(self, tmp_path, serve, workers):
+        """Test a zip download is extracted member by member, skipping blocked files."""
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("reports/", "")
+            zf.writestr("reports/big.json", "x" * 100_000)
+            zf.writestr("run.exe", "MZ")
+            zf.writestr("reports/../../escape.json", "{}")
+            for i in range(5):
+                zf.writestr(f"logs/{i}.txt", str(i) * 1000)
+        serve(archive.getvalue())
+
+        config = ConnectorConfig(max_files=4, extract_workers=workers)
+        result = HTTPConnector(config).fetch("https://example.com/bundle.zip", tmp_path)
+        assert result.success is True
+        assert result.files == ["reports/big.json", "logs/0.txt", "logs/1.txt", "logs/2.txt"]
+        assert result.metadata["total_bytes"] == 103_000
+        assert result.metadata["errors"] == [
+            "Skipped blocked file: run.exe",
+            "Skipped path outside destination: reports/../../escape.json",
+            "Reached max file limit (4)",
+        ]
+        assert not (tmp_path.parent / "escape.json").exists()
+        assert (tmp_path / "reports" / "big.json").read_text() == "x" * 100_000
+        assert (tmp_path / "logs" / "2.txt").read_text() == "2" * 1000
+        assert not (tmp_path / "logs" / "3.txt").exists()
+
+    @pytest.mark.parametrize(
+        "members",
+        ["logs/1.txt", ["logs/1.txt", "logs/3.txt", "absent.txt"], re.compile(r"logs/[13]\.txt")],
+        ids=["name", "names", "pattern"],
+    )
+    def test_fetch_zip_extracts_selected_members(self, tmp_path, serve, members):
+        """Test only the requested members are extracted or counted against the limits."""
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            for i in range(5):
+                zf.writestr(f"logs/{i}.txt", str(i) * 10)
+        serve(archive.getvalue())
+
+        result = HTTPConnector(ConnectorConfig(max_files=2)).fetch(
+            "https://example.com/bundle.zip", tmp_path, members=members
+        )
+        expected = ["logs/1.txt"] if isinstance(members, str) else ["logs/1.txt", "logs/3.txt"]
+        assert result.files == expected
+        assert result.metadata["errors"] is None
+        assert sorted(p.name for p in (tmp_path / "logs").iterdir()) == [name[5:] for name in expected]
+
+    def test_fetch_file_and_size_limit(self, tmp_path, serve):
+        """Test single files are streamed to disk and oversized or blocked ones are not kept."""
+        serve(b'{"ok": true}')
+        result = HTTPConnector().fetch("https://example.com/data/report.json", tmp_path)
+        assert result.files == ["report.json"]
+        assert result.metadata["total_bytes"] == 12
+        assert (tmp_path / "report.json").read_bytes() == b'{"ok": true}'
+
+        serve(b"x" * 200_000)
+        result = HTTPConnector(ConnectorConfig(max_size_bytes=100_000)).fetch(
+            "https://example.com/data/big.json", tmp_path / "big"
+        )
+        assert result.success is False
+        assert "exceeds size limit" in result.error
+        assert not (tmp_path / "big" / "big.json").exists()
+
+        result = HTTPConnector().fetch("https://example.com/tool.exe", tmp_path)
+        assert result.error == "File type blocked: .exe"
+        assert not (tmp_path / "tool.exe").exists()
+
+    @pytest.mark.parametrize("encoding", ["gzip", "deflate"])
+    def test_fetch_decodes_content_encoding(self, tmp_path, monkeypatch, encoding):
+        """Test gzip is requested and compressed bodies are decoded before the size limit."""
+        body = b'{"line": "' + b"x" * 200_000 + b'"}'
+        wbits = 16 + zlib.MAX_WBITS if encoding == "gzip" else zlib.MAX_WBITS
+        compressor = zlib.compressobj(wbits=wbits)
+        encoded = compressor.compress(body) + compressor.flush()
+        accepted = []
+
+        def urlopen(req, timeout):
+            accepted.append(req.get_header("Accept-encoding"))
+            return FakeResponse(encoded, "application/json", **{"Content-Encoding": encoding})
+
+        monkeypatch.setattr(http_module, "urlopen", urlopen)
+        result = HTTPConnector().fetch("https://example.com/data/report.json", tmp_path)
+        assert accepted == ["gzip, deflate"]
+        assert result.metadata["total_bytes"] == len(body)
+        assert (tmp_path / "report.json").read_bytes() == body
+
+        result = HTTPConnector(ConnectorConfig(max_size_bytes=100_000)).fetch(
+            "https://example.com/data/report.json", tmp_path / "big"
+        )
+        assert "exceeds size limit" in result.error
+
+    def test_fetch_invalid_zip(self, tmp_path, serve):
+        """Test a body that is not a zip archive is reported as such."""
+        serve(b"not a zip", "application/zip")
+        result = HTTPConnector().fetch("https://example.com/artifact", tmp_path)
+        assert result.success is False
+        assert result.error == "Downloaded file is not a valid ZIP archive"
+
+    def test_cache_revalidates_with_etag(self, tmp_path, monkeypatch):
+        """Test a cached download is reused only after a 304 for its ETag."""
+        requests = []
+
+        def urlopen(req, timeout):
+            requests.append(req.get_header("If-none-match"))
+            if req.get_header("If-none-match") == '"v1"':
+                raise HTTPError(req.full_url, 304, "Not Modified", {}, None)
+            return FakeResponse(b'{"v": 1}', "application/json", ETag='"v1"')
+
+        monkeypatch.setattr(http_module, "urlopen", urlopen)
+        connector = HTTPConnector(ConnectorConfig(http_cache_dir=tmp_path / "cache"))
+        url = "https://example.com/data/report.json"
+
+        first = connector.fetch(url, tmp_path / "first")
+        second = connector.fetch(url, tmp_path / "second")
+        assert requests == [None, '"v1"']
+        assert first.files == second.files == ["report.json"]
+        assert (tmp_path / "second" / "report.json").read_bytes() == b'{"v": 1}'
+
+    def test_cache_skips_no_store(self, tmp_path, serve):
+        """Test responses marked no-store, or without validators, are not cached."""
+        cache_dir = tmp_path / "cache"
+        connector = HTTPConnector(ConnectorConfig(http_cache_dir=cache_dir))
+        serve(b"{}", "application/json", ETag='"v1"', **{"Cache-Control": "private, no-store"})
+        assert connector.fetch("https://example.com/a.json", tmp_path / "a").success is True
+        serve(b"{}", "application/json")
+        assert connector.fetch("https://example.com/b.json", tmp_path / "b").success is True
+        assert not cache_dir.exists() or not any(cache_dir.iterdir())
+
+    def test_dropped_download_resumes_with_range(self, tmp_path, monkeypatch):
+        """Test a transfer cut off part-way continues from the received offset."""
+        body = bytes(range(256)) * 1024
+        ranges = []
+
+        class DroppingResponse(FakeResponse):
+            def read(self, size=-1):
+                if self.tell() >= 100_000:
+                    raise ConnectionResetError("connection reset")
+                return super().read(min(size, 100_000 - self.tell()))
+
+        def urlopen(req, timeout):
+            ranges.append((req.get_header("Range"), req.get_header("If-range")))
+            if req.get_header("Range"):
+                start = int(req.get_header("Range")[len("bytes="):-1])
+                response = FakeResponse(body[start:])
+                response.status = 206
+                return response
+            return DroppingResponse(body, **{"Accept-Ranges": "bytes", "ETag": '"v1"'})
+
+        monkeypatch.setattr(http_module, "urlopen", urlopen)
+        monkeypatch.setattr(http_module.time, "sleep", lambda seconds: None)
+        result = HTTPConnector().fetch("https://example.com/data/blob.dat", tmp_path)
+        assert result.success is True
+        assert ranges == [(None, None), ("bytes=100000-", '"v1"')]
+        assert (tmp_path / "blob.dat").read_bytes() == body
+
+
+class TestGitHubActionsConnector:
+    """Test GitHub Actions artifact lookup."""
+
+    def test_artifact_lookup_follows_pagination(self, monkeypatch):
+        """Test the lookup filters by name and follows Link rel="next" pages."""
+        page2 = "https://api.github.com/repositories/1/actions/runs/7/artifacts?page=2"
+        pages = {
+            page2: (b'{"artifacts": [{"name": "my report", "archive_download_url": "https://dl/report"}]}', ""),
+        }
+        requested = []
+
+        def urlopen(req, timeout):
+            requested.append(req.full_url)
+            assert req.get_header("Authorization") == "Bearer token"
+            assert req.get_header("X-github-api-version") == "2022-11-28"
+            body, link = pages.get(req.full_url, (b'{"artifacts": [{"name": "other"}]}', f'<{page2}>; rel="next"'))
+            return FakeResponse(body, "application/json", Link=link)
+
+        monkeypatch.setattr(github_module, "urlopen", urlopen)
+        connector = GitHubActionsConnector(token="token")
+        assert connector._get_artifact_download_url("o", "r", "7", "my report") == "https://dl/report"
+        assert requested == [
+            "https://api.github.com/repos/o/r/actions/runs/7/artifacts?name=my+report&per_page=100",
+            page2,
+        ]
+
+    def test_fetch_many_shares_the_listing(self, tmp_path, monkeypatch):
+        """Test artifacts from one run share a listing and land in their own directories."""
+        def zipped(name):
+            archive = io.BytesIO()
+            with zipfile.ZipFile(archive, "w") as zf:
+                zf.writestr(f"{name}.json", "{}")
+            return archive.getvalue()
+
+        listing = (
+            b'{"artifacts": [{"name": "a", "archive_download_url": "https://dl/a"},'
+            b' {"name": "b", "archive_download_url": "https://dl/b"}]}'
+        )
+        requested = []
+
+        def urlopen(req, timeout):
+            requested.append(req.full_url)
+            if req.full_url.startswith("https://dl/"):
+                return FakeResponse(zipped(req.full_url[-1]), "application/zip")
+            return FakeResponse(listing, "application/json")
+
+        monkeypatch.setattr(github_module, "urlopen", urlopen)
+        results = GitHubActionsConnector(token="token").fetch_many(
+            ["o/r/7/a", "github://o/r/7/b", "o/r/7/missing", "o/r"], tmp_path
+        )
+        assert [result.success for result in results] == [True, True, False, False]
+        assert results[0].files == ["a.json"] and results[1].files == ["b.json"]
+        assert (tmp_path / "b" / "b.json").exists()
+        assert results[2].error == "Artifact 'missing' not found in run 7"
+        assert results[3].error.startswith("Invalid source format")
+        assert sorted(requested) == [
+            "https://api.github.com/repos/o/r/actions/runs/7/artifacts?per_page=100",
+            "https://dl/a",
+            "https://dl/b",
+        ]
+
+    def test_rate_limit_waits_instead_of_failing(self, tmp_path, monkeypatch):
+        """Test calls pause when the quota runs low and retry after Retry-After."""
+        now = 1_000_000.0
+        sleeps = []
+        monkeypatch.setattr(github_module.time, "time", lambda: now)
+        monkeypatch.setattr(github_module.time, "sleep", sleeps.append)
+        responses = [
+            HTTPError("https://api", 403, "Forbidden", {"Retry-After": "7"}, None),
+            FakeResponse(b'{"artifacts": []}', **{"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": str(now + 30)}),
+            FakeResponse(b'{"artifacts": []}'),
+            HTTPError("https://api", 403, "Forbidden", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0"}, None),
+            HTTPError("https://api", 403, "Forbidden", {"Retry-After": "3600"}, None),
+        ]
+
+        def urlopen(req, timeout):
+            response = responses.pop(0)
+            if isinstance(response, HTTPError):
+                raise response
+            return response
+
+        monkeypatch.setattr(github_module, "urlopen", urlopen)
+        connector = GitHubActionsConnector(token="token")
+        assert connector._get_artifact_download_url("o", "r", "7", "a") is None
+        assert sleeps == [7.0]
+        assert connector._get_artifact_download_url("o", "r", "7", "a") is None
+        assert sleeps == [7.0, 30.0]
+
+        # An exhausted quota whose reset has passed retries at once, once only
+        result = connector.fetch("o/r/7/a", tmp_path)
+        assert sleeps == [7.0, 30.0, 0.0]
+        assert result.error == "GitHub API rate limit exceeded (403)"
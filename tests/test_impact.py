@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 from truthcore.impact import (
@@ -311,8 +312,6 @@ index 1234..5678 100644
 
         assert output_path.exists()
 
-        import json
-
         with open(output_path) as f:
             data = json.load(f)
 
@@ -320,6 +319,33 @@ index 1234..5678 100644
         assert data["source_type"] == "file_list"
         assert len(data["engines"]) > 0
 
+    def test_plan_write_reflects_later_edits(self, tmp_path: Path):
+        """Test changes made after analyze() reach serialize(), write() and selected_ids()."""
+        engine = ChangeImpactEngine()
+        plan = engine.analyze(changed_files=["src/main.py"])
+        assert json.loads(plan.serialize()) == plan.to_dict()
+
+        plan.metadata["note"] = "edited"
+        for decision in plan.engines:
+            decision.include = False
+
+        output_path = tmp_path / "run_plan.json"
+        plan.write(output_path)
+        assert json.loads(output_path.read_bytes()) == plan.to_dict()
+        assert json.loads(output_path.read_bytes())["metadata"]["note"] == "edited"
+        assert plan.selected_ids()[0] == []
+
+    def test_plan_selected_ids(self):
+        """Test selected_ids matches the included decisions and exclusions."""
+        engine = ChangeImpactEngine()
+        plan = engine.analyze(changed_files=["src/main.py", "README.md"])
+
+        engine_ids, rule_ids = plan.selected_ids()
+        assert engine_ids == [e.engine_id for e in plan.engines if e.include]
+        assert rule_ids == [i.rule_id for i in plan.invariants if i.include]
+        excluded = {ex["id"] for ex in plan.exclusions}
+        assert excluded.isdisjoint(engine_ids) and excluded.isdisjoint(rule_ids)
+
     def test_load_diff_from_file(self, tmp_path: Path):
         """Test loading diff from file."""
         diff_file = tmp_path / "diff.txt"
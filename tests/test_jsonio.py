@@ -0,0 +1,120 @@
+"""Tests for the optional-orjson JSON helpers."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+from truthcore import jsonio
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test against both the orjson and stdlib code paths."""
+    if request.param and not jsonio.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(jsonio, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
+
+class TestLoads:
+    """Test JSON parsing."""
+
+    def test_loads_bytes_and_str(self, backend):
+        """Test bytes and str inputs parse identically."""
+        assert jsonio.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+        assert jsonio.loads('{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_loads_invalid_raises_value_error(self, backend):
+        """Test malformed input raises a ValueError subclass."""
+        with pytest.raises(ValueError):
+            jsonio.loads(b"not json")
+
+    def test_load_file(self, backend, tmp_path: Path):
+        """Test loading a JSON file."""
+        path = tmp_path / "data.json"
+        path.write_text('{"key": "välue"}', encoding="utf-8")
+        assert jsonio.load_file(path) == {"key": "välue"}
+
+    def test_load_mapped(self, backend, tmp_path: Path):
+        """Test memory-mapped loading matches load_file and rejects empty files."""
+        path = tmp_path / "data.json"
+        path.write_text('{"rules": [{"id": "r1"}], "name": "välue"}', encoding="utf-8")
+        assert jsonio.load_mapped(path) == jsonio.load_file(path)
+
+        empty = tmp_path / "empty.json"
+        empty.write_bytes(b"")
+        with pytest.raises(ValueError):
+            jsonio.load_mapped(empty)
+
+    @pytest.mark.parametrize("stream", [False, True], ids=["whole", "streamed"])
+    def test_load_fields(self, backend, stream, tmp_path: Path, monkeypatch):
+        """Test only the requested top-level keys are returned, streamed or not."""
+        if stream:
+            if not jsonio.IJSON_AVAILABLE:
+                pytest.skip("ijson not installed")
+            monkeypatch.setattr(jsonio, "STREAM_PARSE_THRESHOLD", 0)
+        path = tmp_path / "report.json"
+        path.write_text(
+            '{"passed": false, "findings": [{"id": 1}, {"id": 2}], '
+            '"summary": {"total": 2, "by": {"high": [1.5, null]}}, "note": "välue"}',
+            encoding="utf-8",
+        )
+        data = jsonio.load_fields(path, ("passed", "summary", "missing"))
+        assert data == {
+            "passed": False,
+            "summary": {"total": 2, "by": {"high": [1.5, None]}},
+        }
+        assert type(data["summary"]["total"]) is int
+        assert type(data["summary"]["by"]["high"][0]) is float
+
+        array = tmp_path / "array.json"
+        array.write_text("[1, 2]")
+        assert jsonio.load_fields(array, ("passed",)) == [1, 2]
+
+        broken = tmp_path / "broken.json"
+        broken.write_text('{"passed": tru')
+        with pytest.raises(ValueError):
+            jsonio.load_fields(broken, ("passed",))
+
+
+class TestDumps:
+    """Test JSON serialization."""
+
+    def test_dumps_indented_layout(self, backend):
+        """Test both backends produce the same indented UTF-8 layout."""
+        data = {"b": {"c": "é"}, "a": [1, None, True], "e": []}
+        expected = '{\n  "b": {\n    "c": "é"\n  },\n  "a": [\n    1,\n    null,\n    true\n  ],\n  "e": []\n}'
+        assert jsonio.dumps(data) == expected.encode("utf-8")
+
+    def test_dumps_compact_sorted(self, backend):
+        """Test compact output with sorted keys."""
+        assert jsonio.dumps({"b": 1, "a": {"d": 2, "c": 3}}, indent=False, sort_keys=True) == (
+            b'{"a":{"c":3,"d":2},"b":1}'
+        )
+
+    def test_dump_file_round_trip(self, backend, tmp_path: Path):
+        """Test dump_file writes exactly the dumps() bytes."""
+        data = {"z": 1, "a": ["x"]}
+        path = tmp_path / "out.json"
+        jsonio.dump_file(path, data)
+        assert path.read_bytes() == jsonio.dumps(data)
+        assert jsonio.load_file(path) == data
+
+    @pytest.mark.parametrize("items", [[], [{"b": 1, "a": [2]}, "x"]], ids=["empty", "items"])
+    def test_write_array_matches_nested_dumps(self, backend, items):
+        """Test a streamed nested array matches dumping the whole document."""
+        buf = io.BytesIO()
+        buf.write(b'{\n  "items": ')
+        jsonio.write_array(buf, iter(items), level=1, sort_keys=True)
+        buf.write(b"\n}")
+        assert buf.getvalue() == jsonio.dumps({"items": items}, sort_keys=True)
+
+    def test_dump_files_writes_each_document(self, backend, tmp_path: Path):
+        """Test dump_files writes every document and truncates existing files."""
+        (tmp_path / "a.json").write_text('{"stale": "content that is longer"}')
+        jsonio.dump_files(tmp_path, {"a.json": {"a": 1}, "b.json": [1, 2]})
+        assert (tmp_path / "a.json").read_bytes() == jsonio.dumps({"a": 1})
+        assert jsonio.load_file(tmp_path / "b.json") == [1, 2]
@@ -123,6 +123,25 @@ class TestPolicyPack:
         assert rule.id == "RULE_1"
         assert pack.get_rule("NONEXISTENT") is None
 
+    def test_get_rule_sees_rule_list_changes(self):
+        """Test lookups reflect rules appended or replaced in place after a lookup."""
+        def make_rule(rule_id: str, description: str) -> PolicyRule:
+            return PolicyRule(
+                id=rule_id, description=description, severity=Severity.LOW, category="c", target="files"
+            )
+
+        pack = PolicyPack(name="test", description="d", version="1.0.0", rules=[make_rule("A", "first")])
+        assert pack.get_rule("B") is None
+
+        pack.rules.append(make_rule("B", "b"))
+        pack.rules.append(make_rule("A", "duplicate"))
+        assert pack.get_rule("B").description == "b"
+        assert pack.get_rule("A").description == "first"
+
+        pack.rules[1] = make_rule("C", "replaced")
+        assert pack.get_rule("B") is None
+        assert pack.get_rule("C").description == "replaced"
+
 
 class TestPolicyValidator:
     """Test the PolicyValidator."""
@@ -289,6 +308,17 @@ class TestPolicyPackLoader:
         except FileNotFoundError:
             pytest.skip("Built-in packs not installed")
 
+    def test_load_pack_cached_until_file_changes(self, tmp_path: Path):
+        """Test a pack is parsed once per file version."""
+        pack_path = tmp_path / "pack.yaml"
+        pack_path.write_text("name: custom\ndescription: d\nversion: '1.0'\nrules: []\n")
+
+        first = PolicyPackLoader.load_pack(str(pack_path))
+        assert PolicyPackLoader.load_pack(str(pack_path)) is first
+
+        pack_path.write_text("name: custom-edited\ndescription: d\nversion: '1.0'\nrules: []\n")
+        assert PolicyPackLoader.load_pack(str(pack_path)).name == "custom-edited"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
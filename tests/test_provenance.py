@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 from importlib.util import find_spec
 from pathlib import Path
 
@@ -9,7 +10,13 @@ import pytest
 
 from truthcore.provenance.manifest import EvidenceManifest, ManifestEntry
 from truthcore.provenance.signing import Signature, Signer, SigningError
-from truthcore.provenance.verifier import BundleVerifier, VerificationResult
+from truthcore.provenance.verifier import (
+    MMAP_HASH_THRESHOLD,
+    PARALLEL_HASH_MIN_FILES,
+    BundleVerifier,
+    VerificationResult,
+    hash_file,
+)
 from truthcore.security import SecurityError, SecurityLimits
 
 # Check if cryptography is available for signature tests
@@ -41,6 +48,7 @@ class TestManifestEntry:
         assert entry.path == "test.txt"
         assert entry.size == 13
         assert len(entry.sha256) == 64  # SHA-256 hex
+        assert entry.sha256 == hashlib.sha256(b"Hello, World!").hexdigest()
 
 
 class TestEvidenceManifest:
@@ -179,6 +187,21 @@ class TestSigner:
         is_valid = signer.verify(b"different message", signature)
         assert is_valid is False
 
+    @pytest.mark.skipif(not HAS_CRYPTOGRAPHY, reason="cryptography library not installed")
+    def test_verify_reuses_decoded_public_key(self):
+        """Test repeated verification with one key decodes it only once."""
+        from truthcore.provenance.signing import _ed25519_public_key
+
+        private_key, public_key = Signer.generate_keys()
+        signer = Signer(private_key=private_key, public_key=public_key)
+        messages = [b"first", b"second", b"third"]
+        signatures = [signer.sign(message) for message in messages]
+
+        _ed25519_public_key.cache_clear()
+        assert all(signer.verify(m, sig) for m, sig in zip(messages, signatures, strict=True))
+        assert _ed25519_public_key.cache_info().misses == 1
+        assert signer.verify(b"other", signatures[0]) is False
+
     def test_signature_roundtrip_bytes(self):
         """Test signature serialization."""
         private_key, public_key = Signer.generate_keys()
@@ -203,6 +226,14 @@ class TestSigner:
 class TestBundleVerifier:
     """Test the BundleVerifier."""
 
+    @pytest.mark.parametrize("size", [0, 100, MMAP_HASH_THRESHOLD, (1 << 20) + 7])
+    def test_hash_file_matches_sha256(self, tmp_path: Path, size: int):
+        """Test both the buffered and memory-mapped paths produce plain SHA-256."""
+        path = tmp_path / "blob.bin"
+        data = bytes(i % 251 for i in range(size))
+        path.write_bytes(data)
+        assert hash_file(path) == hashlib.sha256(data).hexdigest()
+
     def test_verify_valid_bundle(self, tmp_path: Path):
         """Test verifying a valid bundle."""
         # Create bundle
@@ -251,6 +282,43 @@ class TestBundleVerifier:
         assert result.valid is False
         assert len(result.files_tampered) == 1
 
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_verify_many_files(self, tmp_path: Path, max_workers: int):
+        """Test serial and parallel hashing report the same problems."""
+        bundle_dir = tmp_path / "bundle"
+        (bundle_dir / "sub").mkdir(parents=True)
+        for i in range(PARALLEL_HASH_MIN_FILES * 2):
+            (bundle_dir / "sub" / f"f{i}.txt").write_text(f"content {i}")
+        manifest = EvidenceManifest.generate(bundle_dir)
+        manifest.write_json(bundle_dir / "evidence.manifest.json")
+
+        (bundle_dir / "sub" / "f3.txt").write_text("tampered")
+        (bundle_dir / "sub" / "f5.txt").unlink()
+
+        result = BundleVerifier(max_workers=max_workers).verify(bundle_dir)
+
+        assert result.valid is False
+        assert result.files_checked == PARALLEL_HASH_MIN_FILES * 2
+        assert result.files_valid == PARALLEL_HASH_MIN_FILES * 2 - 2
+        assert [item["path"] for item in result.files_tampered] == ["sub/f3.txt"]
+        assert result.files_missing == ["sub/f5.txt"]
+
+    def test_repeat_verify_detects_same_size_tampering(self, tmp_path: Path):
+        """Test a same-size edit is caught even when the file's mtime is restored."""
+        import os
+
+        bundle_dir = tmp_path / "bundle"
+        bundle_dir.mkdir()
+        data_file = bundle_dir / "data.json"
+        data_file.write_text('{"key": "value"}')
+        EvidenceManifest.generate(bundle_dir).write_json(bundle_dir / "evidence.manifest.json")
+        assert BundleVerifier().verify(bundle_dir).valid is True
+
+        st = data_file.stat()
+        data_file.write_text('{"key": "VALUE"}')
+        os.utime(data_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert BundleVerifier().verify(bundle_dir).valid is False
+
     def test_detect_missing_files(self, tmp_path: Path):
         """Test detecting missing files."""
         # Create bundle
@@ -97,6 +97,12 @@ class TestBundleExporter:
             assert (bundle_dir / "outputs" / "readiness.json").exists()
             assert (bundle_dir / "outputs" / "verdict.json").exists()
 
+            # Counts agree with the file listings
+            assert bundle.input_count == len(bundle.get_input_files()) == 1
+            assert bundle.config_count == len(bundle.get_config_files())
+            assert bundle.output_count == len(bundle.get_output_files())
+            assert bundle.to_dict()["output_count"] == bundle.output_count
+
     def test_load_bundle(self):
         """Test loading a replay bundle."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -226,6 +226,21 @@ class TestTruthGraph:
         assert len(results) == 1
         assert results[0].properties["severity"] == "high"
 
+    def test_compile_predicate(self):
+        """Test compiled predicates match the same nodes as query_simple."""
+        graph = TruthGraph()
+        graph.add_run("run-123", "judge", {})
+        graph.add_engine("readiness", "run-123", "readiness")
+        graph.add_finding("finding-1", "readiness", "run-123", Severity.CRITICAL, "Critical")
+        graph.add_finding("finding-2", "readiness", "run-123", Severity.INFO, "Info")
+
+        for predicate in ["severity>=high", "message=contains:Crit", "command=judge", "severity>=bogus", "nothing"]:
+            matches = TruthGraph.compile_predicate(predicate)
+            assert [n for n in graph.nodes.values() if matches(n)] == graph.query_simple(predicate)
+
+        assert len(graph.query_simple("severity>=high")) == 1
+        assert graph.query_simple("severity>=bogus") == []
+
     def test_get_connected(self):
         """Test getting connected nodes."""
         graph = TruthGraph()
@@ -249,6 +264,15 @@ class TestTruthGraph:
         assert "stats" in data
         assert data["stats"]["node_count"] == 1
 
+    def test_stats(self):
+        """Test stats match the serialized graph counts."""
+        graph = TruthGraph()
+        graph.add_run("run-123", "judge", {})
+        graph.add_engine("readiness", "run-123", "readiness")
+
+        assert graph.stats() == {"node_count": 2, "edge_count": 1}
+        assert graph.stats() == graph.to_dict()["stats"]
+
     def test_to_json(self, tmp_path: Path):
         """Test exporting to JSON."""
         graph = TruthGraph()
@@ -265,6 +289,19 @@ class TestTruthGraph:
         assert data["version"] == "1.0.0"
         assert len(data["nodes"]) == 1
 
+    def test_to_json_matches_to_dict(self, tmp_path: Path):
+        """Test the streamed JSON is the sorted, indented dump of to_dict()."""
+        graph = TruthGraph(metadata={"source": "test"})
+        graph.add_run("run-123", "judge", {"profile": "test"})
+        graph.add_engine("readiness", "run-123", "readiness")
+        graph.add_finding("finding-1", "readiness", "run-123", Severity.HIGH, "Test")
+
+        output_path = tmp_path / "truth_graph.json"
+        graph.to_json(output_path)
+
+        expected = json.dumps(graph.to_dict(), indent=2, sort_keys=True, ensure_ascii=False)
+        assert output_path.read_text(encoding="utf-8") == expected
+
     def test_from_dict(self):
         """Test loading from dictionary."""
         data = {
@@ -4,7 +4,7 @@ import json
 
 import pytest
 
-from truthcore.cache import ContentAddressedCache
+from truthcore.cache import ContentAddressedCache, clone_tree
 from truthcore.manifest import (
     RunManifest,
     hash_content,
@@ -54,6 +54,15 @@ class TestManifest:
         assert manifest.timestamp.endswith("Z")
         assert manifest.run_id is not None
 
+    def test_compute_cache_key_memoized(self):
+        """Test the cache key is reused until a keyed field changes."""
+        manifest = RunManifest.create(command="test", config={"profile": "test"})
+        key = manifest.compute_cache_key()
+        assert manifest.compute_cache_key() == key
+
+        manifest.config_hash = hash_dict({"profile": "other"})
+        assert manifest.compute_cache_key() != key
+
 
 class TestCache:
     """Tests for content-addressed cache."""
@@ -82,6 +91,25 @@ class TestCache:
         cache = ContentAddressedCache(tmp_path / "cache")
         assert cache.get("nonexistent_key") is None
 
+    def test_clone_tree_restores_without_sharing_writes(self, tmp_path):
+        """Test clone_tree restores nested files independently of the cache entry."""
+        src = tmp_path / "cached"
+        (src / "sub").mkdir(parents=True)
+        (src / "a.json").write_text('{"a": 1}')
+        (src / "sub" / "b.json").write_text('{"b": 2}')
+
+        dst = tmp_path / "out"
+        dst.mkdir()
+        (dst / "a.json").write_text("stale")
+        clone_tree(src, dst)
+
+        assert (dst / "a.json").read_text() == '{"a": 1}'
+        assert (dst / "sub" / "b.json").read_text() == '{"b": 2}'
+
+        # Rewriting a restored file in place must not touch the cache entry
+        (dst / "a.json").write_text("changed")
+        assert (src / "a.json").read_text() == '{"a": 1}'
+
     def test_cache_stats(self, tmp_path):
         """Test cache statistics."""
         cache = ContentAddressedCache(tmp_path / "cache")